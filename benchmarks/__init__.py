@@ -0,0 +1,4 @@
+"""Offline benchmark suite for the package hot paths.
+
+Run with ``python -m benchmarks``; see ``python -m benchmarks --help``.
+"""
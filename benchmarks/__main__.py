@@ -0,0 +1,62 @@
+"""CLI: run the benchmark suite, save JSON, fail on regressions vs a baseline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from .cases import all_cases
+from .harness import compare, format_results, load_baseline, run_all, save
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-o", "--output", default="bench_results.json", help="where to write results JSON")
+    parser.add_argument("-b", "--baseline", default=str(DEFAULT_BASELINE), help="baseline results JSON")
+    parser.add_argument("-t", "--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 == 25%%")
+    parser.add_argument(
+        "--thresholds",
+        default=None,
+        help='JSON file of per-benchmark allowed slowdowns, e.g. {"bybit.get_positions": 0.5}',
+    )
+    parser.add_argument("-k", "--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--rounds", type=int, default=7)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply per-round operation counts")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to the baseline path")
+    args = parser.parse_args(argv)
+
+    overrides: dict[str, float] = {}
+    if args.thresholds:
+        overrides = {name: float(v) for name, v in json.loads(Path(args.thresholds).read_text()).items()}
+
+    with ExitStack() as resources:
+        results = run_all(all_cases(resources, args.scale), rounds=args.rounds, pattern=args.filter)
+    save(results, args.output)
+
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path) if baseline_path.exists() else {}
+    print(format_results(results, baseline))
+
+    if args.save_baseline:
+        save(results, baseline_path)
+        print(f"baseline written to {baseline_path}")
+        return 0
+
+    if not baseline:
+        # A missing baseline must not pass silently, or the regression gate never fires.
+        print(f"no baseline at {baseline_path}; run with --save-baseline to create one")
+        return 2
+
+    regressions = compare(results, baseline, args.threshold, overrides)
+    for reg in regressions:
+        print(f"REGRESSION {reg.name}: {reg.baseline_ns:.1f} -> {reg.current_ns:.1f} ns/op ({reg.ratio:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""Benchmark cases for the package hot paths.
+
+Everything runs offline: the Bybit REST session is replaced by a stub that
+serves recorded responses from ``data/bybit_rest_responses.json`` and the
+WebSocket handler is fed frames recorded in ``data/bybit_ws_tickers.jsonl``.
+Cases that need temp directories or writer threads register their cleanup
+on the ``resources`` ExitStack; close it once the benchmarks have run.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+from exchange.bybit import BybitAdapter, bybit_scheduler
+from exchange.cache import SnapshotCache
+from exchange.ws import BybitWebSocket
+from risk_engine.core import AccountState, RiskEngine, RiskEngineConfig
+from risk_engine.execution import ExecutionWrapper, ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.journal import Journal
+from risk_engine.journal_writer import JournalWriter
+
+from .harness import Benchmark
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+class StubResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.status_code = 200
+        self.headers: dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class StubSession:
+    """Stands in for requests.Session, answering by endpoint path."""
+
+    def __init__(self, responses: dict[str, Any]) -> None:
+        self._responses = {path: json.dumps(body) for path, body in responses.items()}
+
+    def _lookup(self, url: str) -> StubResponse:
+        for path, text in self._responses.items():
+            if url.endswith(path):
+                return StubResponse(text)
+        return StubResponse('{"retCode":0,"retMsg":"OK","result":{}}')
+
+    def get(self, url: str, **kwargs: Any) -> StubResponse:
+        return self._lookup(url)
+
+    def post(self, url: str, **kwargs: Any) -> StubResponse:
+        return self._lookup(url)
+
+
+def load_rest_responses() -> dict[str, Any]:
+    return json.loads((DATA_DIR / "bybit_rest_responses.json").read_text(encoding="utf-8"))
+
+
+def load_ws_frames() -> list[dict[str, Any]]:
+    with (DATA_DIR / "bybit_ws_tickers.jsonl").open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def drive(coro: Any) -> Any:
+    """Run a coroutine that never actually suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended; drive() only supports non-blocking coroutines")
+
+
+def _engine() -> RiskEngine:
+    return RiskEngine(
+        RiskEngineConfig(
+            risk_percent=0.0025,
+            daily_loss_cap_percent=0.01,
+            max_consecutive_losses=3,
+            max_open_risk_percent=0.0075,
+            max_leverage=3.0,
+        )
+    )
+
+
+def _loop(fn: Any, n: int) -> Any:
+    def run() -> None:
+        for _ in range(n):
+            fn()
+
+    return run
+
+
+def risk_cases(scale: float = 1.0) -> list[Benchmark]:
+    n = max(1, int(20_000 * scale))
+    guard = PreTradeGuard(_engine())
+    state = AccountState(start_of_day_equity=1000, realized_pnl_today=0)
+    ok = TradeIntent("BTCUSDT", "long", 100.0, 99.0, 2.0)
+    bad = TradeIntent("BTCUSDT", "long", 100.0, 99.0, 10.0)
+    exposure = ExposureState()
+
+    return [
+        Benchmark("guard.evaluate.allowed", _loop(lambda: guard.evaluate(state, ok, exposure), n), ops=n),
+        Benchmark("guard.evaluate.rejected", _loop(lambda: guard.evaluate(state, bad, exposure), n), ops=n),
+    ]
+
+
+def execution_cases(resources: ExitStack, scale: float = 1.0) -> list[Benchmark]:
+    n = max(1, int(5_000 * scale))
+    tmp = resources.enter_context(tempfile.TemporaryDirectory(prefix="bangify-bench-"))
+    journal = Journal(log_dir=tmp)
+    plain = ExecutionWrapper(PreTradeGuard(_engine()))
+    timed = ExecutionWrapper(PreTradeGuard(_engine()), timing=True)
+    journaled = ExecutionWrapper(PreTradeGuard(_engine()), journal=journal)
+    state = AccountState(start_of_day_equity=1000, realized_pnl_today=0)
+    intent = TradeIntent("BTCUSDT", "long", 100.0, 99.0, 2.0)
+    exposure = ExposureState()
+    _, draft = plain.draft_order(state, intent, exposure)
+
+    return [
+        Benchmark("wrapper.draft_order", _loop(lambda: plain.draft_order(state, intent, exposure), n), ops=n),
+        Benchmark("wrapper.draft_order.timed", _loop(lambda: timed.draft_order(state, intent, exposure), n), ops=n),
+        Benchmark(
+            "wrapper.draft_order.journal",
+            _loop(lambda: journaled.draft_order(state, intent, exposure), n),
+            ops=n,
+            prepare=journal._buffer.clear,
+        ),
+        Benchmark("wrapper.confirm_order", _loop(lambda: plain.confirm_order(draft, "CONFIRM"), n), ops=n),
+    ]
+
+
+def journal_cases(resources: ExitStack, scale: float = 1.0) -> list[Benchmark]:
+    n = max(1, int(5_000 * scale))
+    tmp = Path(resources.enter_context(tempfile.TemporaryDirectory(prefix="bangify-bench-")))
+    journal = Journal(log_dir=str(tmp))
+    intent = TradeIntent("BTCUSDT", "long", 100.0, 99.0, 2.0)
+    wrapper = ExecutionWrapper(PreTradeGuard(_engine()))
+    decision, draft = wrapper.draft_order(AccountState(1000, 0), intent, ExposureState())
+    confirmed = wrapper.confirm_order(draft, "CONFIRM")
+    exposure = ExposureState()
+
+    def refill() -> None:
+        journal._buffer.clear()
+        (tmp / "bench.jsonl").unlink(missing_ok=True)
+        for _ in range(n):
+            journal.record_decision(decision, intent, exposure)
+
+    background = Journal(log_dir=str(tmp), writer=JournalWriter(tmp / "background.jsonl", queue_size=4 * n))
+    resources.callback(background.close)  # runs before the directory is removed
+
+    clear = journal._buffer.clear
+    return [
+        Benchmark("journal.record", _loop(lambda: journal.record("custom", {"k": 1}), n), ops=n, prepare=clear),
+        Benchmark(
+            "journal.record_decision.background",
+            _loop(lambda: background.record_decision(decision, intent, exposure), n),
+            ops=n,
+            prepare=background.flush_to_file,
+        ),
+        Benchmark(
+            "journal.record_decision",
+            _loop(lambda: journal.record_decision(decision, intent, exposure), n),
+            ops=n,
+            prepare=clear,
+        ),
+        Benchmark("journal.record_draft", _loop(lambda: journal.record_draft(draft, decision), n), ops=n, prepare=clear),
+        Benchmark(
+            "journal.record_confirmation",
+            _loop(lambda: journal.record_confirmation(confirmed), n),
+            ops=n,
+            prepare=clear,
+        ),
+        Benchmark("journal.flush_to_file", lambda: journal.flush_to_file("bench.jsonl"), ops=n, prepare=refill),
+    ]
+
+
+def exchange_cases(scale: float = 1.0) -> list[Benchmark]:
+    n = max(1, int(5_000 * scale))
+    # Unbounded buckets and no caching: measure adapter overhead, not the
+    # rate limiter's sleeping or snapshot cache hits.
+    scheduler = bybit_scheduler(limits={}, default_limit=1e12)
+    adapter = BybitAdapter(
+        api_key="bench_key",
+        api_secret="bench_secret",
+        testnet=True,
+        scheduler=scheduler,
+        cache=SnapshotCache(0.0, 0.0, 0.0),
+    )
+    adapter.session = StubSession(load_rest_responses())
+    params = {"category": "linear", "symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "qty": "0.01"}
+    m = max(1, n // 10)
+
+    return [
+        Benchmark("bybit._sign", _loop(lambda: adapter._sign(params, 1760000000000), n), ops=n),
+        Benchmark("bybit._headers", _loop(lambda: adapter._headers(params), n), ops=n),
+        Benchmark("bybit.get_positions", _loop(adapter.get_positions, m), ops=m),
+        Benchmark("bybit.get_order", _loop(lambda: adapter.get_order("BTCUSDT", "x"), m), ops=m),
+    ]
+
+
+def websocket_cases(scale: float = 1.0) -> list[Benchmark]:
+    frames = load_ws_frames()
+    received: list[Any] = []
+    ws = BybitWebSocket(testnet=True, on_ticker=received.append)
+    repeats = max(1, int(100 * scale))
+
+    def run() -> None:
+        for _ in range(repeats):
+            for frame in frames:
+                drive(ws._handle_message(frame))
+
+    return [
+        Benchmark("ws._handle_message", run, ops=repeats * len(frames), prepare=received.clear),
+    ]
+
+
+def all_cases(resources: ExitStack, scale: float = 1.0) -> list[Benchmark]:
+    return (
+        risk_cases(scale)
+        + execution_cases(resources, scale)
+        + journal_cases(resources, scale)
+        + exchange_cases(scale)
+        + websocket_cases(scale)
+    )
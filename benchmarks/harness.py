@@ -0,0 +1,130 @@
+"""Minimal timing harness with JSON results and baseline comparison."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """``run`` performs ``ops`` operations; ``prepare`` runs untimed before each round."""
+
+    name: str
+    run: Callable[[], Any]
+    ops: int = 1
+    prepare: Callable[[], Any] | None = None
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    ops: int
+    rounds: int
+    ns_per_op: float  # median over rounds
+    min_ns_per_op: float
+    stdev_ns_per_op: float
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+def measure(bench: Benchmark, rounds: int = 7, warmup: int = 1) -> BenchResult:
+    for _ in range(warmup):
+        if bench.prepare:
+            bench.prepare()
+        bench.run()
+
+    samples: list[float] = []
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        if bench.prepare:
+            bench.prepare()
+        t0 = clock()
+        bench.run()
+        samples.append((clock() - t0) / bench.ops)
+
+    return BenchResult(
+        name=bench.name,
+        ops=bench.ops,
+        rounds=rounds,
+        ns_per_op=statistics.median(samples),
+        min_ns_per_op=min(samples),
+        stdev_ns_per_op=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def run_all(benchmarks: list[Benchmark], rounds: int = 7, pattern: str | None = None) -> list[BenchResult]:
+    return [measure(b, rounds=rounds) for b in benchmarks if not pattern or pattern in b.name]
+
+
+def to_json(results: list[BenchResult]) -> dict[str, Any]:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def save(results: list[BenchResult], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_json(results), indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(path: str | Path) -> dict[str, float]:
+    """Map of benchmark name -> baseline median ns/op."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {name: float(r["ns_per_op"]) for name, r in data.get("results", {}).items()}
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, float],
+    threshold: float,
+    overrides: dict[str, float] | None = None,
+) -> list[Regression]:
+    """Results slower than baseline by more than ``threshold`` (0.25 == 25%).
+
+    Benchmarks missing from the baseline are not compared.
+    """
+    overrides = overrides or {}
+    regressions: list[Regression] = []
+    for r in results:
+        base = baseline.get(r.name)
+        if not base:
+            continue
+        if r.ns_per_op > base * (1.0 + overrides.get(r.name, threshold)):
+            regressions.append(Regression(r.name, base, r.ns_per_op))
+    return regressions
+
+
+def format_results(results: list[BenchResult], baseline: dict[str, float] | None = None) -> str:
+    baseline = baseline or {}
+    width = max((len(r.name) for r in results), default=4)
+    lines = [f"{'name':<{width}}  {'ns/op':>12}  {'min':>12}  {'vs base':>8}"]
+    for r in results:
+        base = baseline.get(r.name)
+        delta = f"{(r.ns_per_op / base - 1) * 100:+7.1f}%" if base else "       -"
+        lines.append(f"{r.name:<{width}}  {r.ns_per_op:12.1f}  {r.min_ns_per_op:12.1f}  {delta}")
+    return "\n".join(lines)
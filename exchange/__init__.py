@@ -1,9 +1,14 @@
 """Exchange adapters package."""
 from .base import (
     AccountInfo,
+    AsyncExchangeAdapter,
     Balance,
+    BatchResult,
     ExchangeAdapter,
+    Execution,
     Order,
+    OrderAmend,
+    OrderRequest,
     OrderSide,
     OrderStatus,
     OrderType,
@@ -11,16 +16,29 @@ from .base import (
     Ticker,
 )
 from .bybit import BybitAdapter
+from .bybit_async import AsyncBybitAdapter
+from .cache import SnapshotCache
+from .ratelimit import RequestScheduler, RetryableError, TokenBucket
 
 __all__ = [
     "AccountInfo",
+    "AsyncExchangeAdapter",
     "Balance",
+    "BatchResult",
     "ExchangeAdapter",
+    "Execution",
     "Order",
+    "OrderAmend",
+    "OrderRequest",
     "OrderSide",
     "OrderStatus",
     "OrderType",
     "Position",
     "Ticker",
     "BybitAdapter",
+    "AsyncBybitAdapter",
+    "SnapshotCache",
+    "RequestScheduler",
+    "RetryableError",
+    "TokenBucket",
 ]
@@ -1,7 +1,8 @@
 """Base types for exchange adapters."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -54,6 +55,19 @@ class Order:
     created_at: str
 
 
+@dataclass(frozen=True)
+class Execution:
+    exec_id: str
+    order_id: str
+    symbol: str
+    side: str
+    price: float
+    qty: float
+    fee: float
+    is_maker: bool
+    timestamp: str
+
+
 @dataclass(frozen=True)
 class Ticker:
     symbol: str
@@ -71,8 +85,47 @@ class AccountInfo:
     balances: list[Balance]
 
 
+@dataclass(frozen=True)
+class OrderRequest:
+    symbol: str
+    side: OrderSide
+    order_type: OrderType
+    qty: float
+    price: float | None = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
+    leverage: float | None = None
+    client_order_id: str | None = None
+    params: dict[str, Any] = field(default_factory=dict)  # exchange-specific extras
+
+
+@dataclass(frozen=True)
+class OrderAmend:
+    symbol: str
+    order_id: str
+    qty: float | None = None
+    price: float | None = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one order in a batch call, in the same position as its request."""
+
+    ok: bool
+    symbol: str
+    order_id: str | None
+    client_order_id: str | None = None
+    error: str | None = None
+
+
 class ExchangeAdapter:
-    """Abstract base for exchange adapters."""
+    """Abstract base for exchange adapters.
+
+    The batch methods default to one single-order call per item; adapters
+    with native batch endpoints override them.
+    """
 
     def get_account_info(self) -> AccountInfo:
         raise NotImplementedError
@@ -80,12 +133,37 @@ class ExchangeAdapter:
     def get_positions(self, symbol: str | None = None) -> list[Position]:
         raise NotImplementedError
 
+    def iter_positions(self, symbol: str | None = None) -> Iterator[Position]:
+        yield from self.get_positions(symbol)
+
+    def iter_order_history(
+        self, symbol: str | None = None, start_time: int | None = None, end_time: int | None = None
+    ) -> Iterator[Order]:
+        raise NotImplementedError
+
+    def iter_executions(
+        self, symbol: str | None = None, start_time: int | None = None, end_time: int | None = None
+    ) -> Iterator[Execution]:
+        raise NotImplementedError
+
     def get_balance(self, coin: str) -> Balance | None:
         raise NotImplementedError
 
     def get_ticker(self, symbol: str) -> Ticker:
         raise NotImplementedError
 
+    def get_tickers(self, symbols: list[str] | None = None) -> dict[str, Ticker]:
+        """Tickers by symbol; all listed symbols when ``symbols`` is None. Unknown symbols are omitted."""
+        if symbols is None:
+            raise NotImplementedError
+        tickers: dict[str, Ticker] = {}
+        for symbol in symbols:
+            try:
+                tickers[symbol] = self.get_ticker(symbol)
+            except ValueError:
+                continue
+        return tickers
+
     def place_order(
         self,
         symbol: str,
@@ -108,3 +186,97 @@ class ExchangeAdapter:
 
     def set_leverage(self, symbol: str, leverage: float) -> bool:
         raise NotImplementedError
+
+    def place_orders(self, orders: list[OrderRequest]) -> list[BatchResult]:
+        """Place each order with place_order().
+
+        place_order() has no client order id parameter, so this fallback
+        drops ``OrderRequest.client_order_id`` (pass the exchange's native
+        field in ``params`` instead) and reports ``client_order_id=None``.
+        """
+        results: list[BatchResult] = []
+        for o in orders:
+            try:
+                order = self.place_order(
+                    o.symbol, o.side, o.order_type, o.qty, o.price, o.stop_loss, o.take_profit, o.leverage, **o.params
+                )
+            except (RuntimeError, ValueError) as exc:
+                results.append(BatchResult(False, o.symbol, None, None, str(exc)))
+            else:
+                results.append(BatchResult(True, o.symbol, order.order_id, None))
+        return results
+
+    def cancel_orders(self, orders: list[tuple[str, str]]) -> list[BatchResult]:
+        """Cancel ``(symbol, order_id)`` pairs."""
+        results: list[BatchResult] = []
+        for symbol, order_id in orders:
+            try:
+                self.cancel_order(symbol, order_id)
+            except (RuntimeError, ValueError) as exc:
+                results.append(BatchResult(False, symbol, order_id, error=str(exc)))
+            else:
+                results.append(BatchResult(True, symbol, order_id))
+        return results
+
+    def amend_orders(self, amends: list[OrderAmend]) -> list[BatchResult]:
+        raise NotImplementedError
+
+
+class AsyncExchangeAdapter:
+    """Abstract base for asyncio exchange adapters; same methods as ExchangeAdapter."""
+
+    async def get_account_info(self) -> AccountInfo:
+        raise NotImplementedError
+
+    async def get_positions(self, symbol: str | None = None) -> list[Position]:
+        raise NotImplementedError
+
+    async def get_balance(self, coin: str) -> Balance | None:
+        raise NotImplementedError
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        raise NotImplementedError
+
+    async def get_tickers(self, symbols: list[str] | None = None) -> dict[str, Ticker]:
+        raise NotImplementedError
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        qty: float,
+        price: float | None = None,
+        stop_loss: float | None = None,
+        take_profit: float | None = None,
+        leverage: float | None = None,
+        **kwargs: Any,
+    ) -> Order:
+        raise NotImplementedError
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        raise NotImplementedError
+
+    async def get_order(self, symbol: str, order_id: str) -> Order:
+        raise NotImplementedError
+
+    async def set_leverage(self, symbol: str, leverage: float) -> bool:
+        raise NotImplementedError
+
+    async def place_orders(self, orders: list[OrderRequest]) -> list[BatchResult]:
+        raise NotImplementedError
+
+    async def cancel_orders(self, orders: list[tuple[str, str]]) -> list[BatchResult]:
+        raise NotImplementedError
+
+    async def amend_orders(self, amends: list[OrderAmend]) -> list[BatchResult]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release network resources (sessions, connections)."""
+
+    async def __aenter__(self) -> AsyncExchangeAdapter:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
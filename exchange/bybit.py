@@ -4,6 +4,8 @@ from __future__ import annotations
 import hashlib
 import hmac
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -11,36 +13,31 @@ import requests
 from .base import (
     AccountInfo,
     Balance,
+    BatchResult,
     ExchangeAdapter,
+    Execution,
     Order,
+    OrderAmend,
+    OrderRequest,
     OrderSide,
     OrderStatus,
     OrderType,
     Position,
     Ticker,
 )
+from .cache import SnapshotCache
+from .ratelimit import NORMAL, URGENT, LimitStatus, RequestScheduler, RetryableError
 
 
-class BybitAdapter(ExchangeAdapter):
-    """Bybit V5 REST API adapter for USDT perpetual futures."""
+class BybitSigner:
+    """Bybit V5 request signing, shared by the sync and async adapters."""
 
     BASE_URL = "https://api.bybit.com"
     TESTNET_URL = "https://api-testnet.bybit.com"
 
-    def __init__(
-        self,
-        api_key: str,
-        api_secret: str,
-        testnet: bool = False,
-        account_type: str = "UNIFIED",
-        recv_window: int = 5000,
-    ) -> None:
-        self.api_key = api_key
-        self.api_secret = api_secret
-        self.base_url = self.TESTNET_URL if testnet else self.BASE_URL
-        self.account_type = account_type
-        self.recv_window = recv_window
-        self.session = requests.Session()
+    api_key: str
+    api_secret: str
+    recv_window: int
 
     def _sign(self, params: dict[str, Any], timestamp: int) -> str:
         """Generate signature for Bybit V5 API."""
@@ -68,95 +65,582 @@ class BybitAdapter(ExchangeAdapter):
             "Content-Type": "application/json",
         }
 
-    def _request(self, method: str, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+
+def parse_balances(result: dict[str, Any]) -> tuple[list[Balance], float, float]:
+    """Balances plus total wallet and available balance from a wallet-balance result."""
+    balances: list[Balance] = []
+    total_equity = 0.0
+    total_available = 0.0
+
+    for coin_data in result.get("list", []):
+        for coin in coin_data.get("coin", []):
+            b = Balance(
+                coin=coin["coin"],
+                wallet_balance=float(coin.get("walletBalance", 0)),
+                available_balance=float(coin.get("availableToWithdraw", 0)),
+            )
+            balances.append(b)
+            total_equity += b.wallet_balance
+            total_available += b.available_balance
+
+    return balances, total_equity, total_available
+
+
+def parse_position(item: dict[str, Any]) -> Position:
+    return Position(
+        symbol=item["symbol"],
+        side=item["side"],
+        size=float(item.get("size", 0)),
+        entry_price=float(item.get("avgPrice", 0)),
+        unrealised_pnl=float(item.get("unrealisedPnl", 0)),
+        leverage=float(item.get("leverage", 1)),
+    )
+
+
+def parse_ticker(item: dict[str, Any]) -> Ticker:
+    return Ticker(
+        symbol=item["symbol"],
+        bid=float(item.get("bid1Price", 0)),
+        ask=float(item.get("ask1Price", 0)),
+        last=float(item.get("lastPrice", 0)),
+        timestamp=item.get("time", ""),
+    )
+
+
+def parse_execution(item: dict[str, Any]) -> Execution:
+    return Execution(
+        exec_id=item["execId"],
+        order_id=item.get("orderId", ""),
+        symbol=item["symbol"],
+        side=item["side"],
+        price=float(item.get("execPrice", 0)),
+        qty=float(item.get("execQty", 0)),
+        fee=float(item.get("execFee", 0)),
+        is_maker=bool(item.get("isMaker", False)),
+        timestamp=item.get("execTime", ""),
+    )
+
+
+def parse_tickers(items: list[dict[str, Any]], symbols: set[str] | None = None) -> dict[str, Ticker]:
+    """symbol -> Ticker for a tickers list, building objects only for ``symbols`` (all if None)."""
+    if symbols is None:
+        return {item["symbol"]: parse_ticker(item) for item in items}
+    return {item["symbol"]: parse_ticker(item) for item in items if item["symbol"] in symbols}
+
+
+def parse_order(item: dict[str, Any]) -> Order:
+    return Order(
+        order_id=item["orderId"],
+        symbol=item["symbol"],
+        side=item["side"],
+        order_type=item["orderType"],
+        price=float(item.get("price", 0)) if item.get("price") else None,
+        qty=float(item.get("qty", 0)),
+        filled_qty=float(item.get("cumExecQty", 0)),
+        status=item.get("orderStatus", OrderStatus.NEW.value),
+        created_at=item.get("createdTime", ""),
+    )
+
+
+def history_windows(start_ms: int | None, end_ms: int | None) -> list[tuple[int | None, int | None]]:
+    """Split ``[start_ms, end_ms]`` into <= 7-day windows, newest first (Bybit's own order).
+
+    Without a start the exchange's default (last 7 days up to ``end_ms``) applies.
+    """
+    if start_ms is None:
+        return [(None, end_ms)]
+    hi = end_ms if end_ms is not None else int(time.time() * 1000)
+    windows: list[tuple[int | None, int | None]] = []
+    while hi >= start_ms:
+        lo = max(start_ms, hi - HISTORY_WINDOW_MS + 1)
+        windows.append((lo, hi))
+        hi = lo - 1
+    return windows
+
+
+def order_from_request(params: dict[str, Any], order_id: str) -> Order:
+    """Order as submitted, for placements that don't wait for the exchange's copy."""
+    price = params.get("price")
+    return Order(
+        order_id=order_id,
+        symbol=params["symbol"],
+        side=params["side"],
+        order_type=params["orderType"],
+        price=float(price) if price else None,
+        qty=float(params["qty"]),
+        filled_qty=0.0,
+        status=OrderStatus.NEW.value,
+        created_at=str(int(time.time() * 1000)),
+    )
+
+
+def leverage_params(symbol: str, leverage: float) -> dict[str, Any]:
+    return {
+        "category": "linear",
+        "symbol": symbol,
+        "buyLeverage": str(leverage),
+        "sellLeverage": str(leverage),
+    }
+
+
+def leverage_ok(result: dict[str, Any]) -> bool:
+    return result.get("retMsg", "") == "OK" or "leverage not modified" in result.get("retMsg", "").lower()
+
+
+def order_params(
+    symbol: str,
+    side: OrderSide,
+    order_type: OrderType,
+    qty: float,
+    price: float | None = None,
+    stop_loss: float | None = None,
+    take_profit: float | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "category": "linear",
+        "symbol": symbol,
+        "side": side.value,
+        "orderType": order_type.value,
+        "qty": str(qty),
+    }
+    if price:
+        params["price"] = str(price)
+    if stop_loss:
+        params["stopLoss"] = str(stop_loss)
+    if take_profit:
+        params["takeProfit"] = str(take_profit)
+    params.update(kwargs)
+    return params
+
+
+# Per-UID limits for linear contracts (requests/second); market data is limited per IP.
+# "ip" is the per-IP budget (600 requests / 5 s) every request counts against.
+RATE_LIMITS: dict[str, float] = {
+    "ip": 120.0,
+    "order": 10.0,
+    "order_batch": 10.0,
+    "order_query": 50.0,
+    "position": 50.0,
+    "leverage": 10.0,
+    "account": 50.0,
+    "market": 120.0,
+}
+
+ENDPOINT_GROUPS: dict[str, str] = {
+    "/v5/order/create": "order",
+    "/v5/order/amend": "order",
+    "/v5/order/cancel": "order",
+    "/v5/order/create-batch": "order_batch",
+    "/v5/order/amend-batch": "order_batch",
+    "/v5/order/cancel-batch": "order_batch",
+    "/v5/order/realtime": "order_query",
+    "/v5/order/history": "order_query",
+    "/v5/execution/list": "order_query",
+    "/v5/position/list": "position",
+    "/v5/position/set-leverage": "leverage",
+    "/v5/account/wallet-balance": "account",
+}
+
+URGENT_ENDPOINTS = frozenset(
+    {
+        "/v5/order/create",
+        "/v5/order/amend",
+        "/v5/order/cancel",
+        "/v5/order/create-batch",
+        "/v5/order/amend-batch",
+        "/v5/order/cancel-batch",
+    }
+)
+
+# Requests after which cached wallet and positions can no longer be trusted.
+ACCOUNT_MUTATING = URGENT_ENDPOINTS | {"/v5/position/set-leverage"}
+
+# Max orders per create/amend/cancel-batch request for linear contracts.
+BATCH_LIMIT = 20
+
+# Largest page sizes Bybit accepts per endpoint.
+POSITIONS_PAGE = 200
+ORDER_HISTORY_PAGE = 50
+EXECUTIONS_PAGE = 100
+# Order history and executions only accept endTime - startTime <= 7 days.
+HISTORY_WINDOW_MS = 7 * 24 * 3_600 * 1_000
+
+# Rejected before execution: too many visits, IP rate limit.
+THROTTLED_CODES = frozenset({10006, 10018})
+# Transient: request outside recv_window (re-signed on retry), server error.
+TRANSIENT_CODES = frozenset({10002, 10016})
+
+
+def is_idempotent(endpoint: str, params: dict[str, Any] | None) -> bool:
+    """Whether resending ``params`` after an unknown outcome can't create a duplicate order.
+
+    Bybit rejects a repeated orderLinkId, so creates are only safe with one.
+    """
+    if endpoint == "/v5/order/create":
+        return bool(params and params.get("orderLinkId"))
+    if endpoint == "/v5/order/create-batch":
+        return bool(params) and all(item.get("orderLinkId") for item in params["request"])
+    return True
+
+
+def endpoint_group(endpoint: str) -> str:
+    group = ENDPOINT_GROUPS.get(endpoint)
+    if group is None:
+        group = endpoint.split("/")[2] if endpoint.count("/") >= 3 else endpoint
+    return group
+
+
+def limit_status(headers: Any) -> LimitStatus | None:
+    """Limit, remaining and reset time (unix seconds) from Bybit's X-Bapi-Limit* headers."""
+    remaining = headers.get("X-Bapi-Limit-Status")
+    if remaining is None:
+        return None
+    limit = headers.get("X-Bapi-Limit")
+    reset = headers.get("X-Bapi-Limit-Reset-Timestamp")
+    return (
+        float(limit) if limit else None,
+        float(remaining),
+        int(reset) / 1000 if reset else None,
+    )
+
+
+def batch_order_item(o: OrderRequest) -> dict[str, Any]:
+    item = order_params(o.symbol, o.side, o.order_type, o.qty, o.price, o.stop_loss, o.take_profit, **o.params)
+    del item["category"]  # set once on the batch
+    if o.client_order_id is not None:
+        item["orderLinkId"] = o.client_order_id
+    return item
+
+
+def batch_amend_item(a: OrderAmend) -> dict[str, Any]:
+    item: dict[str, Any] = {"symbol": a.symbol, "orderId": a.order_id}
+    if a.qty is not None:
+        item["qty"] = str(a.qty)
+    if a.price is not None:
+        item["price"] = str(a.price)
+    if a.stop_loss is not None:
+        item["stopLoss"] = str(a.stop_loss)
+    if a.take_profit is not None:
+        item["takeProfit"] = str(a.take_profit)
+    return item
+
+
+def chunked(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def batch_results(items: list[dict[str, Any]], data: dict[str, Any]) -> list[BatchResult]:
+    """Per-order results of a batch response, aligned with the request ``items``.
+
+    ``result.list`` holds the order ids and ``retExtInfo.list`` the per-order
+    code/msg, both in request order.
+    """
+    rows = (data.get("result") or {}).get("list") or []
+    infos = (data.get("retExtInfo") or {}).get("list") or []
+    results: list[BatchResult] = []
+    for i, item in enumerate(items):
+        row = rows[i] if i < len(rows) else {}
+        info = infos[i] if i < len(infos) else {"code": 0}
+        order_id = row.get("orderId") or item.get("orderId") or None
+        link_id = row.get("orderLinkId") or item.get("orderLinkId") or None
+        code = info.get("code", 0)
+        if code == 0:
+            results.append(BatchResult(True, item["symbol"], order_id, link_id))
+        else:
+            error = f"{code}: {info.get('msg', '')}"
+            results.append(BatchResult(False, item["symbol"], order_id, link_id, error))
+    return results
+
+
+def failed_results(items: list[dict[str, Any]], exc: Exception) -> list[BatchResult]:
+    """Every order of a batch request that failed as a whole."""
+    return [
+        BatchResult(False, item["symbol"], item.get("orderId"), item.get("orderLinkId"), str(exc))
+        for item in items
+    ]
+
+
+def check_response(data: dict[str, Any], status: LimitStatus | None = None) -> dict[str, Any]:
+    code = data.get("retCode", 0)
+    if code != 0:
+        if code in THROTTLED_CODES:
+            reset_at = status[2] if status is not None else None
+            raise RetryableError(f"Bybit API error: {data}", safe=True, retry_at=reset_at)
+        if code in TRANSIENT_CODES:
+            raise RetryableError(f"Bybit API error: {data}")
+        raise RuntimeError(f"Bybit API error: {data}")
+    return data.get("result", {})
+
+
+def bybit_scheduler(**options: Any) -> RequestScheduler:
+    """RequestScheduler preconfigured with Bybit's endpoint groups and limits."""
+    options.setdefault("limits", RATE_LIMITS)
+    options.setdefault("group_for", endpoint_group)
+    # All groups share the IP budget, so orders jump queued queries of any group.
+    options.setdefault("shared", "ip")
+    options.setdefault("reserve", 2.0)
+    options.setdefault("retry_on", (requests.ConnectionError, requests.Timeout))
+    return RequestScheduler(**options)
+
+
+class BybitAdapter(BybitSigner, ExchangeAdapter):
+    """Bybit V5 REST API adapter for USDT perpetual futures."""
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = False,
+        account_type: str = "UNIFIED",
+        recv_window: int = 5000,
+        base_url: str | None = None,
+        scheduler: RequestScheduler | None = None,
+        confirm_orders: bool = True,
+        cache: SnapshotCache | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = base_url or (self.TESTNET_URL if testnet else self.BASE_URL)
+        self.account_type = account_type
+        self.recv_window = recv_window
+        self.session = requests.Session()
+        self.scheduler = scheduler if scheduler is not None else bybit_scheduler()
+        self.confirm_orders = confirm_orders
+        self.cache = cache if cache is not None else SnapshotCache()
+        self._leverage: dict[str, float] = {}
+
+    def _send(
+        self, method: str, endpoint: str, params: dict[str, Any] | None, full: bool = False
+    ) -> tuple[dict[str, Any], LimitStatus | None]:
         url = f"{self.base_url}{endpoint}"
         headers = self._headers(params)
         if method.upper() == "GET":
             resp = self.session.get(url, headers=headers, params=params, timeout=10)
         else:
             resp = self.session.post(url, headers=headers, json=params, timeout=10)
+        status = limit_status(resp.headers)
+        if resp.status_code == 429:
+            raise RetryableError(f"Bybit HTTP 429 on {endpoint}", safe=True, retry_at=status[2] if status else None)
+        if resp.status_code >= 500:
+            raise RetryableError(f"Bybit HTTP {resp.status_code} on {endpoint}")
         resp.raise_for_status()
         data = resp.json()
-        if data.get("retCode", 0) != 0:
-            raise RuntimeError(f"Bybit API error: {data}")
-        return data.get("result", {})
+        result = check_response(data, status)
+        return (data if full else result), status
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        priority: int | None = None,
+        full: bool = False,
+    ) -> dict[str, Any]:
+        """Send one request and return its ``result`` (the whole payload with ``full``)."""
+        if priority is None:
+            priority = URGENT if endpoint in URGENT_ENDPOINTS else NORMAL
+        try:
+            return self.scheduler.run(
+                endpoint,
+                lambda: self._send(method, endpoint, params, full),
+                priority,
+                is_idempotent(endpoint, params),
+            )
+        finally:
+            # Also on failure: an order may have gone through before the error.
+            if endpoint in ACCOUNT_MUTATING:
+                self.invalidate_account()
+
+    def invalidate_account(self) -> None:
+        """Drop cached wallet and positions (done automatically after our own orders)."""
+        self.cache.invalidate("wallet")
+        self.cache.invalidate("positions")
+
+    def _wallet(self) -> tuple[list[Balance], float, float]:
+        return self.cache.get(
+            "wallet",
+            self.account_type,
+            lambda: parse_balances(
+                self._request("GET", "/v5/account/wallet-balance", {"accountType": self.account_type})
+            ),
+        )
+
+    def _fetch_positions(self, symbol: str | None) -> list[Position]:
+        positions = list(self.iter_positions(symbol, prefetch=False))
+        for p in positions:
+            self._leverage[p.symbol] = p.leverage
+        return positions
+
+    def _pages(self, endpoint: str, params: dict[str, Any], prefetch: bool = True) -> Iterator[list[dict[str, Any]]]:
+        """Raw ``list`` of each page, following ``nextPageCursor``.
+
+        With ``prefetch`` the next page is requested on a worker thread while
+        the caller consumes the current one; at most two pages are held.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        def fetch(cursor: str) -> dict[str, Any]:
+            return self._request("GET", endpoint, {**params, "cursor": cursor} if cursor else params)
+
+        try:
+            result = fetch("")
+            seen: set[str] = set()
+            while True:
+                rows = result.get("list") or []
+                cursor = result.get("nextPageCursor") or ""
+                if not rows or cursor in seen:
+                    cursor = ""
+                seen.add(cursor)
+                pending: Future[dict[str, Any]] | None = None
+                if cursor and executor is not None:
+                    pending = executor.submit(fetch, cursor)
+                if rows:
+                    yield rows
+                if not cursor:
+                    return
+                result = pending.result() if pending is not None else fetch(cursor)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _history(
+        self,
+        endpoint: str,
+        page_size: int,
+        symbol: str | None,
+        start_time: int | None,
+        end_time: int | None,
+        prefetch: bool,
+    ) -> Iterator[list[dict[str, Any]]]:
+        for lo, hi in history_windows(start_time, end_time):
+            params: dict[str, Any] = {"category": "linear", "limit": page_size}
+            if symbol:
+                params["symbol"] = symbol
+            if lo is not None:
+                params["startTime"] = lo
+            if hi is not None:
+                params["endTime"] = hi
+            yield from self._pages(endpoint, params, prefetch)
+
+    def iter_positions(
+        self, symbol: str | None = None, page_size: int = POSITIONS_PAGE, prefetch: bool = True
+    ) -> Iterator[Position]:
+        """Every position page by page, bypassing the snapshot cache."""
+        params: dict[str, Any] = {"category": "linear", "settleCoin": "USDT", "limit": page_size}
+        if symbol:
+            params["symbol"] = symbol
+        for rows in self._pages("/v5/position/list", params, prefetch):
+            for item in rows:
+                yield parse_position(item)
+
+    def iter_order_history(
+        self,
+        symbol: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = ORDER_HISTORY_PAGE,
+        prefetch: bool = True,
+    ) -> Iterator[Order]:
+        """Orders from /v5/order/history, newest first; times are ms, any span (split into 7-day windows)."""
+        pages = self._history("/v5/order/history", page_size, symbol, start_time, end_time, prefetch)
+        for rows in pages:
+            for item in rows:
+                yield parse_order(item)
+
+    def iter_executions(
+        self,
+        symbol: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = EXECUTIONS_PAGE,
+        prefetch: bool = True,
+    ) -> Iterator[Execution]:
+        """Fills from /v5/execution/list, newest first; times are ms, any span (split into 7-day windows)."""
+        pages = self._history("/v5/execution/list", page_size, symbol, start_time, end_time, prefetch)
+        for rows in pages:
+            for item in rows:
+                yield parse_execution(item)
 
     def get_account_info(self) -> AccountInfo:
-        result = self._request("GET", "/v5/account/wallet-balance", {"accountType": self.account_type})
+        balances, total_equity, total_available = self._wallet()
         positions = self.get_positions()
-        balances: list[Balance] = []
-
-        total_equity = 0.0
-        total_available = 0.0
-
-        for coin_data in result.get("list", []):
-            for coin in coin_data.get("coin", []):
-                b = Balance(
-                    coin=coin["coin"],
-                    wallet_balance=float(coin.get("walletBalance", 0)),
-                    available_balance=float(coin.get("availableToWithdraw", 0)),
-                )
-                balances.append(b)
-                total_equity += b.wallet_balance
-                total_available += b.available_balance
-
         return AccountInfo(
             total_equity=total_equity,
             total_available_balance=total_available,
             positions=positions,
-            balances=balances,
+            balances=list(balances),
         )
 
     def get_positions(self, symbol: str | None = None) -> list[Position]:
-        params: dict[str, Any] = {"category": "linear", "settleCoin": "USDT"}
         if symbol:
-            params["symbol"] = symbol
-        result = self._request("GET", "/v5/position/list", params)
-        positions: list[Position] = []
-
-        for item in result.get("list", []):
-            pos = Position(
-                symbol=item["symbol"],
-                side=item["side"],
-                size=float(item.get("size", 0)),
-                entry_price=float(item.get("avgPrice", 0)),
-                unrealised_pnl=float(item.get("unrealisedPnl", 0)),
-                leverage=float(item.get("leverage", 1)),
-            )
-            positions.append(pos)
-
-        return positions
+            # A fresh all-positions snapshot answers single-symbol lookups too.
+            every = self.cache.peek("positions", None)
+            if every is not None:
+                return [p for p in every if p.symbol == symbol]
+        return list(self.cache.get("positions", symbol or None, lambda: self._fetch_positions(symbol)))
 
     def get_balance(self, coin: str) -> Balance | None:
-        info = self.get_account_info()
-        for b in info.balances:
+        balances, _, _ = self._wallet()
+        for b in balances:
             if b.coin == coin:
                 return b
         return None
 
-    def get_ticker(self, symbol: str) -> Ticker:
+    def get_equity(self) -> float:
+        """Total wallet balance, from the cached wallet snapshot when fresh."""
+        return self._wallet()[1]
+
+    def get_exposure(self) -> dict[str, Position]:
+        """Open positions by symbol, from the cached positions snapshot when fresh."""
+        return {p.symbol: p for p in self.get_positions() if p.size}
+
+    def _fetch_ticker(self, symbol: str) -> Ticker:
         result = self._request("GET", "/v5/market/tickers", {"category": "linear", "symbol": symbol})
         if not result.get("list"):
             raise ValueError(f"No ticker data for {symbol}")
 
-        item = result["list"][0]
-        return Ticker(
-            symbol=item["symbol"],
-            bid=float(item.get("bid1Price", 0)),
-            ask=float(item.get("ask1Price", 0)),
-            last=float(item.get("lastPrice", 0)),
-            timestamp=item.get("time", ""),
-        )
+        return parse_ticker(result["list"][0])
+
+    def get_ticker(self, symbol: str) -> Ticker:
+        every = self.cache.peek("tickers", None)
+        if every is not None and symbol in every:
+            return every[symbol]
+        return self.cache.get("tickers", symbol, lambda: self._fetch_ticker(symbol))
+
+    def _fetch_tickers(self) -> dict[str, Ticker]:
+        result = self._request("GET", "/v5/market/tickers", {"category": "linear"})
+        return parse_tickers(result.get("list", []))
+
+    def get_tickers(self, symbols: list[str] | None = None) -> dict[str, Ticker]:
+        """Tickers for ``symbols`` (default: every linear symbol) from one category-wide request.
+
+        The full snapshot is cached under the tickers TTL and also answers
+        get_ticker; symbols Bybit doesn't list are omitted.
+        """
+        every = self.cache.get("tickers", None, self._fetch_tickers)
+        if symbols is None:
+            return dict(every)
+        return {s: every[s] for s in symbols if s in every}
 
     def set_leverage(self, symbol: str, leverage: float) -> bool:
-        params = {
-            "category": "linear",
-            "symbol": symbol,
-            "buyLeverage": str(leverage),
-            "sellLeverage": str(leverage),
-        }
-        result = self._request("POST", "/v5/position/set-leverage", params)
-        return result.get("retMsg", "") == "OK" or "leverage not modified" in result.get("retMsg", "").lower()
+        result = self._request("POST", "/v5/position/set-leverage", leverage_params(symbol, leverage))
+        # _request raises on a non-zero retCode, so getting here means it was applied.
+        self._leverage[symbol] = float(leverage)
+        return leverage_ok(result)
+
+    def ensure_leverage(self, symbol: str, leverage: float) -> bool:
+        """set_leverage unless ``symbol`` is already known to be at ``leverage``."""
+        if self._leverage.get(symbol) == float(leverage):
+            return True
+        return self.set_leverage(symbol, leverage)
+
+    def invalidate_leverage(self, symbol: str | None = None) -> None:
+        """Forget cached leverage, e.g. after it was changed outside this adapter."""
+        if symbol is None:
+            self._leverage.clear()
+        else:
+            self._leverage.pop(symbol, None)
 
     def place_order(
         self,
@@ -168,29 +652,25 @@ class BybitAdapter(ExchangeAdapter):
         stop_loss: float | None = None,
         take_profit: float | None = None,
         leverage: float | None = None,
+        confirm: bool | None = None,
         **kwargs: Any,
     ) -> Order:
+        """Place an order.
+
+        With ``confirm`` (default: the adapter's ``confirm_orders``) the order is
+        re-read from the exchange; without it the call returns right after
+        create with the order as submitted (status New) and costs a single
+        round trip. Leverage is only sent when it differs from the cached value.
+        """
         if leverage:
-            self.set_leverage(symbol, leverage)
-
-        params: dict[str, Any] = {
-            "category": "linear",
-            "symbol": symbol,
-            "side": side.value,
-            "orderType": order_type.value,
-            "qty": str(qty),
-        }
-        if price:
-            params["price"] = str(price)
-        if stop_loss:
-            params["stopLoss"] = str(stop_loss)
-        if take_profit:
-            params["takeProfit"] = str(take_profit)
-        params.update(kwargs)
+            self.ensure_leverage(symbol, leverage)
 
+        params = order_params(symbol, side, order_type, qty, price, stop_loss, take_profit, **kwargs)
         result = self._request("POST", "/v5/order/create", params)
         order_id = result.get("orderId", "")
-        return self.get_order(symbol, order_id)
+        if confirm if confirm is not None else self.confirm_orders:
+            return self.get_order(symbol, order_id)
+        return order_from_request(params, order_id)
 
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         params = {"category": "linear", "symbol": symbol, "orderId": order_id}
@@ -203,15 +683,32 @@ class BybitAdapter(ExchangeAdapter):
         if not result.get("list"):
             raise ValueError(f"Order {order_id} not found")
 
-        item = result["list"][0]
-        return Order(
-            order_id=item["orderId"],
-            symbol=item["symbol"],
-            side=item["side"],
-            order_type=item["orderType"],
-            price=float(item.get("price", 0)) if item.get("price") else None,
-            qty=float(item.get("qty", 0)),
-            filled_qty=float(item.get("cumExecQty", 0)),
-            status=item.get("orderStatus", OrderStatus.NEW.value),
-            created_at=item.get("createdTime", ""),
-        )
+        return parse_order(result["list"][0])
+
+    def _batch(self, endpoint: str, items: list[dict[str, Any]]) -> list[BatchResult]:
+        results: list[BatchResult] = []
+        for chunk in chunked(items, BATCH_LIMIT):
+            try:
+                data = self._request("POST", endpoint, {"category": "linear", "request": chunk}, full=True)
+            except (RuntimeError, requests.RequestException) as exc:
+                results.extend(failed_results(chunk, exc))
+            else:
+                results.extend(batch_results(chunk, data))
+        return results
+
+    def place_orders(self, orders: list[OrderRequest]) -> list[BatchResult]:
+        """Place orders via /v5/order/create-batch, BATCH_LIMIT per request.
+
+        Results line up with ``orders``; a chunk that fails as a whole marks
+        each of its orders failed and the remaining chunks are still sent.
+        """
+        for symbol, leverage in {(o.symbol, o.leverage) for o in orders if o.leverage}:
+            self.ensure_leverage(symbol, leverage)
+        return self._batch("/v5/order/create-batch", [batch_order_item(o) for o in orders])
+
+    def cancel_orders(self, orders: list[tuple[str, str]]) -> list[BatchResult]:
+        items = [{"symbol": symbol, "orderId": order_id} for symbol, order_id in orders]
+        return self._batch("/v5/order/cancel-batch", items)
+
+    def amend_orders(self, amends: list[OrderAmend]) -> list[BatchResult]:
+        return self._batch("/v5/order/amend-batch", [batch_amend_item(a) for a in amends])
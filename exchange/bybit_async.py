@@ -0,0 +1,296 @@
+"""asyncio Bybit V5 REST API adapter (aiohttp)."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .base import (
+    AccountInfo,
+    AsyncExchangeAdapter,
+    Balance,
+    BatchResult,
+    Execution,
+    Order,
+    OrderAmend,
+    OrderRequest,
+    OrderSide,
+    OrderType,
+    Position,
+    Ticker,
+)
+from .bybit import (
+    BATCH_LIMIT,
+    EXECUTIONS_PAGE,
+    ORDER_HISTORY_PAGE,
+    POSITIONS_PAGE,
+    BybitSigner,
+    batch_amend_item,
+    batch_order_item,
+    batch_results,
+    check_response,
+    chunked,
+    failed_results,
+    history_windows,
+    leverage_ok,
+    leverage_params,
+    order_params,
+    parse_balances,
+    parse_execution,
+    parse_order,
+    parse_position,
+    parse_ticker,
+    parse_tickers,
+)
+
+
+def _query(params: dict[str, Any] | None) -> dict[str, str] | None:
+    # Same query string requests would send: None dropped, everything else str().
+    if not params:
+        return None
+    return {k: str(v) for k, v in params.items() if v is not None}
+
+
+class AsyncBybitAdapter(BybitSigner, AsyncExchangeAdapter):
+    """Bybit V5 REST adapter for USDT perpetual futures on one pooled aiohttp session.
+
+    Signing and response parsing are shared with BybitAdapter. Independent
+    requests (wallet and positions in get_account_info, or many tickers via
+    asyncio.gather) run concurrently over the session's connection pool.
+    ``base_url`` overrides the mainnet/testnet URL (e.g. a local test server).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = False,
+        account_type: str = "UNIFIED",
+        recv_window: int = 5000,
+        base_url: str | None = None,
+        timeout: float = 10.0,
+        max_connections: int = 32,
+    ) -> None:
+        if aiohttp is None:
+            raise ImportError("aiohttp library is required. Install with: pip install aiohttp")
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        self.base_url = base_url or (self.TESTNET_URL if testnet else self.BASE_URL)
+        self.account_type = account_type
+        self.recv_window = recv_window
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._session: Any = None
+
+    def _get_session(self) -> Any:
+        # Created lazily so it binds to the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(
+        self, method: str, endpoint: str, params: dict[str, Any] | None = None, full: bool = False
+    ) -> dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+        headers = self._headers(params)
+        session = self._get_session()
+        if method.upper() == "GET":
+            request = session.get(url, headers=headers, params=_query(params))
+        else:
+            request = session.post(url, headers=headers, json=params)
+        async with request as resp:
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+        result = check_response(data)
+        return data if full else result
+
+    async def get_account_info(self) -> AccountInfo:
+        result, positions = await asyncio.gather(
+            self._request("GET", "/v5/account/wallet-balance", {"accountType": self.account_type}),
+            self.get_positions(),
+        )
+        balances, total_equity, total_available = parse_balances(result)
+        return AccountInfo(
+            total_equity=total_equity,
+            total_available_balance=total_available,
+            positions=positions,
+            balances=balances,
+        )
+
+    async def get_positions(self, symbol: str | None = None) -> list[Position]:
+        return [p async for p in self.iter_positions(symbol, prefetch=False)]
+
+    async def _pages(
+        self, endpoint: str, params: dict[str, Any], prefetch: bool = True
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Raw ``list`` of each page, following ``nextPageCursor``; see BybitAdapter._pages."""
+
+        def fetch(cursor: str) -> Any:
+            return self._request("GET", endpoint, {**params, "cursor": cursor} if cursor else params)
+
+        result = await fetch("")
+        seen: set[str] = set()
+        pending: asyncio.Task[Any] | None = None
+        try:
+            while True:
+                rows = result.get("list") or []
+                cursor = result.get("nextPageCursor") or ""
+                if not rows or cursor in seen:
+                    cursor = ""
+                seen.add(cursor)
+                pending = asyncio.ensure_future(fetch(cursor)) if cursor and prefetch else None
+                if rows:
+                    yield rows
+                if not cursor:
+                    return
+                result = await pending if pending is not None else await fetch(cursor)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _history(
+        self,
+        endpoint: str,
+        page_size: int,
+        symbol: str | None,
+        start_time: int | None,
+        end_time: int | None,
+        prefetch: bool,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        for lo, hi in history_windows(start_time, end_time):
+            params: dict[str, Any] = {"category": "linear", "limit": page_size}
+            if symbol:
+                params["symbol"] = symbol
+            if lo is not None:
+                params["startTime"] = lo
+            if hi is not None:
+                params["endTime"] = hi
+            async for rows in self._pages(endpoint, params, prefetch):
+                yield rows
+
+    async def iter_positions(
+        self, symbol: str | None = None, page_size: int = POSITIONS_PAGE, prefetch: bool = True
+    ) -> AsyncIterator[Position]:
+        params: dict[str, Any] = {"category": "linear", "settleCoin": "USDT", "limit": page_size}
+        if symbol:
+            params["symbol"] = symbol
+        async for rows in self._pages("/v5/position/list", params, prefetch):
+            for item in rows:
+                yield parse_position(item)
+
+    async def iter_order_history(
+        self,
+        symbol: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = ORDER_HISTORY_PAGE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Order]:
+        async for rows in self._history("/v5/order/history", page_size, symbol, start_time, end_time, prefetch):
+            for item in rows:
+                yield parse_order(item)
+
+    async def iter_executions(
+        self,
+        symbol: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = EXECUTIONS_PAGE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Execution]:
+        async for rows in self._history("/v5/execution/list", page_size, symbol, start_time, end_time, prefetch):
+            for item in rows:
+                yield parse_execution(item)
+
+    async def get_balance(self, coin: str) -> Balance | None:
+        # Only the wallet is needed; skip the positions call get_account_info makes.
+        result = await self._request("GET", "/v5/account/wallet-balance", {"accountType": self.account_type})
+        balances, _, _ = parse_balances(result)
+        for b in balances:
+            if b.coin == coin:
+                return b
+        return None
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        result = await self._request("GET", "/v5/market/tickers", {"category": "linear", "symbol": symbol})
+        if not result.get("list"):
+            raise ValueError(f"No ticker data for {symbol}")
+        return parse_ticker(result["list"][0])
+
+    async def get_tickers(self, symbols: list[str] | None = None) -> dict[str, Ticker]:
+        result = await self._request("GET", "/v5/market/tickers", {"category": "linear"})
+        return parse_tickers(result.get("list", []), None if symbols is None else set(symbols))
+
+    async def set_leverage(self, symbol: str, leverage: float) -> bool:
+        result = await self._request("POST", "/v5/position/set-leverage", leverage_params(symbol, leverage))
+        return leverage_ok(result)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        qty: float,
+        price: float | None = None,
+        stop_loss: float | None = None,
+        take_profit: float | None = None,
+        leverage: float | None = None,
+        **kwargs: Any,
+    ) -> Order:
+        if leverage:
+            await self.set_leverage(symbol, leverage)
+
+        params = order_params(symbol, side, order_type, qty, price, stop_loss, take_profit, **kwargs)
+        result = await self._request("POST", "/v5/order/create", params)
+        return await self.get_order(symbol, result.get("orderId", ""))
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        params = {"category": "linear", "symbol": symbol, "orderId": order_id}
+        result = await self._request("POST", "/v5/order/cancel", params)
+        return result.get("retMsg", "") == "OK"
+
+    async def get_order(self, symbol: str, order_id: str) -> Order:
+        params = {"category": "linear", "symbol": symbol, "orderId": order_id}
+        result = await self._request("GET", "/v5/order/realtime", params)
+        if not result.get("list"):
+            raise ValueError(f"Order {order_id} not found")
+        return parse_order(result["list"][0])
+
+    async def _batch_chunk(self, endpoint: str, chunk: list[dict[str, Any]]) -> list[BatchResult]:
+        try:
+            data = await self._request("POST", endpoint, {"category": "linear", "request": chunk}, full=True)
+        except (RuntimeError, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            return failed_results(chunk, exc)
+        return batch_results(chunk, data)
+
+    async def _batch(self, endpoint: str, items: list[dict[str, Any]]) -> list[BatchResult]:
+        # Chunks are independent requests, so send them concurrently.
+        parts = await asyncio.gather(*(self._batch_chunk(endpoint, c) for c in chunked(items, BATCH_LIMIT)))
+        return [r for part in parts for r in part]
+
+    async def place_orders(self, orders: list[OrderRequest]) -> list[BatchResult]:
+        levels = {(o.symbol, o.leverage) for o in orders if o.leverage}
+        await asyncio.gather(*(self.set_leverage(symbol, leverage) for symbol, leverage in levels))
+        return await self._batch("/v5/order/create-batch", [batch_order_item(o) for o in orders])
+
+    async def cancel_orders(self, orders: list[tuple[str, str]]) -> list[BatchResult]:
+        items = [{"symbol": symbol, "orderId": order_id} for symbol, order_id in orders]
+        return await self._batch("/v5/order/cancel-batch", items)
+
+    async def amend_orders(self, amends: list[OrderAmend]) -> list[BatchResult]:
+        return await self._batch("/v5/order/amend-batch", [batch_amend_item(a) for a in amends])
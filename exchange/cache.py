@@ -0,0 +1,70 @@
+"""TTL snapshot cache for account and market data.
+
+Entries live under a part (``wallet``, ``positions``, ``tickers``), each with
+its own TTL, and a key within the part (account type, symbol, ...). Parts
+are refreshed independently, so a balance lookup never refetches positions.
+Invalidating a part bumps its generation: a load that was already in flight
+when the part was invalidated returns its value but does not store it, so a
+response that predates our own order can't repopulate the cache.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+PARTS = ("wallet", "positions", "tickers")
+
+_MISSING = object()
+
+
+class SnapshotCache:
+    __slots__ = ("ttls", "_entries", "_generation", "_clock", "hits", "misses")
+
+    def __init__(
+        self,
+        wallet_ttl: float = 5.0,
+        positions_ttl: float = 2.0,
+        tickers_ttl: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = {"wallet": wallet_ttl, "positions": positions_ttl, "tickers": tickers_ttl}
+        self._entries: dict[str, dict[Hashable, tuple[float, Any]]] = {part: {} for part in PARTS}
+        self._generation = dict.fromkeys(PARTS, 0)
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, part: str, key: Hashable = None, default: Any = None) -> Any:
+        """Fresh cached value or ``default``; never loads."""
+        entry = self._entries[part].get(key)
+        if entry is not None and self._clock() - entry[0] < self.ttls[part]:
+            return entry[1]
+        return default
+
+    def put(self, part: str, key: Hashable, value: Any, at: float | None = None) -> None:
+        self._entries[part][key] = (self._clock() if at is None else at, value)
+
+    def get(self, part: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Cached value if younger than the part's TTL, else ``load()`` (stored)."""
+        value = self.peek(part, key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        generation = self._generation[part]
+        started = self._clock()  # age counts from the request, not the response
+        value = load()
+        if self._generation[part] == generation:
+            self.put(part, key, value, started)
+        return value
+
+    def invalidate(self, part: str | None = None, key: Hashable = _MISSING) -> None:
+        """Drop one key, one part, or (no arguments) everything."""
+        for name in PARTS if part is None else (part,):
+            if key is _MISSING:
+                self._entries[name].clear()
+                self._generation[name] += 1
+            else:
+                self._entries[name].pop(key, None)
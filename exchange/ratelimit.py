@@ -0,0 +1,218 @@
+"""Rate-limit-aware request scheduling for REST adapters.
+
+RequestScheduler keeps one token bucket per endpoint group, plus an optional
+``shared`` bucket every request also draws from (e.g. a per-IP budget).
+Callers block in ``acquire`` until their buckets have a token; waiters on a
+bucket are served by ``(priority, arrival)``. Because all groups meet in the
+shared bucket, order placement (URGENT) overtakes queries queued in any
+group, and non-urgent calls leave ``reserve`` shared tokens untouched so an
+order never has to wait for a burst of queries to drain. Buckets start
+from configured per-second limits and are corrected from the exchange's own
+limit status after every response: the remaining count caps the local token
+count, a changed limit resizes the bucket and an exhausted limit parks the
+group until the exchange's reset time.
+
+``run`` wraps one request with acquire, status feedback and retries with
+full-jitter exponential backoff. A request is retried when it raises
+RetryableError (or one of ``retry_on``); failures that may have reached the
+exchange are only retried for idempotent requests.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+URGENT = 0
+NORMAL = 1
+BACKGROUND = 2
+
+# (limit per second, remaining in the current window, window reset as a unix timestamp)
+LimitStatus = tuple[float | None, float | None, float | None]
+
+
+class RetryableError(RuntimeError):
+    """A failed request worth retrying.
+
+    ``safe`` means the exchange certainly did not act on it (e.g. it was
+    throttled), so even non-idempotent requests may be resent.
+    """
+
+    def __init__(self, message: str, safe: bool = False, retry_at: float | None = None) -> None:
+        super().__init__(message)
+        self.safe = safe
+        self.retry_at = retry_at  # unix timestamp, if the exchange said when
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated", "blocked_until", "waiters")
+
+    def __init__(self, rate: float, capacity: float | None = None, now: float = 0.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate_must_be_positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = now
+        self.blocked_until = 0.0
+        self.waiters: list[tuple[int, int]] = []
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def take(self, now: float, reserve: float = 0.0) -> float:
+        """Take one token, leaving ``reserve`` behind.
+
+        Returns 0.0 on success, else seconds until one is available.
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        need = 1.0 + min(reserve, self.capacity - 1.0)
+        if self.tokens >= need:
+            self.tokens -= 1.0
+            return 0.0
+        return (need - self.tokens) / self.rate
+
+    def observe(self, limit: float | None, remaining: float | None, reset_in: float | None, now: float) -> None:
+        """Align the bucket with the exchange's view of the current window."""
+        self._refill(now)
+        if limit is not None and limit > 0 and limit != self.capacity:
+            self.rate = self.capacity = float(limit)
+            self.tokens = min(self.tokens, self.capacity)
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0 and reset_in is not None and reset_in > 0:
+                self.blocked_until = max(self.blocked_until, now + reset_in)
+
+    def block(self, seconds: float, now: float) -> None:
+        self.tokens = 0.0
+        self.updated = now
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RequestScheduler:
+    """Per-group token buckets, priority queueing and retry with jittered backoff."""
+
+    def __init__(
+        self,
+        limits: dict[str, float] | None = None,
+        group_for: Callable[[str], str] | None = None,
+        default_limit: float = 10.0,
+        shared: str | None = None,
+        reserve: float = 0.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        retry_on: tuple[type[BaseException], ...] = (),
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.limits = dict(limits or {})
+        self.group_for = group_for or (lambda endpoint: endpoint)
+        self.default_limit = default_limit
+        self.shared = shared
+        self.reserve = reserve
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_on = retry_on
+        self._sleep = sleep
+        self._rng = rng
+        self._clock = time.monotonic
+        self._buckets: dict[str, TokenBucket] = {}
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self.retries = 0
+        self.throttled = 0
+
+    def bucket(self, group: str) -> TokenBucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            rate = self.limits.get(group, self.default_limit)
+            bucket = self._buckets[group] = TokenBucket(rate, now=self._clock())
+        return bucket
+
+    def acquire(self, group: str, priority: int = NORMAL) -> None:
+        """Block until ``group`` (and the shared bucket, if any) grant this caller a token."""
+        if self.shared is not None and group != self.shared:
+            self._take(self.shared, priority, self.reserve if priority > URGENT else 0.0)
+        self._take(group, priority, 0.0)
+
+    def _take(self, group: str, priority: int, reserve: float) -> None:
+        # Wait until no earlier/higher-priority waiter is ahead and a token is free.
+        with self._cond:
+            bucket = self.bucket(group)
+            ticket = (priority, next(self._seq))
+            heapq.heappush(bucket.waiters, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if bucket.waiters[0] == ticket:
+                        timeout = bucket.take(self._clock(), reserve)
+                        if timeout <= 0:
+                            return
+                    self._cond.wait(timeout)
+            finally:
+                bucket.waiters.remove(ticket)
+                heapq.heapify(bucket.waiters)
+                self._cond.notify_all()
+
+    def observe(self, group: str, status: LimitStatus | None) -> None:
+        if status is None:
+            return
+        limit, remaining, reset_at = status
+        reset_in = reset_at - time.time() if reset_at is not None else None
+        with self._cond:
+            self.bucket(group).observe(limit, remaining, reset_in, self._clock())
+            self._cond.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number ``attempt`` (1-based)."""
+        return self._rng() * min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+
+    def run(
+        self,
+        endpoint: str,
+        send: Callable[[], tuple[Any, LimitStatus | None]],
+        priority: int = NORMAL,
+        idempotent: bool = True,
+    ) -> Any:
+        """Send one request through the scheduler and return its result.
+
+        ``send`` performs the request and returns ``(result, limit_status)``.
+        """
+        group = self.group_for(endpoint)
+        attempt = 0
+        while True:
+            self.acquire(group, priority)
+            try:
+                result, status = send()
+            except RetryableError as exc:
+                if exc.safe:
+                    self.throttled += 1
+                if attempt >= self.max_retries or not (exc.safe or idempotent):
+                    raise
+                delay = self.backoff(attempt + 1)
+                if exc.retry_at is not None:
+                    wait = exc.retry_at - time.time()
+                    delay = max(delay, wait)
+                    with self._cond:
+                        self.bucket(group).block(max(wait, 0.0), self._clock())
+            except self.retry_on:
+                if attempt >= self.max_retries or not idempotent:
+                    raise
+                delay = self.backoff(attempt + 1)
+            else:
+                self.observe(group, status)
+                return result
+            attempt += 1
+            self.retries += 1
+            self._sleep(delay)
@@ -1,11 +1,15 @@
 """Bangify MVP Risk Engine core."""
 
 from .core import (
+    RISK_REASONS,
+    AccountLedger,
     AccountState,
     RiskDecision,
+    RiskDecisionBatch,
     RiskEngine,
     RiskEngineConfig,
     calculate_position_size,
+    calculate_position_sizes,
 )
 from .execution import (
     ConfirmationToken,
@@ -13,23 +17,50 @@ from .execution import (
     DraftOrder,
     ExecutionDecision,
     ExecutionWrapper,
+    ExposureBook,
     ExposureState,
+    GuardDecisionCache,
     PreTradeGuard,
     TradeIntent,
 )
+from .kpi import KPIAggregator, KPISnapshot
+from .latency import LatencyHistogram, LatencySnapshot, StageTimers
+from .rules import GuardRule, RuleStats, default_rules
+from .simulation import RuinReport, simulate_risk_of_ruin
+from .sweep import HistoricalTrade, SweepResult, config_grid, run_sweep
 
 __all__ = [
+    "AccountLedger",
     "AccountState",
+    "RISK_REASONS",
     "RiskDecision",
+    "RiskDecisionBatch",
     "RiskEngine",
     "RiskEngineConfig",
     "calculate_position_size",
+    "calculate_position_sizes",
     "TradeIntent",
     "ExposureState",
+    "ExposureBook",
     "ExecutionDecision",
     "PreTradeGuard",
+    "GuardDecisionCache",
+    "GuardRule",
+    "RuleStats",
+    "default_rules",
+    "RuinReport",
+    "simulate_risk_of_ruin",
+    "HistoricalTrade",
+    "SweepResult",
+    "config_grid",
+    "run_sweep",
     "DraftOrder",
     "ConfirmationToken",
     "ConfirmedOrder",
     "ExecutionWrapper",
+    "KPIAggregator",
+    "KPISnapshot",
+    "LatencyHistogram",
+    "LatencySnapshot",
+    "StageTimers",
 ]
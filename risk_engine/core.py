@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 @dataclass(frozen=True)
@@ -24,6 +32,129 @@ class AccountState:
     manual_kill_switch: bool = False
 
 
+_SECONDS_PER_DAY = 86_400
+
+
+class AccountLedger:
+    """Mutable account state updated incrementally from fills and closed trades.
+
+    Carries the same fields as AccountState, so it can be handed to RiskEngine
+    and PreTradeGuard in its place. Daily-cap and kill-switch flags are kept
+    current on every update, so risk checks only read attributes. The day
+    rolls over at the UTC boundary: realized PnL is folded into
+    start_of_day_equity and reset; the loss streak carries over until
+    reset_loss_streak() is called.
+
+    ``version`` increases on every mutation made through the methods below;
+    caches keyed on it (see GuardDecisionCache) rely on callers not
+    assigning the fields directly.
+    """
+
+    __slots__ = (
+        "config",
+        "start_of_day_equity",
+        "realized_pnl_today",
+        "consecutive_losses",
+        "manual_kill_switch",
+        "max_daily_loss",
+        "daily_loss_cap_hit",
+        "kill_switch",
+        "version",
+        "_clock",
+        "_next_rollover",
+    )
+
+    def __init__(
+        self,
+        config: RiskEngineConfig,
+        start_of_day_equity: float,
+        realized_pnl_today: float = 0.0,
+        consecutive_losses: int = 0,
+        manual_kill_switch: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config
+        self.start_of_day_equity = start_of_day_equity
+        self.realized_pnl_today = realized_pnl_today
+        self.consecutive_losses = consecutive_losses
+        self.manual_kill_switch = manual_kill_switch
+        self.version = 0
+        self._clock = clock
+        self._next_rollover = self._boundary_after(clock())
+        self.max_daily_loss = start_of_day_equity * config.daily_loss_cap_percent
+        self._update_flags()
+
+    @staticmethod
+    def _boundary_after(now: float) -> float:
+        return float((int(now // _SECONDS_PER_DAY) + 1) * _SECONDS_PER_DAY)
+
+    def _update_flags(self) -> None:
+        self.daily_loss_cap_hit = abs(min(0.0, self.realized_pnl_today)) >= self.max_daily_loss
+        self.kill_switch = (
+            self.manual_kill_switch or self.consecutive_losses >= self.config.max_consecutive_losses
+        )
+
+    @property
+    def daily_loss_headroom(self) -> float:
+        """Loss still allowed today before the daily cap trips (never negative)."""
+        return max(0.0, self.max_daily_loss - abs(min(0.0, self.realized_pnl_today)))
+
+    def roll_if_due(self) -> bool:
+        """Roll the day over if the UTC boundary has passed. Returns True on rollover."""
+        now = self._clock()
+        if now < self._next_rollover:
+            return False
+        self.rollover(now=now)
+        return True
+
+    def rollover(self, start_of_day_equity: float | None = None, now: float | None = None) -> None:
+        """Start a new trading day, optionally with equity reported by the exchange."""
+        if start_of_day_equity is None:
+            start_of_day_equity = self.start_of_day_equity + self.realized_pnl_today
+        self.start_of_day_equity = start_of_day_equity
+        self.realized_pnl_today = 0.0
+        self.max_daily_loss = start_of_day_equity * self.config.daily_loss_cap_percent
+        self._next_rollover = self._boundary_after(self._clock() if now is None else now)
+        self._update_flags()
+        self.version += 1
+
+    def record_fill(self, fee: float) -> None:
+        """Book the fee paid on an execution against today's realized PnL."""
+        self.roll_if_due()
+        self.realized_pnl_today -= fee
+        self.daily_loss_cap_hit = abs(min(0.0, self.realized_pnl_today)) >= self.max_daily_loss
+        self.version += 1
+
+    def record_closed_trade(self, pnl: float) -> None:
+        """Book a closed trade's PnL (excluding fees already booked via record_fill)."""
+        self.roll_if_due()
+        self.realized_pnl_today += pnl
+        if pnl < 0:
+            self.consecutive_losses += 1
+        elif pnl > 0:
+            self.consecutive_losses = 0
+        self._update_flags()
+        self.version += 1
+
+    def set_manual_kill_switch(self, active: bool) -> None:
+        self.manual_kill_switch = active
+        self._update_flags()
+        self.version += 1
+
+    def reset_loss_streak(self) -> None:
+        self.consecutive_losses = 0
+        self._update_flags()
+        self.version += 1
+
+    def snapshot(self) -> AccountState:
+        return AccountState(
+            start_of_day_equity=self.start_of_day_equity,
+            realized_pnl_today=self.realized_pnl_today,
+            consecutive_losses=self.consecutive_losses,
+            manual_kill_switch=self.manual_kill_switch,
+        )
+
+
 @dataclass(frozen=True)
 class RiskDecision:
     allowed: bool
@@ -31,6 +162,46 @@ class RiskDecision:
     reason: str
 
 
+# Reason codes used by the batch API; index == code stored in RiskDecisionBatch.
+RISK_REASONS: tuple[str, ...] = (
+    "ok",
+    "kill_switch_active",
+    "daily_loss_cap_reached",
+    "invalid_position_size",
+)
+REASON_OK = 0
+REASON_KILL_SWITCH = 1
+REASON_DAILY_LOSS_CAP = 2
+REASON_INVALID_SIZE = 3
+
+
+@dataclass(frozen=True)
+class RiskDecisionBatch:
+    """Array form of RiskDecision; one element per evaluated setup."""
+
+    allowed: np.ndarray
+    position_size: np.ndarray
+    reason_code: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.position_size.shape[0])
+
+    def reasons(self) -> list[str]:
+        return [RISK_REASONS[c] for c in self.reason_code.tolist()]
+
+    def decision(self, index: int) -> RiskDecision:
+        return RiskDecision(
+            bool(self.allowed[index]),
+            float(self.position_size[index]),
+            RISK_REASONS[int(self.reason_code[index])],
+        )
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for batch evaluation. Install with: pip install numpy")
+
+
 def calculate_position_size(
     balance: float,
     risk_percent: float,
@@ -56,24 +227,81 @@ def calculate_position_size(
     return max(0.0, round(size, 8))
 
 
+def _round8(values: np.ndarray) -> np.ndarray:
+    """Vectorized ``round(x, 8)`` that matches Python's correctly-rounded result.
+
+    ``np.round`` scales by 1e8 first, which can land on the wrong side of a
+    half-way point. Those near-ties (and values too large to scale exactly)
+    are re-rounded with the builtin; everything else stays vectorized.
+    """
+
+    scaled = values * 1e8
+    rounded = np.rint(scaled) / 1e8
+    frac = np.abs(scaled - np.floor(scaled))
+    ambiguous = (np.abs(frac - 0.5) <= np.abs(scaled) * 1e-15 + 1e-9) | (np.abs(scaled) >= 2.0**52)
+    if ambiguous.any():
+        idx = np.flatnonzero(ambiguous)
+        rounded[idx] = [round(v, 8) for v in values[idx].tolist()]
+    return rounded
+
+
+def calculate_position_sizes(
+    balance: float,
+    risk_percent: float,
+    entry_prices: Any,
+    stop_prices: Any,
+    contract_multipliers: Any = 1.0,
+) -> np.ndarray:
+    """Batch version of :func:`calculate_position_size`.
+
+    ``entry_prices``, ``stop_prices`` and ``contract_multipliers`` are
+    broadcast against each other; the result is a float64 array whose
+    elements equal the scalar function called element by element.
+    """
+
+    _require_numpy()
+    entry = np.asarray(entry_prices, dtype=np.float64)
+    stop = np.asarray(stop_prices, dtype=np.float64)
+    multiplier = np.asarray(contract_multipliers, dtype=np.float64)
+    entry, stop, multiplier = np.broadcast_arrays(entry, stop, multiplier)
+
+    risk_budget = balance * risk_percent
+    if risk_budget <= 0:
+        return np.zeros(entry.shape, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        stop_distance = np.abs(entry - stop)
+        valid = (stop_distance > 0) & (multiplier > 0)
+        size = np.zeros(entry.shape, dtype=np.float64)
+        np.divide(risk_budget, stop_distance * multiplier, out=size, where=valid)
+        size = _round8(size)
+        size[~(size > 0)] = 0.0
+    return size
+
+
 class RiskEngine:
     """MVP policy engine for pre-trade risk validation."""
 
     def __init__(self, config: RiskEngineConfig) -> None:
         self.config = config
 
-    def daily_loss_cap_reached(self, state: AccountState) -> bool:
+    def daily_loss_cap_reached(self, state: AccountState | AccountLedger) -> bool:
+        if type(state) is AccountLedger and state.config is self.config:
+            state.roll_if_due()
+            return state.daily_loss_cap_hit
         max_daily_loss = state.start_of_day_equity * self.config.daily_loss_cap_percent
         return abs(min(0.0, state.realized_pnl_today)) >= max_daily_loss
 
-    def kill_switch_active(self, state: AccountState) -> bool:
+    def kill_switch_active(self, state: AccountState | AccountLedger) -> bool:
+        if type(state) is AccountLedger and state.config is self.config:
+            return state.kill_switch
         if state.manual_kill_switch:
             return True
         return state.consecutive_losses >= self.config.max_consecutive_losses
 
     def evaluate_trade(
         self,
-        state: AccountState,
+        state: AccountState | AccountLedger,
         entry_price: float,
         stop_price: float,
         contract_multiplier: float = 1.0,
@@ -96,3 +324,45 @@ class RiskEngine:
             return RiskDecision(False, 0.0, "invalid_position_size")
 
         return RiskDecision(True, size, "ok")
+
+    def evaluate_trades(
+        self,
+        state: AccountState | AccountLedger,
+        entry_prices: Any,
+        stop_prices: Any,
+        contract_multipliers: Any = 1.0,
+    ) -> RiskDecisionBatch:
+        """Evaluate many entry/stop pairs against one account state.
+
+        Account-level gates (kill switch, daily cap) are checked once and
+        applied to the whole batch, exactly as evaluate_trade would per call.
+        """
+
+        _require_numpy()
+        if self.kill_switch_active(state):
+            code = REASON_KILL_SWITCH
+        elif self.daily_loss_cap_reached(state):
+            code = REASON_DAILY_LOSS_CAP
+        else:
+            code = REASON_OK
+
+        if code != REASON_OK:
+            shape = np.broadcast_shapes(
+                np.shape(entry_prices), np.shape(stop_prices), np.shape(contract_multipliers)
+            )
+            return RiskDecisionBatch(
+                allowed=np.zeros(shape, dtype=bool),
+                position_size=np.zeros(shape, dtype=np.float64),
+                reason_code=np.full(shape, code, dtype=np.int8),
+            )
+
+        sizes = calculate_position_sizes(
+            balance=state.start_of_day_equity,
+            risk_percent=self.config.risk_percent,
+            entry_prices=entry_prices,
+            stop_prices=stop_prices,
+            contract_multipliers=contract_multipliers,
+        )
+        allowed = sizes > 0
+        reason_code = np.where(allowed, REASON_OK, REASON_INVALID_SIZE).astype(np.int8)
+        return RiskDecisionBatch(allowed=allowed, position_size=sizes, reason_code=reason_code)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from .core import AccountState, RiskEngine
+from .core import AccountLedger, AccountState, RiskEngine
+from .latency import LatencySnapshot, StageTimers
+from .rules import GuardRule, RuleStats, default_rules
 
 if TYPE_CHECKING:
     from .journal import Journal
@@ -25,6 +29,139 @@ class ExposureState:
     open_risk_percent: float = 0.0
     has_open_position_same_symbol: bool = False
 
+    def has_position(self, symbol: str) -> bool:
+        return self.has_open_position_same_symbol
+
+
+class _OpenPosition:
+    __slots__ = ("entry_price", "stop_price", "size", "contract_multiplier", "risk")
+
+    def __init__(self, entry_price: float, stop_price: float, size: float, contract_multiplier: float) -> None:
+        self.entry_price = entry_price
+        self.stop_price = stop_price
+        self.size = size
+        self.contract_multiplier = contract_multiplier
+        self.risk = abs(entry_price - stop_price) * size * contract_multiplier
+
+
+class ExposureBook:
+    """Open positions keyed by symbol with a running total of open risk.
+
+    Drop-in for ExposureState in PreTradeGuard: the duplicate-symbol check is
+    a dict lookup and open_risk_percent is maintained on every open, partial
+    fill and close instead of being recomputed by the caller. ``version``
+    increases on every change.
+    """
+
+    __slots__ = ("_equity", "_positions", "_open_risk", "version")
+
+    def __init__(self, equity: float) -> None:
+        self._equity = equity
+        self._positions: dict[str, _OpenPosition] = {}
+        self._open_risk = 0.0
+        self.version = 0
+
+    @property
+    def equity(self) -> float:
+        return self._equity
+
+    @equity.setter
+    def equity(self, value: float) -> None:
+        self._equity = value
+        self.version += 1
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def open_risk(self) -> float:
+        return self._open_risk
+
+    @property
+    def open_risk_percent(self) -> float:
+        if self._equity <= 0:
+            return 0.0
+        return self._open_risk / self._equity
+
+    def has_position(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def positions(self) -> list[tuple[str, float, float, float, float]]:
+        """``(symbol, entry_price, stop_price, size, contract_multiplier)`` per open position."""
+        return [
+            (symbol, p.entry_price, p.stop_price, p.size, p.contract_multiplier)
+            for symbol, p in self._positions.items()
+        ]
+
+    def position_risk(self, symbol: str) -> float:
+        pos = self._positions.get(symbol)
+        return pos.risk if pos else 0.0
+
+    def open(
+        self,
+        symbol: str,
+        entry_price: float,
+        stop_price: float,
+        size: float,
+        contract_multiplier: float = 1.0,
+    ) -> None:
+        """Add a fill to the book; repeated fills on a symbol average the entry."""
+        if size <= 0:
+            raise ValueError("size must be positive")
+        pos = self._positions.get(symbol)
+        if pos is None:
+            pos = _OpenPosition(entry_price, stop_price, size, contract_multiplier)
+            self._positions[symbol] = pos
+            self._open_risk += pos.risk
+            self.version += 1
+            return
+
+        total = pos.size + size
+        pos.entry_price = (pos.entry_price * pos.size + entry_price * size) / total
+        pos.stop_price = stop_price
+        pos.size = total
+        self._reprice(pos)
+
+    def move_stop(self, symbol: str, stop_price: float) -> None:
+        pos = self._positions[symbol]
+        pos.stop_price = stop_price
+        self._reprice(pos)
+
+    def reduce(self, symbol: str, size: float) -> None:
+        """Partially close a position; closing the full size removes it."""
+        pos = self._positions[symbol]
+        if size >= pos.size:
+            self.close(symbol)
+            return
+        pos.size -= size
+        self._reprice(pos)
+
+    def close(self, symbol: str) -> None:
+        pos = self._positions.pop(symbol, None)
+        if pos is None:
+            return
+        if self._positions:
+            self._open_risk -= pos.risk
+        else:
+            self._open_risk = 0.0  # drop accumulated float drift
+        self.version += 1
+
+    def _reprice(self, pos: _OpenPosition) -> None:
+        risk = abs(pos.entry_price - pos.stop_price) * pos.size * pos.contract_multiplier
+        self._open_risk += risk - pos.risk
+        pos.risk = risk
+        self.version += 1
+
+    def snapshot(self, symbol: str) -> ExposureState:
+        """Frozen ExposureState as seen by an intent on ``symbol`` (for journaling)."""
+        return ExposureState(
+            open_risk_percent=self.open_risk_percent,
+            has_open_position_same_symbol=symbol in self._positions,
+        )
+
 
 @dataclass(frozen=True)
 class ExecutionDecision:
@@ -34,32 +171,61 @@ class ExecutionDecision:
 
 
 class PreTradeGuard:
-    """Execution-side safety checks layered on top of RiskEngine."""
+    """Execution-side safety checks layered on top of RiskEngine.
+
+    Checks run as an ordered pipeline of GuardRule objects and short-circuit
+    on the first rejection; the RiskEngine evaluation always runs last. With
+    ``instrumented`` on, every rule counts calls/rejections and accumulates
+    perf_counter_ns timings.
+    """
 
-    def __init__(self, risk_engine: RiskEngine) -> None:
+    def __init__(
+        self,
+        risk_engine: RiskEngine,
+        rules: list[GuardRule] | None = None,
+        instrumented: bool = True,
+    ) -> None:
         self.risk_engine = risk_engine
+        self.rules = rules if rules is not None else default_rules()
+        self.instrumented = instrumented
+        self.engine_rule = GuardRule("risk_engine", None)
+        self.rules_version = 0
 
     def evaluate(
         self,
-        state: AccountState,
+        state: AccountState | AccountLedger,
         intent: TradeIntent,
-        exposure: ExposureState,
+        exposure: ExposureState | ExposureBook,
     ) -> ExecutionDecision:
-        if intent.side not in {"long", "short"}:
-            return ExecutionDecision(False, "invalid_side")
-
-        if intent.leverage <= 0:
-            return ExecutionDecision(False, "invalid_leverage")
-
-        if intent.leverage > self.risk_engine.config.max_leverage:
-            return ExecutionDecision(False, "leverage_cap_exceeded")
-
-        if exposure.has_open_position_same_symbol:
-            return ExecutionDecision(False, "duplicate_symbol_position")
-
-        if exposure.open_risk_percent >= self.risk_engine.config.max_open_risk_percent:
-            return ExecutionDecision(False, "max_open_risk_reached")
+        config = self.risk_engine.config
+
+        if not self.instrumented:
+            for rule in self.rules:
+                reason = rule.check(config, state, intent, exposure)
+                if reason is not None:
+                    return ExecutionDecision(False, reason)
+            return self._evaluate_risk(state, intent)
+
+        clock = time.perf_counter_ns
+        for rule in self.rules:
+            t0 = clock()
+            reason = rule.check(config, state, intent, exposure)
+            rule.total_ns += clock() - t0
+            rule.calls += 1
+            if reason is not None:
+                rule.rejections += 1
+                return ExecutionDecision(False, reason)
+
+        engine_rule = self.engine_rule
+        t0 = clock()
+        decision = self._evaluate_risk(state, intent)
+        engine_rule.total_ns += clock() - t0
+        engine_rule.calls += 1
+        if not decision.allowed:
+            engine_rule.rejections += 1
+        return decision
 
+    def _evaluate_risk(self, state: AccountState | AccountLedger, intent: TradeIntent) -> ExecutionDecision:
         rd = self.risk_engine.evaluate_trade(
             state=state,
             entry_price=intent.entry_price,
@@ -72,6 +238,127 @@ class PreTradeGuard:
 
         return ExecutionDecision(True, "ok", suggested_size=rd.position_size)
 
+    def add_rule(self, rule: GuardRule, before: str | None = None) -> None:
+        """Append ``rule`` or insert it ahead of the rule named ``before``."""
+        if before is None:
+            self.rules.append(rule)
+            self.rules_version += 1
+            return
+        for i, existing in enumerate(self.rules):
+            if existing.name == before:
+                self.rules.insert(i, rule)
+                self.rules_version += 1
+                return
+        raise KeyError(before)
+
+    def remove_rule(self, name: str) -> GuardRule:
+        for i, rule in enumerate(self.rules):
+            if rule.name == name:
+                self.rules_version += 1
+                return self.rules.pop(i)
+        raise KeyError(name)
+
+    def reorder_rules(self) -> list[str]:
+        """Sort rules by mean cost per rejection so cheap, frequent rejecters run first.
+
+        Rules that have never rejected keep their relative order at the end.
+        Note that when several rules would reject the same intent, the reported
+        reason can change after reordering.
+        """
+        self.rules.sort(key=GuardRule.cost_per_rejection)
+        self.rules_version += 1
+        return [rule.name for rule in self.rules]
+
+    def rule_stats(self) -> list[RuleStats]:
+        return [rule.stats() for rule in self.rules] + [self.engine_rule.stats()]
+
+    def reset_rule_stats(self) -> None:
+        for rule in self.rules:
+            rule.reset()
+        self.engine_rule.reset()
+
+
+class GuardDecisionCache:
+    """Bounded LRU memo in front of PreTradeGuard.evaluate.
+
+    The key is the intent plus the state it was judged against: frozen
+    AccountState/ExposureState by value, AccountLedger/ExposureBook by
+    identity and ``version``, plus the guard's ``rules_version``. Any fill,
+    PnL update, kill-switch toggle or rule change therefore makes earlier
+    entries unreachable, so a decision is never served for a state it was
+    not computed on. Ledger day rollover is applied before the lookup.
+    """
+
+    def __init__(self, guard: PreTradeGuard, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.guard = guard
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, ExecutionDecision] = OrderedDict()
+        self._last: tuple | None = None
+        self._last_decision: ExecutionDecision | None = None
+
+    @property
+    def risk_engine(self) -> RiskEngine:
+        return self.guard.risk_engine
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def evaluate(
+        self,
+        state: AccountState | AccountLedger,
+        intent: TradeIntent,
+        exposure: ExposureState | ExposureBook,
+    ) -> ExecutionDecision:
+        # Mutable ledgers/books are keyed by identity plus version; frozen
+        # AccountState/ExposureState compare by value and carry no version.
+        if type(state) is AccountLedger:
+            state.roll_if_due()
+            state_version = state.version
+        else:
+            state_version = None
+        exposure_version = exposure.version if type(exposure) is ExposureBook else None
+        rules_version = self.guard.rules_version
+
+        # Retry loops resubmit the very same objects; check them by identity
+        # before paying for hashing the intent.
+        last = self._last
+        if (
+            last is not None
+            and last[0] is intent
+            and last[1] is state
+            and last[2] == state_version
+            and last[3] is exposure
+            and last[4] == exposure_version
+            and last[5] == rules_version
+        ):
+            self.hits += 1
+            return self._last_decision
+
+        key = (intent, state, state_version, exposure, exposure_version, rules_version)
+        entries = self._entries
+        decision = entries.get(key)
+        if decision is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            decision = self.guard.evaluate(state, intent, exposure)
+            entries[key] = decision
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        self._last = key
+        self._last_decision = decision
+        return decision
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last = None
+        self._last_decision = None
+
 
 @dataclass(frozen=True)
 class DraftOrder:
@@ -92,34 +379,70 @@ class ConfirmedOrder:
 
 
 class ExecutionWrapper:
-    """D3 scaffold: build draft order, require explicit pre-trade confirmation."""
+    """D3 scaffold: build draft order, require explicit pre-trade confirmation.
+
+    With ``timing=True`` each stage (guard, journal, id, confirm) is timed
+    into a per-stage latency histogram; see latency_snapshot(). When timing
+    is off the only cost is a ``None`` check per stage.
+    """
 
-    def __init__(self, guard: PreTradeGuard, journal: Journal | None = None) -> None:
+    def __init__(
+        self,
+        guard: PreTradeGuard | GuardDecisionCache,
+        journal: Journal | None = None,
+        timing: bool = False,
+    ) -> None:
         self.guard = guard
         self.journal = journal
+        self.timers: StageTimers | None = StageTimers() if timing else None
+
+    def latency_snapshot(self) -> dict[str, LatencySnapshot]:
+        return self.timers.snapshot() if self.timers else {}
+
+    def reset_latency(self) -> None:
+        if self.timers:
+            self.timers.reset()
 
     def draft_order(
         self,
-        state: AccountState,
+        state: AccountState | AccountLedger,
         intent: TradeIntent,
-        exposure: ExposureState,
+        exposure: ExposureState | ExposureBook,
     ) -> tuple[ExecutionDecision, DraftOrder | None]:
+        timers = self.timers
+        if timers is not None:
+            t = time.perf_counter_ns()
+
         decision = self.guard.evaluate(state=state, intent=intent, exposure=exposure)
+        if timers is not None:
+            t = timers.lap("guard", t)
 
         if self.journal:
+            if isinstance(exposure, ExposureBook):
+                exposure = exposure.snapshot(intent.symbol)
             self.journal.record_decision(decision, intent, exposure)
+            if timers is not None:
+                t = timers.lap("journal", t)
 
         if not decision.allowed:
             return decision, None
 
+        client_order_id = f"draft-{uuid4().hex[:12]}"
+        if timers is not None:
+            t = timers.lap("id", t)
+
         draft = DraftOrder(
             intent=intent,
             size=decision.suggested_size,
-            client_order_id=f"draft-{uuid4().hex[:12]}",
+            client_order_id=client_order_id,
         )
 
         if self.journal:
+            if timers is not None:
+                t = time.perf_counter_ns()
             self.journal.record_draft(draft, decision)
+            if timers is not None:
+                timers.lap("journal", t)
 
         return decision, draft
 
@@ -128,6 +451,10 @@ class ExecutionWrapper:
         draft: DraftOrder | None,
         confirmation_text: str,
     ) -> ConfirmedOrder:
+        timers = self.timers
+        if timers is not None:
+            t = time.perf_counter_ns()
+
         if draft is None:
             if self.journal:
                 self.journal.record_rejection("draft_required")
@@ -140,8 +467,12 @@ class ExecutionWrapper:
             raise ValueError("confirmation_required")
 
         confirmed = ConfirmedOrder(draft=draft, confirmation=ConfirmationToken(value=normalized))
+        if timers is not None:
+            t = timers.lap("confirm", t)
 
         if self.journal:
             self.journal.record_confirmation(confirmed)
+            if timers is not None:
+                timers.lap("journal", t)
 
         return confirmed
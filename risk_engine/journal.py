@@ -7,12 +7,18 @@ for later review and KPI evaluation.
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from .journal_codec import encode_line, to_dict
+
+if TYPE_CHECKING:
+    from .journal_writer import JournalWriter
+
 
 @dataclass(frozen=True)
 class JournalEntry:
@@ -23,13 +29,57 @@ class JournalEntry:
     metadata: dict[str, Any] | None = None
 
 
+def encode_entry(entry: JournalEntry) -> str:
+    """One JSONL line (without newline) for ``entry``."""
+    if type(entry) is not JournalEntry:
+        return json.dumps(asdict(entry))
+    return encode_line(entry.id, entry.timestamp, entry.event_type, entry.data, entry.metadata)
+
+
+def decision_data(decision: Any, intent: Any | None = None, exposure: Any | None = None) -> dict[str, Any]:
+    return {
+        "allowed": getattr(decision, "allowed", None),
+        "reason": getattr(decision, "reason", None),
+        "suggested_size": getattr(decision, "suggested_size", None),
+        "intent": to_dict(intent) if intent else None,
+        "exposure": to_dict(exposure) if exposure else None,
+    }
+
+
+def draft_data(draft: Any, decision: Any) -> dict[str, Any]:
+    return {
+        "client_order_id": getattr(draft, "client_order_id", None),
+        "size": getattr(draft, "size", None),
+        "intent": to_dict(getattr(draft, "intent", None)) if hasattr(draft, "intent") else None,
+        "decision_reason": getattr(decision, "reason", None),
+    }
+
+
 class Journal:
-    """Simple append-only journal for execution decisions."""
+    """Simple append-only journal for execution decisions.
+
+    By default entries are buffered in memory until flush_to_file(). With a
+    ``writer`` (see JournalWriter) record() only enqueues the entry and a
+    background thread serializes and writes it; ``data`` and ``metadata``
+    are shallow-copied first, so the caller may reuse its dicts, but nested
+    values must not be mutated after record() returns.
+
+    Listeners registered with subscribe() are called with every recorded
+    entry, synchronously and in registration order.
+    """
 
-    def __init__(self, log_dir: str = "journal_logs") -> None:
+    def __init__(self, log_dir: str = "journal_logs", writer: JournalWriter | None = None) -> None:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._buffer: list[JournalEntry] = []
+        self._writer = writer
+        self._listeners: list[Callable[[JournalEntry], None]] = []
+
+    def subscribe(self, listener: Callable[[JournalEntry], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[JournalEntry], None]) -> None:
+        self._listeners.remove(listener)
 
     def _utcnow(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -43,6 +93,10 @@ class Journal:
         data: dict[str, Any],
         metadata: dict[str, Any] | None = None,
     ) -> JournalEntry:
+        if self._writer is not None:
+            # Serialized later on the writer thread: don't share the caller's dicts.
+            data = dict(data)
+            metadata = dict(metadata) if metadata is not None else None
         entry = JournalEntry(
             id=self._new_id(),
             timestamp=self._utcnow(),
@@ -50,7 +104,12 @@ class Journal:
             data=data,
             metadata=metadata,
         )
-        self._buffer.append(entry)
+        if self._writer is not None:
+            self._writer.submit(entry)
+        else:
+            self._buffer.append(entry)
+        for listener in self._listeners:
+            listener(entry)
         return entry
 
     def record_decision(
@@ -59,27 +118,10 @@ class Journal:
         intent: Any | None = None,
         exposure: Any | None = None,
     ) -> JournalEntry:
-        return self.record(
-            event_type="decision",
-            data={
-                "allowed": getattr(decision, "allowed", None),
-                "reason": getattr(decision, "reason", None),
-                "suggested_size": getattr(decision, "suggested_size", None),
-                "intent": asdict(intent) if intent else None,
-                "exposure": asdict(exposure) if exposure else None,
-            },
-        )
+        return self.record(event_type="decision", data=decision_data(decision, intent, exposure))
 
     def record_draft(self, draft: Any, decision: Any) -> JournalEntry:
-        return self.record(
-            event_type="draft_order",
-            data={
-                "client_order_id": getattr(draft, "client_order_id", None),
-                "size": getattr(draft, "size", None),
-                "intent": asdict(getattr(draft, "intent", None)) if hasattr(draft, "intent") else None,
-                "decision_reason": getattr(decision, "reason", None),
-            },
-        )
+        return self.record(event_type="draft_order", data=draft_data(draft, decision))
 
     def record_confirmation(self, confirmed: Any) -> JournalEntry:
         draft = getattr(confirmed, "draft", None)
@@ -95,6 +137,55 @@ class Journal:
             },
         )
 
+    def record_fill(
+        self,
+        client_order_id: str | None,
+        symbol: str,
+        side: str,
+        price: float,
+        size: float,
+        fee: float = 0.0,
+        slippage: float = 0.0,
+    ) -> JournalEntry:
+        """An execution reported by the exchange; ``slippage`` is its cost vs the intended price."""
+        return self.record(
+            event_type="fill",
+            data={
+                "client_order_id": client_order_id,
+                "symbol": symbol,
+                "side": side,
+                "price": price,
+                "size": size,
+                "fee": fee,
+                "slippage": slippage,
+            },
+        )
+
+    def record_closed_trade(
+        self,
+        symbol: str,
+        pnl: float,
+        funding: float = 0.0,
+        client_order_id: str | None = None,
+    ) -> JournalEntry:
+        """A closed position: gross ``pnl`` before costs, ``funding`` paid while it was open."""
+        return self.record(
+            event_type="trade_closed",
+            data={
+                "client_order_id": client_order_id,
+                "symbol": symbol,
+                "pnl": pnl,
+                "funding": funding,
+            },
+        )
+
+    def record_risk_control(self, action: str, details: dict[str, Any] | None = None) -> JournalEntry:
+        """Operator action on the account: kill_switch_on, kill_switch_off or reset_loss_streak."""
+        return self.record(
+            event_type="risk_control",
+            data={"action": action, "details": details or {}},
+        )
+
     def record_rejection(self, reason: str, details: dict[str, Any] | None = None) -> JournalEntry:
         return self.record(
             event_type="rejection",
@@ -102,6 +193,11 @@ class Journal:
         )
 
     def flush_to_file(self, filename: str | None = None) -> Path:
+        if self._writer is not None:
+            # The background writer owns its file; wait for it to catch up.
+            self._writer.flush()
+            return self._writer.path
+
         if not self._buffer:
             return Path(filename or "empty.json")
 
@@ -110,10 +206,17 @@ class Journal:
 
         with fpath.open("a", encoding="utf-8") as f:
             for entry in self._buffer:
-                f.write(json.dumps(asdict(entry)) + "\n")
+                f.write(encode_entry(entry) + "\n")
 
         self._buffer.clear()
         return fpath
 
     def pending_count(self) -> int:
+        if self._writer is not None:
+            return self._writer.pending()
         return len(self._buffer)
+
+    def close(self) -> None:
+        """Drain and stop the background writer, if any."""
+        if self._writer is not None:
+            self._writer.close()
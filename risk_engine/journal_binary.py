@@ -0,0 +1,535 @@
+"""Compact binary log for high-rate decision and draft events.
+
+JSONL spends most of its bytes and CPU on the uuid hex id, the ISO
+timestamp and nested dict keys. This format stores each ``decision`` /
+``draft_order`` event as one fixed-width 104-byte little-endian record:
+
+    id 16s | ts_ns i8 | event u1 | flags u1 | side u1 | allowed i1 |
+    symbol u2 | reason u2 | size f8 | entry_price f8 | stop_price f8 |
+    leverage f8 | contract_multiplier f8 | open_risk_percent f8 |
+    client_order_id 24s
+
+after a 16-byte header (MAGIC, record size). Symbol, side and reason are
+dictionary codes into a ``<file>.dict.json`` sidecar. It is rewritten
+before any record that uses a new value is written. Fixed-width records
+keep the file append-only and map one-to-one onto a NumPy structured dtype.
+read_events() therefore returns zero-copy column views over an mmap of
+the file.
+
+jsonl_to_binary() / binary_to_jsonl() convert between this format and
+Journal JSONL. An entry is only converted if it comes back byte-identical
+(e.g. an ``int`` price would come back as a float); the rest are skipped
+and counted.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .core import _require_numpy
+from .journal import Journal, JournalEntry, decision_data, draft_data, encode_entry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b"BJCOL001"
+_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct("<16sqBBBbHHdddddd24s")
+RECORD_FIELDS = [
+    ("id", "S16"),
+    ("ts_ns", "<i8"),
+    ("event", "u1"),
+    ("flags", "u1"),
+    ("side", "u1"),
+    ("allowed", "i1"),
+    ("symbol", "<u2"),
+    ("reason", "<u2"),
+    ("size", "<f8"),
+    ("entry_price", "<f8"),
+    ("stop_price", "<f8"),
+    ("leverage", "<f8"),
+    ("contract_multiplier", "<f8"),
+    ("open_risk_percent", "<f8"),
+    ("client_order_id", "S24"),
+]
+
+EVENT_DECISION = 0
+EVENT_DRAFT = 1
+EVENT_TYPES = ("decision", "draft_order")
+
+FLAG_INTENT = 1
+FLAG_EXPOSURE = 2
+FLAG_HAS_POSITION = 4
+FLAG_SIZE_NONE = 8
+FLAG_COID_NONE = 16
+
+NONE_CODE = 0xFFFF  # symbol / reason is None
+NONE_SIDE = 0xFF
+_NAN = float("nan")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# (event, ts_ns, id, allowed, reason, size, intent, exposure, client_order_id)
+# intent: (symbol, side, entry_price, stop_price, leverage, contract_multiplier)
+# exposure: (open_risk_percent, has_open_position_same_symbol)
+EventArgs = tuple[Any, ...]
+
+
+def iso_to_ns(timestamp: str) -> int:
+    delta = datetime.fromisoformat(timestamp) - _EPOCH
+    return (delta // timedelta(microseconds=1)) * 1_000
+
+
+_last_second: tuple[int, str] = (0, _EPOCH.isoformat()[:19])
+
+
+def ns_to_iso(ts_ns: int) -> str:
+    """UTC ISO timestamp as Journal writes it (microsecond precision)."""
+    global _last_second
+    second, micros = divmod(ts_ns // 1_000, 1_000_000)
+    cached, prefix = _last_second
+    if cached != second:
+        # Consecutive records mostly share a second; format the date part once per second.
+        prefix = (_EPOCH + timedelta(seconds=second)).isoformat()[:19]
+        _last_second = (second, prefix)
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return prefix + "+00:00"  # datetime.isoformat() omits a zero microsecond field
+
+
+def record_dtype() -> np.dtype:
+    _require_numpy()
+    return np.dtype(RECORD_FIELDS)
+
+
+class _Dictionary:
+    __slots__ = ("values", "codes", "none")
+
+    def __init__(self, values: list[str], none: int) -> None:
+        self.values = values
+        self.codes = {v: i for i, v in enumerate(values)}
+        self.none = none
+
+    def code(self, value: str | None) -> int:
+        if value is None:
+            return self.none
+        code = self.codes.get(value)
+        if code is None:
+            if not isinstance(value, str):
+                raise TypeError("dictionary values must be str")
+            code = len(self.values)
+            if code >= self.none:
+                raise ValueError("dictionary_full")
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+
+@dataclass
+class _Dictionaries:
+    symbols: _Dictionary
+    reasons: _Dictionary
+    sides: _Dictionary
+
+    @classmethod
+    def load(cls, raw: dict[str, list[str]] | None = None) -> _Dictionaries:
+        raw = raw or {}
+        return cls(
+            _Dictionary(list(raw.get("symbols", [])), NONE_CODE),
+            _Dictionary(list(raw.get("reasons", [])), NONE_CODE),
+            _Dictionary(list(raw.get("sides", [])), NONE_SIDE),
+        )
+
+    def size(self) -> int:
+        return len(self.symbols.values) + len(self.reasons.values) + len(self.sides.values)
+
+    def to_json(self) -> dict[str, list[str]]:
+        return {"symbols": self.symbols.values, "reasons": self.reasons.values, "sides": self.sides.values}
+
+
+def _pack(args: EventArgs, dicts: _Dictionaries) -> bytes:
+    event, ts_ns, entry_id, allowed, reason, size, intent, exposure, coid = args
+    flags = 0
+    if size is None:
+        flags |= FLAG_SIZE_NONE
+        size = _NAN
+    symbol = side = None
+    prices = (_NAN, _NAN, _NAN, _NAN)
+    if intent is not None:
+        flags |= FLAG_INTENT
+        symbol, side, *prices = intent
+    open_risk = _NAN
+    if exposure is not None:
+        flags |= FLAG_EXPOSURE
+        open_risk = exposure[0]
+        if exposure[1]:
+            flags |= FLAG_HAS_POSITION
+    coid_bytes = b""
+    if coid is None:
+        flags |= FLAG_COID_NONE
+    else:
+        coid_bytes = coid.encode("ascii")
+        if len(coid_bytes) > 24:
+            raise ValueError("client_order_id_too_long")
+    return _RECORD.pack(
+        entry_id,
+        ts_ns,
+        event,
+        flags,
+        dicts.sides.code(side),
+        -1 if allowed is None else int(allowed),
+        dicts.symbols.code(symbol),
+        dicts.reasons.code(reason),
+        size,
+        *prices,
+        open_risk,
+        coid_bytes,
+    )
+
+
+def _decode(record: tuple[Any, ...], dicts: _Dictionaries) -> JournalEntry:
+    entry_id, ts_ns, event, flags, side, allowed, symbol, reason, size, *rest = record
+    entry_price, stop_price, leverage, multiplier, open_risk, coid = rest
+    symbols, reasons, sides = dicts.symbols.values, dicts.reasons.values, dicts.sides.values
+    intent = None
+    if flags & FLAG_INTENT:
+        intent = {
+            "symbol": None if symbol == NONE_CODE else symbols[symbol],
+            "side": None if side == NONE_SIDE else sides[side],
+            "entry_price": entry_price,
+            "stop_price": stop_price,
+            "leverage": leverage,
+            "contract_multiplier": multiplier,
+        }
+    reason_value = None if reason == NONE_CODE else reasons[reason]
+    size_value = None if flags & FLAG_SIZE_NONE else size
+    if event == EVENT_DECISION:
+        data = {
+            "allowed": None if allowed < 0 else bool(allowed),
+            "reason": reason_value,
+            "suggested_size": size_value,
+            "intent": intent,
+            "exposure": {
+                "open_risk_percent": open_risk,
+                "has_open_position_same_symbol": bool(flags & FLAG_HAS_POSITION),
+            }
+            if flags & FLAG_EXPOSURE
+            else None,
+        }
+    else:
+        data = {
+            "client_order_id": None if flags & FLAG_COID_NONE else coid.rstrip(b"\0").decode("ascii"),
+            "size": size_value,
+            "intent": intent,
+            "decision_reason": reason_value,
+        }
+    return JournalEntry(entry_id.hex(), ns_to_iso(ts_ns), EVENT_TYPES[event], data)
+
+
+def _intent_args(intent: Any) -> tuple[Any, ...]:
+    return (
+        intent.symbol,
+        intent.side,
+        intent.entry_price,
+        intent.stop_price,
+        intent.leverage,
+        intent.contract_multiplier,
+    )
+
+
+def entry_args(entry: JournalEntry) -> EventArgs | None:
+    """Record fields for ``entry``, or None if it would not round-trip byte-identically."""
+    if entry.metadata is not None or entry.event_type not in EVENT_TYPES:
+        return None
+    try:
+        entry_id = bytes.fromhex(entry.id)
+        ts_ns = iso_to_ns(entry.timestamp)
+        data = entry.data
+        intent = data["intent"]
+        intent_args = None
+        if intent is not None:
+            intent_args = tuple(
+                intent[k] for k in ("symbol", "side", "entry_price", "stop_price", "leverage", "contract_multiplier")
+            )
+        if entry.event_type == "decision":
+            exposure = data["exposure"]
+            exposure_args = None
+            if exposure is not None:
+                exposure_args = (exposure["open_risk_percent"], exposure["has_open_position_same_symbol"])
+            args = (EVENT_DECISION, ts_ns, entry_id, data["allowed"], data["reason"],
+                    data["suggested_size"], intent_args, exposure_args, None)
+        else:
+            args = (EVENT_DRAFT, ts_ns, entry_id, None, data["decision_reason"],
+                    data["size"], intent_args, None, data["client_order_id"])
+        scratch = _Dictionaries.load()
+        decoded = _decode(_RECORD.unpack(_pack(args, scratch)), scratch)
+    except (KeyError, TypeError, ValueError, AttributeError, struct.error, UnicodeError):
+        return None
+    return args if encode_entry(decoded) == encode_entry(entry) else None
+
+
+def dictionary_path(path: Path) -> Path:
+    return path.with_name(path.name + ".dict.json")
+
+
+def _load_dictionaries(path: Path) -> _Dictionaries:
+    try:
+        return _Dictionaries.load(json.loads(dictionary_path(path).read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return _Dictionaries.load()
+
+
+class BinaryEventLog:
+    """Append-only writer; records are buffered and written every ``flush_every`` events or on flush()."""
+
+    def __init__(self, path: str | Path, flush_every: int = 4_096) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self._dicts = _load_dictionaries(self.path)
+        self._dict_size = self._dicts.size()
+        self._buffer = bytearray()
+        self._pending = 0
+
+        self._file = self.path.open("ab")
+        size = self._file.tell()
+        if size < _HEADER.size:
+            self._file.truncate(0)
+            self._file.write(_HEADER.pack(MAGIC, _RECORD.size, 0))
+            self._file.flush()
+            size = _HEADER.size
+        usable = size - (size - _HEADER.size) % _RECORD.size
+        if usable != size:  # drop a torn record left by a crash
+            self._file.truncate(usable)
+        self.count = (usable - _HEADER.size) // _RECORD.size
+
+    def append(self, args: EventArgs) -> None:
+        self._buffer += _pack(args, self._dicts)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def append_decision(
+        self,
+        decision: Any,
+        intent: Any | None = None,
+        exposure: Any | None = None,
+        ts_ns: int | None = None,
+        entry_id: bytes | None = None,
+    ) -> None:
+        self.append(
+            (
+                EVENT_DECISION,
+                time.time_ns() if ts_ns is None else ts_ns,
+                os.urandom(16) if entry_id is None else entry_id,
+                getattr(decision, "allowed", None),
+                getattr(decision, "reason", None),
+                getattr(decision, "suggested_size", None),
+                _intent_args(intent) if intent else None,
+                (exposure.open_risk_percent, exposure.has_open_position_same_symbol) if exposure else None,
+                None,
+            )
+        )
+
+    def append_draft(
+        self,
+        draft: Any,
+        decision: Any,
+        ts_ns: int | None = None,
+        entry_id: bytes | None = None,
+    ) -> None:
+        self.append(
+            (
+                EVENT_DRAFT,
+                time.time_ns() if ts_ns is None else ts_ns,
+                os.urandom(16) if entry_id is None else entry_id,
+                None,
+                getattr(decision, "reason", None),
+                getattr(draft, "size", None),
+                _intent_args(draft.intent),
+                None,
+                getattr(draft, "client_order_id", None),
+            )
+        )
+
+    def append_entry(self, entry: JournalEntry) -> None:
+        """Append a decision/draft_order entry; ValueError if it does not fit the format."""
+        args = entry_args(entry)
+        if args is None:
+            raise ValueError("entry_not_representable")
+        self.append(args)
+
+    def flush(self) -> None:
+        size = self._dicts.size()
+        if size != self._dict_size:
+            # Dictionary first: a record on disk must never reference an unknown code.
+            target = dictionary_path(self.path)
+            tmp = target.with_name(target.name + ".tmp")
+            tmp.write_text(json.dumps(self._dicts.to_json()), encoding="utf-8")
+            os.replace(tmp, target)
+            self._dict_size = size
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self.count += self._pending
+            self._buffer.clear()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+def _check_header(header: bytes, path: Path) -> None:
+    magic, record_size, _ = _HEADER.unpack(header)
+    if magic != MAGIC or record_size != _RECORD.size:
+        raise ValueError(f"{path} is not a binary event log")
+
+
+@dataclass(frozen=True)
+class EventColumns:
+    """Structured record array over the mapped file plus the code dictionaries."""
+
+    records: np.ndarray
+    symbols: list[str]
+    reasons: list[str]
+    sides: list[str]
+
+    def __len__(self) -> int:
+        return int(self.records.shape[0])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.records[column]
+
+    def symbol_code(self, symbol: str) -> int:
+        """Code of ``symbol`` (NONE_CODE if it never occurs), for masks like ``ev["symbol"] == code``."""
+        try:
+            return self.symbols.index(symbol)
+        except ValueError:
+            return NONE_CODE
+
+    def reason_code(self, reason: str) -> int:
+        try:
+            return self.reasons.index(reason)
+        except ValueError:
+            return NONE_CODE
+
+    def entries(self) -> Iterator[JournalEntry]:
+        dicts = _Dictionaries.load({"symbols": self.symbols, "reasons": self.reasons, "sides": self.sides})
+        # Unpack the raw bytes: NumPy strips trailing NULs from S16 ids.
+        for record in _RECORD.iter_unpack(self.records.tobytes()):
+            yield _decode(record, dicts)
+
+
+def read_events(path: str | Path) -> EventColumns:
+    """Zero-copy view of a binary event log (columns are views into the mmapped file)."""
+    _require_numpy()
+    path = Path(path)
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _check_header(mm[: _HEADER.size], path)
+    count = (len(mm) - _HEADER.size) // _RECORD.size
+    records = np.frombuffer(mm, dtype=record_dtype(), count=count, offset=_HEADER.size)
+    dicts = _load_dictionaries(path)
+    return EventColumns(records, dicts.symbols.values, dicts.reasons.values, dicts.sides.values)
+
+
+def iter_events(path: str | Path) -> Iterator[JournalEntry]:
+    """Decode a binary event log back into JournalEntry objects (no NumPy needed)."""
+    path = Path(path)
+    dicts = _load_dictionaries(path)
+    with path.open("rb") as f:
+        _check_header(f.read(_HEADER.size), path)
+        while True:
+            chunk = f.read(_RECORD.size * 4_096)
+            usable = len(chunk) - len(chunk) % _RECORD.size
+            for record in _RECORD.iter_unpack(chunk[:usable]):
+                yield _decode(record, dicts)
+            if len(chunk) < _RECORD.size * 4_096:
+                return
+
+
+def jsonl_to_binary(source: str | Path | Iterable[str | Path], dest: str | Path) -> tuple[int, int]:
+    """Append decision/draft entries from JSONL journal(s) to ``dest``; returns (converted, skipped)."""
+    from .journal_reader import read_journal
+
+    converted = skipped = 0
+    log = BinaryEventLog(dest)
+    try:
+        for entry in read_journal(source):
+            if entry.event_type not in EVENT_TYPES:
+                continue
+            args = entry_args(entry)
+            if args is None:
+                skipped += 1
+                continue
+            log.append(args)
+            converted += 1
+    finally:
+        log.close()
+    return converted, skipped
+
+
+def binary_to_jsonl(source: str | Path, dest: str | Path) -> int:
+    """Write every record of a binary event log as Journal JSONL; returns the count."""
+    count = 0
+    with Path(dest).open("a", encoding="utf-8") as f:
+        for entry in iter_events(source):
+            f.write(encode_entry(entry) + "\n")
+            count += 1
+    return count
+
+
+class BinaryJournal(Journal):
+    """Journal that writes decision/draft events to a BinaryEventLog.
+
+    Other events keep the JSONL path. record_decision() and record_draft()
+    return the same JournalEntry Journal would, built from the record's own
+    timestamp and id (so it matches what iter_events() decodes later).
+    """
+
+    def __init__(self, log_dir: str = "journal_logs", filename: str = "events.bin", flush_every: int = 4_096) -> None:
+        super().__init__(log_dir=log_dir)
+        self.events = BinaryEventLog(self.log_dir / filename, flush_every=flush_every)
+
+    def _entry(self, event_type: str, ts_ns: int, entry_id: bytes, data: dict[str, Any]) -> JournalEntry:
+        entry = JournalEntry(entry_id.hex(), ns_to_iso(ts_ns), event_type, data)
+        for listener in self._listeners:
+            listener(entry)
+        return entry
+
+    def record_decision(
+        self,
+        decision: Any,
+        intent: Any | None = None,
+        exposure: Any | None = None,
+    ) -> JournalEntry:
+        ts_ns, entry_id = time.time_ns(), os.urandom(16)
+        self.events.append_decision(decision, intent, exposure, ts_ns, entry_id)
+        return self._entry("decision", ts_ns, entry_id, decision_data(decision, intent, exposure))
+
+    def record_draft(self, draft: Any, decision: Any) -> JournalEntry:
+        ts_ns, entry_id = time.time_ns(), os.urandom(16)
+        self.events.append_draft(draft, decision, ts_ns, entry_id)
+        return self._entry("draft_order", ts_ns, entry_id, draft_data(draft, decision))
+
+    def flush_to_file(self, filename: str | None = None) -> Path:
+        self.events.flush()
+        return super().flush_to_file(filename)
+
+    def pending_count(self) -> int:
+        return super().pending_count() + self.events._pending
+
+    def close(self) -> None:
+        self.events.close()
+        super().close()
@@ -0,0 +1,276 @@
+"""Streaming journal reader and query engine.
+
+read_journal() is a generator over JournalEntry objects from plain JSONL
+files, sealed segments (see journal_segments) and plain ``.jsonl.gz``
+files, filtered by event type, time range, symbol and client_order_id.
+Memory use is independent of journal size:
+
+- plain JSONL is mmapped and scanned line by line; a line is only parsed
+  once a cheap byte search finds every requested value in it
+- a sparse line-offset index (one ``(offset, timestamp)`` sample every
+  ``stride`` lines, cached next to the file as ``<name>.idx``) lets a time
+  range seek straight to its first candidate line and stop early
+- sealed segments are skipped or read block-wise using their footer index
+
+Seeking assumes entries were appended in time order, which holds for
+Journal output; pass ``use_index=False`` to force full scans.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import mmap
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .journal import JournalEntry
+from .journal_segments import MAGIC, iter_sealed_lines, read_footer
+
+INDEX_SUFFIX = ".idx"
+_TS_KEY = b'"timestamp"'
+
+
+@dataclass(frozen=True)
+class JournalQuery:
+    event_type: str | None = None
+    since: str | None = None  # inclusive, ISO-8601 UTC
+    until: str | None = None  # exclusive
+    symbol: str | None = None
+    client_order_id: str | None = None
+    needles: tuple[bytes, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # json.dumps of a value is exactly how it appears in the line, so a
+        # missing needle means the line cannot match.
+        values = (self.event_type, self.symbol, self.client_order_id)
+        object.__setattr__(
+            self, "needles", tuple(json.dumps(v).encode("utf-8") for v in values if v is not None)
+        )
+
+    def prefilter(self, line: bytes) -> bool:
+        for needle in self.needles:
+            if needle not in line:
+                return False
+        return True
+
+    def matches(self, obj: dict[str, Any]) -> bool:
+        if self.event_type is not None and obj.get("event_type") != self.event_type:
+            return False
+        ts = obj.get("timestamp", "")
+        if self.since is not None and ts < self.since:
+            return False
+        if self.until is not None and ts >= self.until:
+            return False
+        data = obj.get("data") or {}
+        if self.symbol is not None and entry_symbol(data) != self.symbol:
+            return False
+        if self.client_order_id is not None and entry_client_order_id(data) != self.client_order_id:
+            return False
+        return True
+
+
+def entry_symbol(data: dict[str, Any]) -> str | None:
+    symbol = data.get("symbol")
+    if symbol is None:
+        intent = data.get("intent")
+        if isinstance(intent, dict):
+            symbol = intent.get("symbol")
+    return symbol
+
+
+def entry_client_order_id(data: dict[str, Any]) -> str | None:
+    coid = data.get("client_order_id")
+    if coid is None:
+        details = data.get("details")
+        if isinstance(details, dict):
+            coid = details.get("draft_id")
+    return coid
+
+
+def _line_timestamp(line: bytes) -> str:
+    pos = line.find(_TS_KEY)
+    if pos < 0:
+        return ""
+    start = line.find(b'"', pos + len(_TS_KEY)) + 1
+    end = line.find(b'"', start)
+    return line[start:end].decode("utf-8") if start > 0 and end > start else ""
+
+
+class LineIndex:
+    """Sparse ``(byte offset, timestamp)`` samples of a JSONL file."""
+
+    __slots__ = ("stride", "offsets", "timestamps", "size", "lines")
+
+    def __init__(self, stride: int = 1_024) -> None:
+        self.stride = stride
+        self.offsets: list[int] = []
+        self.timestamps: list[str] = []
+        self.size = 0  # bytes covered (always ends on a line boundary)
+        self.lines = 0
+
+    @classmethod
+    def load(cls, path: Path) -> LineIndex | None:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        index = cls(raw["stride"])
+        index.offsets = raw["offsets"]
+        index.timestamps = raw["timestamps"]
+        index.size = raw["size"]
+        index.lines = raw["lines"]
+        return index
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "stride": self.stride,
+            "offsets": self.offsets,
+            "timestamps": self.timestamps,
+            "size": self.size,
+            "lines": self.lines,
+        }
+        try:
+            path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        except OSError:
+            pass  # read-only journal dirs still work, just without a cached index
+
+    def extend(self, mm: mmap.mmap) -> bool:
+        """Index lines appended since the last call. Returns True if anything changed."""
+        size = len(mm)
+        if size < self.size:  # file was truncated/replaced: start over
+            self.offsets, self.timestamps, self.size, self.lines = [], [], 0, 0
+        pos = self.size
+        changed = False
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                break  # partial last line; index it once complete
+            if self.lines % self.stride == 0:
+                self.offsets.append(pos)
+                self.timestamps.append(_line_timestamp(mm[pos:end]))
+            self.lines += 1
+            pos = end + 1
+            changed = True
+        self.size = pos
+        return changed
+
+    def range_for(self, since: str | None, until: str | None, size: int) -> tuple[int, int]:
+        """Byte range of a ``size``-byte file that can hold entries in ``[since, until)``."""
+        start, stop = 0, size
+        if since is not None and self.timestamps:
+            i = bisect.bisect_left(self.timestamps, since)
+            start = self.offsets[i - 1] if i > 0 else 0
+        if until is not None and self.timestamps:
+            j = bisect.bisect_left(self.timestamps, until)
+            if j < len(self.offsets):
+                stop = self.offsets[j]
+        return start, stop
+
+
+def _index_for(path: Path, mm: mmap.mmap, stride: int) -> LineIndex:
+    idx_path = path.with_name(path.name + INDEX_SUFFIX)
+    index = LineIndex.load(idx_path)
+    if index is None or index.stride != stride:
+        index = LineIndex(stride)
+    if index.extend(mm):
+        index.save(idx_path)
+    return index
+
+
+def _iter_jsonl(path: Path, query: JournalQuery, use_index: bool, stride: int) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with mm:
+            start, stop = 0, len(mm)
+            if use_index and (query.since is not None or query.until is not None):
+                start, stop = _index_for(path, mm, stride).range_for(query.since, query.until, len(mm))
+            pos = start
+            prefilter = query.prefilter
+            while pos < stop:
+                end = mm.find(b"\n", pos, stop)
+                if end < 0:
+                    break  # partial last line still being written
+                if end > pos:
+                    line = mm[pos:end]
+                    if prefilter(line):
+                        yield line
+                pos = end + 1
+
+
+def _is_sealed(path: Path) -> bool:
+    try:
+        with path.open("rb") as f:
+            f.seek(-len(MAGIC), 2)
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _iter_gz(path: Path, query: JournalQuery) -> Iterator[bytes]:
+    if _is_sealed(path):
+        footer = read_footer(path)
+        if not footer.overlaps(query.since, query.until):
+            return
+        if query.event_type is not None and not footer.has_event(query.event_type):
+            return
+        lines: Iterable[bytes] = iter_sealed_lines(path, query.since, query.until)
+        prefilter = query.prefilter
+        for line in lines:
+            if prefilter(line):
+                yield line
+        return
+
+    with gzip.open(path, "rb") as f:
+        prefilter = query.prefilter
+        for line in f:
+            if prefilter(line):
+                yield line
+
+
+def journal_files(source: str | Path | Iterable[str | Path]) -> list[Path]:
+    """Journal files under a directory (oldest first by name), or the given file(s)."""
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.is_dir():
+            files = [p for p in path.iterdir() if p.name.endswith((".jsonl", ".jsonl.gz"))]
+            return sorted(files, key=lambda p: p.name)
+        return [path]
+    return [Path(p) for p in source]
+
+
+def read_journal(
+    source: str | Path | Iterable[str | Path],
+    event_type: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    symbol: str | None = None,
+    client_order_id: str | None = None,
+    use_index: bool = True,
+    stride: int = 1_024,
+) -> Iterator[JournalEntry]:
+    """Yield matching entries from ``source`` in file order."""
+    query = JournalQuery(event_type, since, until, symbol, client_order_id)
+    for path in journal_files(source):
+        if path.name.endswith(".gz"):
+            lines = _iter_gz(path, query)
+        else:
+            lines = _iter_jsonl(path, query, use_index, stride)
+        for line in lines:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            if query.matches(obj):
+                yield JournalEntry(
+                    id=obj["id"],
+                    timestamp=obj["timestamp"],
+                    event_type=obj["event_type"],
+                    data=obj["data"],
+                    metadata=obj.get("metadata"),
+                )
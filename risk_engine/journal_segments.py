@@ -0,0 +1,350 @@
+"""Segmented, rotating and compressed journal storage.
+
+Entries are appended as JSONL to an active segment ``segment-NNNNNN.jsonl``.
+The segment rolls over once it exceeds ``max_segment_bytes`` or has been
+open for ``max_segment_age_s``; the sealed segment is rewritten as
+``segment-NNNNNN.jsonl.gz`` and the raw file removed.
+
+A sealed segment is a multi-member gzip file (``zcat`` reads it) made of
+independently compressed blocks of ``block_lines`` lines, followed by a
+footer::
+
+    [gzip block 0][gzip block 1]...[footer JSON][u64 footer length][MAGIC]
+
+The footer holds the segment's time range, event-type counts and, per
+block, its compressed byte offset/length, uncompressed offset, time range
+and line count. Readers use it to skip whole segments, or seek straight to
+the blocks that overlap a time window, without decompressing anything else.
+Retention (``retention_bytes`` / ``retention_segments``) deletes the oldest
+sealed segments so disk usage stays bounded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .journal import Journal, JournalEntry, encode_entry
+
+MAGIC = b"BJSEG001"
+_TRAILER = struct.Struct(">Q8s")
+SEGMENT_PREFIX = "segment-"
+
+
+@dataclass(frozen=True)
+class SegmentBlock:
+    offset: int  # compressed byte offset in the segment file
+    length: int  # compressed byte length
+    raw_offset: int  # offset of the block's first line in the uncompressed stream
+    count: int
+    first_ts: str
+    last_ts: str
+
+
+@dataclass(frozen=True)
+class SegmentFooter:
+    count: int
+    first_ts: str | None
+    last_ts: str | None
+    event_counts: dict[str, int]
+    blocks: list[SegmentBlock]
+    data_length: int
+
+    def overlaps(self, since: str | None = None, until: str | None = None) -> bool:
+        """True if any entry could fall in ``[since, until)``."""
+        if self.first_ts is None:
+            return False
+        if since is not None and self.last_ts < since:
+            return False
+        if until is not None and self.first_ts >= until:
+            return False
+        return True
+
+    def has_event(self, event_type: str) -> bool:
+        return self.event_counts.get(event_type, 0) > 0
+
+
+def _gzip_member(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    return compressor.compress(data) + compressor.flush()
+
+
+def seal_segment(raw_path: str | Path, block_lines: int = 1_000) -> Path:
+    """Compress a raw JSONL segment into block-gzip form with a footer index."""
+    raw_path = Path(raw_path)
+    sealed_path = raw_path.with_name(raw_path.name + ".gz")
+    tmp_path = sealed_path.with_name(sealed_path.name + ".tmp")
+
+    event_counts: Counter[str] = Counter()
+    blocks: list[SegmentBlock] = []
+    first_ts: str | None = None
+    last_ts: str | None = None
+    total = 0
+    raw_offset = 0
+    offset = 0
+
+    with raw_path.open("rb") as src, tmp_path.open("wb") as dst:
+
+        def emit(lines: list[bytes], block_first: str, block_last: str) -> None:
+            nonlocal offset, raw_offset
+            payload = b"".join(lines)
+            member = _gzip_member(payload)
+            dst.write(member)
+            blocks.append(SegmentBlock(offset, len(member), raw_offset, len(lines), block_first, block_last))
+            offset += len(member)
+            raw_offset += len(payload)
+
+        pending: list[bytes] = []
+        block_first = block_last = ""
+        for line in src:
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n"):
+                break  # torn final write from a crash: the entry was never completed
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                if src.read(1):
+                    raise  # corruption mid-segment is not a torn tail
+                break
+            ts = obj.get("timestamp", "")
+            event_counts[obj.get("event_type", "")] += 1
+            # Track min/max rather than first/last so skipping stays safe for
+            # entries that arrive slightly out of order.
+            if not pending:
+                block_first = block_last = ts
+            elif ts < block_first:
+                block_first = ts
+            elif ts > block_last:
+                block_last = ts
+            first_ts = ts if first_ts is None or ts < first_ts else first_ts
+            last_ts = ts if last_ts is None or ts > last_ts else last_ts
+            pending.append(line)
+            total += 1
+            if len(pending) >= block_lines:
+                emit(pending, block_first, block_last)
+                pending = []
+        if pending:
+            emit(pending, block_first, block_last)
+
+        footer = {
+            "count": total,
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "event_counts": dict(event_counts),
+            "blocks": [asdict(b) for b in blocks],
+            "data_length": offset,
+        }
+        footer_bytes = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+        dst.write(footer_bytes)
+        dst.write(_TRAILER.pack(len(footer_bytes), MAGIC))
+        dst.flush()
+        os.fsync(dst.fileno())
+
+    os.replace(tmp_path, sealed_path)
+    raw_path.unlink()
+    return sealed_path
+
+
+def read_footer(path: str | Path) -> SegmentFooter:
+    with Path(path).open("rb") as f:
+        f.seek(-_TRAILER.size, os.SEEK_END)
+        length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sealed journal segment")
+        f.seek(-_TRAILER.size - length, os.SEEK_END)
+        raw: dict[str, Any] = json.loads(f.read(length))
+    return SegmentFooter(
+        count=raw["count"],
+        first_ts=raw["first_ts"],
+        last_ts=raw["last_ts"],
+        event_counts=raw["event_counts"],
+        blocks=[SegmentBlock(**b) for b in raw["blocks"]],
+        data_length=raw["data_length"],
+    )
+
+
+def read_block(f: Any, block: SegmentBlock) -> bytes:
+    """Decompressed bytes of one block from an open sealed segment file."""
+    f.seek(block.offset)
+    return zlib.decompress(f.read(block.length), 31)
+
+
+def iter_sealed_lines(
+    path: str | Path,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[bytes]:
+    """Raw JSONL lines of a sealed segment, decompressing only blocks that overlap the window."""
+    footer = read_footer(path)
+    if not footer.overlaps(since, until):
+        return
+    with Path(path).open("rb") as f:
+        for block in footer.blocks:
+            if since is not None and block.last_ts < since:
+                continue
+            if until is not None and block.first_ts >= until:
+                continue
+            yield from read_block(f, block).splitlines(keepends=True)
+
+
+def list_segments(directory: str | Path) -> list[Path]:
+    """Sealed and active segment files, oldest first."""
+    directory = Path(directory)
+    paths = [
+        p
+        for p in directory.glob(f"{SEGMENT_PREFIX}*")
+        if p.name.endswith(".jsonl") or p.name.endswith(".jsonl.gz")
+    ]
+    return sorted(paths, key=lambda p: p.name)
+
+
+class SegmentStore:
+    """Rotating segment files under ``directory``."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age_s: float = 3_600.0,
+        block_lines: int = 1_000,
+        retention_bytes: int | None = None,
+        retention_segments: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_s = max_segment_age_s
+        self.block_lines = block_lines
+        self.retention_bytes = retention_bytes
+        self.retention_segments = retention_segments
+        self._clock = clock
+        self._file: Any = None
+        self._active: Path | None = None
+        self._opened_at = 0.0
+        self._size = 0
+
+        # Seal raw segments left behind by a previous process.
+        existing = list_segments(self.directory)
+        for path in existing:
+            if not path.name.endswith(".jsonl"):
+                continue
+            if path.stat().st_size:
+                seal_segment(path, block_lines)
+            else:
+                path.unlink()
+        self._next_seq = self._seq_after(existing)
+
+    @staticmethod
+    def _seq_after(paths: list[Path]) -> int:
+        seqs = [int(p.name[len(SEGMENT_PREFIX) :].split(".", 1)[0]) for p in paths]
+        return max(seqs, default=0) + 1
+
+    @property
+    def active_path(self) -> Path | None:
+        return self._active
+
+    def _open(self) -> None:
+        self._active = self.directory / f"{SEGMENT_PREFIX}{self._next_seq:06d}.jsonl"
+        self._next_seq += 1
+        self._file = self._active.open("ab")
+        self._opened_at = self._clock()
+        self._size = 0
+
+    def append_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        if self._file is not None and self._clock() - self._opened_at >= self.max_segment_age_s:
+            self.roll()
+        if self._file is None:
+            self._open()
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+        if self._size >= self.max_segment_bytes:
+            self.roll()
+
+    def append(self, entries: list[JournalEntry]) -> None:
+        self.append_lines([encode_entry(e) for e in entries])
+
+    def roll(self) -> Path | None:
+        """Seal the active segment (if any); the next append opens a new one."""
+        if self._file is None:
+            return None
+        self._file.close()
+        self._file = None
+        raw, self._active = self._active, None
+        sealed = seal_segment(raw, self.block_lines) if self._size else None
+        if sealed is None:
+            raw.unlink()
+        self.enforce_retention()
+        return sealed
+
+    def enforce_retention(self) -> list[Path]:
+        sealed = [p for p in list_segments(self.directory) if p.name.endswith(".gz")]
+        removed: list[Path] = []
+        if self.retention_segments is not None:
+            while len(sealed) > self.retention_segments:
+                removed.append(sealed.pop(0))
+        if self.retention_bytes is not None:
+            total = sum(p.stat().st_size for p in sealed)
+            while sealed and total > self.retention_bytes:
+                victim = sealed.pop(0)
+                total -= victim.stat().st_size
+                removed.append(victim)
+        for path in removed:
+            path.unlink()
+        return removed
+
+    def disk_usage(self) -> int:
+        return sum(p.stat().st_size for p in list_segments(self.directory))
+
+    def close(self) -> None:
+        self.roll()
+
+
+class SegmentedJournal(Journal):
+    """Journal persisted to a rotating SegmentStore.
+
+    Entries are buffered and appended to the active segment every
+    ``batch_size`` records or on flush_to_file().
+    """
+
+    def __init__(self, log_dir: str = "journal_logs", batch_size: int = 256, **store_options: Any) -> None:
+        super().__init__(log_dir=log_dir)
+        self.batch_size = batch_size
+        self.store = SegmentStore(self.log_dir, **store_options)
+
+    def record(
+        self,
+        event_type: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+    ) -> JournalEntry:
+        entry = super().record(event_type, data, metadata)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return entry
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.store.append(self._buffer)
+            self._buffer.clear()
+
+    def flush_to_file(self, filename: str | None = None) -> Path:
+        self.flush()
+        return self.store.active_path or self.log_dir
+
+    def close(self) -> None:
+        self.flush()
+        self.store.close()
@@ -0,0 +1,186 @@
+"""SQLite journal backend.
+
+Same record_* API as Journal; entries are buffered and inserted in batched
+transactions into a WAL-mode database with indexes on event_type,
+timestamp and client_order_id, so review queries ("all rejections today",
+"lifecycle of draft X") are index lookups instead of JSONL scans.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .journal import Journal, JournalEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    client_order_id TEXT,
+    allowed INTEGER,
+    reason TEXT,
+    data TEXT NOT NULL,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_journal_event_ts ON journal (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS ix_journal_ts ON journal (timestamp);
+CREATE INDEX IF NOT EXISTS ix_journal_client_order_id ON journal (client_order_id)
+    WHERE client_order_id IS NOT NULL;
+"""
+
+_INSERT = (
+    "INSERT INTO journal (id, timestamp, event_type, client_order_id, allowed, reason, data, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _client_order_id(data: dict[str, Any]) -> str | None:
+    coid = data.get("client_order_id")
+    if coid is None:
+        details = data.get("details")
+        if isinstance(details, dict):
+            coid = details.get("draft_id")
+    return coid
+
+
+def _row(entry: JournalEntry) -> tuple[Any, ...]:
+    data = entry.data
+    allowed = data.get("allowed")
+    return (
+        entry.id,
+        entry.timestamp,
+        entry.event_type,
+        _client_order_id(data),
+        None if allowed is None else int(bool(allowed)),
+        data.get("reason"),
+        json.dumps(data),
+        json.dumps(entry.metadata) if entry.metadata is not None else None,
+    )
+
+
+def _start_of_utc_day() -> str:
+    now = datetime.now(timezone.utc)
+    return now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+
+
+class SQLiteJournal(Journal):
+    """Journal that persists to SQLite in batches of ``batch_size`` entries."""
+
+    def __init__(self, db_path: str = "journal_logs/journal.db", batch_size: int = 256) -> None:
+        self.db_path = Path(db_path)
+        super().__init__(log_dir=str(self.db_path.parent))
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def record(
+        self,
+        event_type: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+    ) -> JournalEntry:
+        entry = super().record(event_type, data, metadata)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return entry
+
+    def flush(self) -> int:
+        """Insert all buffered entries in one transaction; returns the count."""
+        if not self._buffer:
+            return 0
+        rows = [_row(e) for e in self._buffer]
+        with self._conn:
+            self._conn.executemany(_INSERT, rows)
+        self._buffer.clear()
+        return len(rows)
+
+    def flush_to_file(self, filename: str | None = None) -> Path:
+        self.flush()
+        return self.db_path
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def query(
+        self,
+        event_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        client_order_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[JournalEntry]:
+        """Entries matching all given filters, oldest first.
+
+        ``since``/``until`` are ISO-8601 UTC timestamps compared against the
+        stored timestamp (inclusive lower bound, exclusive upper bound).
+        Buffered entries are flushed first so results include them.
+        """
+        self.flush()
+        clauses: list[str] = []
+        params: list[Any] = []
+        if event_type is not None:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if client_order_id is not None:
+            clauses.append("client_order_id = ?")
+            params.append(client_order_id)
+        sql = "SELECT id, timestamp, event_type, data, metadata FROM journal"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp, seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._entry(row) for row in self._conn.execute(sql, params)]
+
+    def rejections(self, since: str | None = None, until: str | None = None) -> list[JournalEntry]:
+        """Guard rejections (decision with allowed=false) and explicit rejection events."""
+        since = since if since is not None else _start_of_utc_day()
+        window: list[Any] = [since] if until is None else [since, until]
+        bound = "" if until is None else " AND timestamp < ?"
+        sql = (
+            "SELECT id, timestamp, event_type, data, metadata FROM journal "
+            f"WHERE event_type = 'rejection' AND timestamp >= ?{bound} "
+            "UNION ALL "
+            "SELECT id, timestamp, event_type, data, metadata FROM journal "
+            f"WHERE event_type = 'decision' AND timestamp >= ?{bound} AND allowed = 0 "
+            "ORDER BY timestamp"
+        )
+        self.flush()
+        return [self._entry(row) for row in self._conn.execute(sql, window + window)]
+
+    def lifecycle(self, client_order_id: str) -> list[JournalEntry]:
+        """Every event recorded for one draft (draft, confirmation, rejections)."""
+        return self.query(client_order_id=client_order_id)
+
+    def count(self, event_type: str | None = None) -> int:
+        self.flush()
+        if event_type is None:
+            return self._conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM journal WHERE event_type = ?", (event_type,)).fetchone()[0]
+
+    @staticmethod
+    def _entry(row: tuple[Any, ...]) -> JournalEntry:
+        entry_id, timestamp, event_type, data, metadata = row
+        return JournalEntry(
+            id=entry_id,
+            timestamp=timestamp,
+            event_type=event_type,
+            data=json.loads(data),
+            metadata=json.loads(metadata) if metadata is not None else None,
+        )
@@ -0,0 +1,167 @@
+"""Background group-commit writer for Journal.
+
+The trading thread only enqueues JournalEntry objects. A dedicated writer
+thread drains the bounded queue in batches, serializes each batch, writes it
+with a single ``write`` call and fsyncs according to the configured policy:
+
+- ``fsync_every_n``: fsync once at least N entries were written since the last one
+- ``fsync_every_ms``: fsync once T ms passed since the last one (checked even when idle)
+- both 0: never fsync; data reaches the OS page cache on every batch
+
+When the queue is full, submit() blocks (backpressure); with ``put_timeout``
+set it raises ``RuntimeError("journal_queue_full")`` instead of waiting forever.
+If writing fails, the writer keeps discarding queued entries until close(), so
+neither blocked producers nor flush() hang; they raise
+``RuntimeError("journal_writer_failed")``.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+from .journal import JournalEntry, encode_entry
+
+_STOP = object()
+
+
+class JournalWriter:
+    def __init__(
+        self,
+        path: str | Path,
+        queue_size: int = 10_000,
+        max_batch: int = 512,
+        fsync_every_n: int = 0,
+        fsync_every_ms: float = 0.0,
+        put_timeout: float | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_batch = max_batch
+        self.fsync_every_n = fsync_every_n
+        self.fsync_every_ms = fsync_every_ms
+        self.put_timeout = put_timeout
+        self.batches_written = 0
+        self.fsyncs = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._error: BaseException | None = None
+        self._closed = False
+        # Makes submit's closed-check + put atomic with close() queuing _STOP,
+        # so nothing can be enqueued behind _STOP and never be written.
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, entry: JournalEntry) -> None:
+        if self._error is not None:
+            raise RuntimeError("journal_writer_failed") from self._error
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("journal_writer_closed")
+            try:
+                self._queue.put(entry, timeout=self.put_timeout)
+            except queue.Full:
+                raise RuntimeError("journal_queue_full") from None
+        if self._error is not None:  # failed while we were blocked; the entry was discarded
+            raise RuntimeError("journal_writer_failed") from self._error
+
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """Block until every submitted entry has been written."""
+        self._queue.join()
+        if self._error is not None:
+            raise RuntimeError("journal_writer_failed") from self._error
+
+    def close(self) -> None:
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError("journal_writer_failed") from self._error
+
+    def _fsync(self) -> None:
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+
+    def _run(self) -> None:
+        get = self._queue.get
+        idle_timeout = self.fsync_every_ms / 1000 if self.fsync_every_ms > 0 else None
+        unsynced = 0
+        last_sync = time.monotonic()
+        stopping = False
+
+        try:
+            while not stopping:
+                try:
+                    item = get(timeout=idle_timeout)
+                except queue.Empty:
+                    item = None
+
+                batch: list[JournalEntry] = []
+                taken = 0
+                if item is _STOP:
+                    stopping = True
+                    taken = 1
+                elif item is not None:
+                    batch.append(item)
+                    taken = 1
+                    while len(batch) < self.max_batch:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        taken += 1
+                        if item is _STOP:
+                            stopping = True
+                            break
+                        batch.append(item)
+
+                try:
+                    if batch:
+                        self._file.write("".join(encode_entry(e) + "\n" for e in batch))
+                        self._file.flush()
+                        self.batches_written += 1
+                        unsynced += len(batch)
+
+                    if unsynced:
+                        now = time.monotonic()
+                        due = (self.fsync_every_n and unsynced >= self.fsync_every_n) or (
+                            self.fsync_every_ms and (now - last_sync) * 1000 >= self.fsync_every_ms
+                        )
+                        if due or (stopping and (self.fsync_every_n or self.fsync_every_ms)):
+                            self._fsync()
+                            unsynced = 0
+                            last_sync = now
+                finally:
+                    for _ in range(taken):
+                        self._queue.task_done()
+        except BaseException as exc:  # surfaced to producers on their next call
+            self._error = exc
+            self._drain_after_error(stopped=stopping)
+        finally:
+            self._file.close()
+
+    def _drain_after_error(self, stopped: bool) -> None:
+        # Keep consuming until close(): producers blocked in put() get through
+        # (and see the error) and flush()'s join() still completes. If close()
+        # already queued _STOP and it was taken, just empty what is left.
+        while True:
+            if stopped:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+            else:
+                item = self._queue.get()
+            self._queue.task_done()
+            if item is _STOP:
+                return
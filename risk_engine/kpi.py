@@ -0,0 +1,479 @@
+"""Online KPI evaluator fed by journal events (see docs/METRICS.md).
+
+KPIAggregator keeps running totals and updates them in O(1) per journal
+entry, so the current KPIs are always one snapshot() away. It can follow a
+live Journal (attach) or rebuild from journal files through the same code
+path (from_journal).
+
+Events used:
+
+- ``fill``: fee and slippage are costs; they hit the equity curve at once
+  and are charged to the symbol's next closed trade
+- ``trade_closed``: gross PnL and funding; the trade's net result
+  (gross - funding - fees/slippage charged since the previous close) decides
+  win/loss
+- ``decision`` / ``draft_order`` / ``confirmation`` / ``rejection``: rule
+  compliance. A confirmation is compliant when its client_order_id was drafted
+  (i.e. passed the guard); a fill for an order that never went through the
+  guard counts as a non-compliant order.
+
+Drawdown is measured on the net PnL curve (start_equity + cumulative net).
+Ratios with an empty denominator are NaN.
+
+Aggregators are mergeable for parallel rebuilds (see report.py): build one
+``partial=True`` aggregator per consecutive slice of the journal, merge()
+them in journal order and finalize(). A partial aggregator holds back the
+win/loss classification of each symbol's first close (its fees may sit in
+an earlier slice) and confirmations or fills whose draft it has not seen;
+merge() resolves them against the slice before it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .journal import Journal, JournalEntry
+
+
+def _ratio(num: float, den: float) -> float:
+    return num / den if den else math.nan
+
+
+@dataclass(frozen=True)
+class KPISnapshot:
+    start_equity: float
+    events: int
+    first_ts: str | None
+    last_ts: str | None
+    trades: int
+    wins: int
+    losses: int
+    gross_pnl: float
+    closed_net_pnl: float  # sum of per-trade net results
+    win_total: float
+    loss_total: float  # absolute value
+    gross_turnover: float  # sum of |gross PnL| over trades
+    fees: float
+    slippage: float
+    funding: float
+    peak_pnl: float  # highest cumulative net PnL (>= 0)
+    trough_pnl: float  # lowest cumulative net PnL (<= 0)
+    max_drawdown: float  # currency, peak to trough on the net PnL curve
+    max_drawdown_percent: float  # fraction of peak equity; NaN without start_equity
+    decisions: int
+    guard_rejections: int
+    confirmations: int
+    compliant_confirmations: int
+    unguarded_fills: int
+    confirmation_rejections: int
+    rejection_reasons: dict[str, int]
+    pnl_m2: float  # sum of squared deviations of per-trade net PnL
+
+    @property
+    def costs(self) -> float:
+        return self.fees + self.slippage + self.funding
+
+    @property
+    def net_pnl(self) -> float:
+        """Gross PnL minus every cost booked so far (including open positions' fees)."""
+        return self.gross_pnl - self.costs
+
+    @property
+    def expectancy(self) -> float:
+        return _ratio(self.closed_net_pnl, self.trades)
+
+    @property
+    def pnl_std(self) -> float:
+        """Sample standard deviation of per-trade net PnL."""
+        return math.sqrt(self.pnl_m2 / (self.trades - 1)) if self.trades > 1 else math.nan
+
+    @property
+    def win_rate(self) -> float:
+        return _ratio(self.wins, self.trades)
+
+    @property
+    def avg_win(self) -> float:
+        return _ratio(self.win_total, self.wins)
+
+    @property
+    def avg_loss(self) -> float:
+        return _ratio(self.loss_total, self.losses)
+
+    @property
+    def win_loss_ratio(self) -> float:
+        return _ratio(self.avg_win, self.avg_loss) if self.wins and self.losses else math.nan
+
+    @property
+    def cost_ratio(self) -> float:
+        """(fees + slippage + funding) / sum of |gross PnL| per trade."""
+        return _ratio(self.costs, self.gross_turnover)
+
+    @property
+    def orders(self) -> int:
+        return self.confirmations + self.unguarded_fills
+
+    @property
+    def compliance_rate(self) -> float:
+        return _ratio(self.compliant_confirmations, self.orders)
+
+    @property
+    def guard_rejection_rate(self) -> float:
+        return _ratio(self.guard_rejections, self.decisions)
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "trades": float(self.trades),
+            "net_pnl": self.net_pnl,
+            "expectancy": self.expectancy,
+            "pnl_std": self.pnl_std,
+            "win_rate": self.win_rate,
+            "avg_win": self.avg_win,
+            "avg_loss": self.avg_loss,
+            "win_loss_ratio": self.win_loss_ratio,
+            "cost_ratio": self.cost_ratio,
+            "max_drawdown": self.max_drawdown,
+            "max_drawdown_percent": self.max_drawdown_percent,
+            "compliance_rate": self.compliance_rate,
+            "guard_rejection_rate": self.guard_rejection_rate,
+        }
+
+
+class KPIAggregator:
+    """Running KPI state; feed it JournalEntry objects via update()."""
+
+    __slots__ = (
+        "start_equity",
+        "partial",
+        "events",
+        "first_ts",
+        "last_ts",
+        "trades",
+        "wins",
+        "losses",
+        "gross_pnl",
+        "closed_net_pnl",
+        "win_total",
+        "loss_total",
+        "gross_turnover",
+        "fees",
+        "slippage",
+        "funding",
+        "net_pnl",
+        "peak_pnl",
+        "trough_pnl",
+        "max_drawdown",
+        "max_drawdown_percent",
+        "decisions",
+        "guard_rejections",
+        "confirmations",
+        "compliant_confirmations",
+        "confirmation_rejections",
+        "rejection_reasons",
+        "pnl_m2",
+        "_classified",
+        "_anonymous_fills",
+        "_pending_costs",
+        "_drafted",
+        "_unguarded",
+        "_closed_symbols",
+        "_deferred",
+        "_unmatched",
+        "_handlers",
+    )
+
+    def __init__(self, start_equity: float = 0.0, partial: bool = False) -> None:
+        self.start_equity = start_equity
+        self.partial = partial
+        self.events = 0
+        self.first_ts: str | None = None
+        self.last_ts: str | None = None
+        self.trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.gross_pnl = 0.0
+        self.closed_net_pnl = 0.0
+        self.win_total = 0.0
+        self.loss_total = 0.0
+        self.gross_turnover = 0.0
+        self.fees = 0.0
+        self.slippage = 0.0
+        self.funding = 0.0
+        self.net_pnl = 0.0
+        self.peak_pnl = 0.0
+        self.trough_pnl = 0.0
+        self.max_drawdown = 0.0
+        self.max_drawdown_percent = 0.0 if start_equity > 0 and not partial else math.nan
+        self.decisions = 0
+        self.guard_rejections = 0
+        self.confirmations = 0
+        self.compliant_confirmations = 0
+        self.confirmation_rejections = 0
+        self.rejection_reasons: Counter[str] = Counter()
+        self.pnl_m2 = 0.0
+        self._classified = 0
+        self._anonymous_fills = 0
+        self._pending_costs: dict[str, float] = {}
+        self._drafted: set[str] = set()
+        self._unguarded: set[str] = set()
+        self._closed_symbols: set[str] = set()
+        self._deferred: dict[str, float] = {}  # symbol -> net of its first close, before carried costs
+        self._unmatched: list[str] = []  # confirmed client_order_ids without a draft seen yet
+        self._bind()
+
+    def _bind(self) -> None:
+        self._handlers = {
+            "decision": self._on_decision,
+            "draft_order": self._on_draft,
+            "confirmation": self._on_confirmation,
+            "rejection": self._on_rejection,
+            "fill": self._on_fill,
+            "trade_closed": self._on_trade_closed,
+        }
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_handlers"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._bind()
+
+    @property
+    def unguarded_fills(self) -> int:
+        return self._anonymous_fills + len(self._unguarded)
+
+    def attach(self, journal: Journal) -> None:
+        """Follow ``journal`` live: every recorded entry updates the KPIs."""
+        journal.subscribe(self.update)
+
+    def detach(self, journal: Journal) -> None:
+        journal.unsubscribe(self.update)
+
+    @classmethod
+    def from_journal(
+        cls,
+        source: str | Path | Iterable[str | Path],
+        since: str | None = None,
+        until: str | None = None,
+        start_equity: float = 0.0,
+    ) -> KPIAggregator:
+        """Rebuild KPIs by streaming journal files (see journal_reader.read_journal)."""
+        from .journal_reader import read_journal
+
+        aggregator = cls(start_equity)
+        aggregator.consume(read_journal(source, since=since, until=until))
+        return aggregator
+
+    def consume(self, entries: Iterable[JournalEntry]) -> None:
+        update = self.update
+        for entry in entries:
+            update(entry)
+
+    def update(self, entry: JournalEntry) -> None:
+        self.events += 1
+        if self.first_ts is None:
+            self.first_ts = entry.timestamp
+        self.last_ts = entry.timestamp
+        handler = self._handlers.get(entry.event_type)
+        if handler is not None:
+            handler(entry.data)
+
+    def _move(self, delta: float) -> None:
+        self.net_pnl += delta
+        net = self.net_pnl
+        if net > self.peak_pnl:
+            self.peak_pnl = net
+            return
+        if net < self.trough_pnl:
+            self.trough_pnl = net
+        drawdown = self.peak_pnl - net
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+        if self.start_equity > 0 and not self.partial:
+            fraction = drawdown / (self.start_equity + self.peak_pnl)
+            if fraction > self.max_drawdown_percent:
+                self.max_drawdown_percent = fraction
+
+    def _classify(self, net: float) -> None:
+        self.closed_net_pnl += net
+        if net > 0:
+            self.wins += 1
+            self.win_total += net
+        elif net < 0:
+            self.losses += 1
+            self.loss_total -= net
+        # Welford update of the per-trade net PnL moments.
+        self._classified += 1
+        mean = (self.closed_net_pnl - net) / (self._classified - 1) if self._classified > 1 else 0.0
+        delta = net - mean
+        self.pnl_m2 += delta * (net - (mean + delta / self._classified))
+
+    def _on_decision(self, data: dict[str, Any]) -> None:
+        self.decisions += 1
+        if data.get("allowed") is False:
+            self.guard_rejections += 1
+            self.rejection_reasons[data.get("reason")] += 1
+
+    def _on_draft(self, data: dict[str, Any]) -> None:
+        coid = data.get("client_order_id")
+        if coid is not None:
+            self._drafted.add(coid)
+
+    def _on_confirmation(self, data: dict[str, Any]) -> None:
+        self.confirmations += 1
+        coid = data.get("client_order_id")
+        if coid in self._drafted:
+            self.compliant_confirmations += 1
+        elif self.partial:
+            self._unmatched.append(coid)
+
+    def _on_rejection(self, data: dict[str, Any]) -> None:
+        self.confirmation_rejections += 1
+        self.rejection_reasons[data.get("reason")] += 1
+
+    def _on_fill(self, data: dict[str, Any]) -> None:
+        coid = data.get("client_order_id")
+        if coid is None:
+            self._anonymous_fills += 1
+        elif coid not in self._drafted:
+            self._unguarded.add(coid)
+        fee = data.get("fee") or 0.0
+        slippage = data.get("slippage") or 0.0
+        self.fees += fee
+        self.slippage += slippage
+        symbol = data.get("symbol")
+        self._pending_costs[symbol] = self._pending_costs.get(symbol, 0.0) + fee + slippage
+        self._move(-(fee + slippage))
+
+    def _on_trade_closed(self, data: dict[str, Any]) -> None:
+        symbol = data.get("symbol")
+        pnl = data.get("pnl") or 0.0
+        funding = data.get("funding") or 0.0
+        net = pnl - funding - self._pending_costs.pop(symbol, 0.0)
+        self.trades += 1
+        self.gross_pnl += pnl
+        self.gross_turnover += abs(pnl)
+        self.funding += funding
+        if self.partial and symbol not in self._closed_symbols:
+            self._closed_symbols.add(symbol)
+            self._deferred[symbol] = net
+        else:
+            self._classify(net)
+        self._move(pnl - funding)
+
+    def merge(self, later: KPIAggregator) -> KPIAggregator:
+        """Fold in the aggregate of the journal slice right after this one; returns self."""
+        if later.events == 0:
+            return self
+        if self.events == 0:
+            self.first_ts = later.first_ts
+        self.last_ts = later.last_ts
+        self.events += later.events
+
+        for name in (
+            "trades",
+            "gross_pnl",
+            "gross_turnover",
+            "fees",
+            "slippage",
+            "funding",
+            "decisions",
+            "guard_rejections",
+            "confirmations",
+            "compliant_confirmations",
+            "confirmation_rejections",
+            "_anonymous_fills",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(later, name))
+        self.rejection_reasons.update(later.rejection_reasons)
+
+        # Trade classification: carry this slice's open costs into the later first closes.
+        self._merge_classified(later)
+        for symbol, net in later._deferred.items():
+            net -= self._pending_costs.pop(symbol, 0.0)
+            if symbol in self._closed_symbols:
+                self._classify(net)
+            else:
+                self._deferred[symbol] = net
+        for symbol, cost in later._pending_costs.items():
+            self._pending_costs[symbol] = self._pending_costs.get(symbol, 0.0) + cost
+        self._closed_symbols |= later._closed_symbols
+
+        # Compliance: the later slice may confirm or fill drafts recorded here.
+        for coid in later._unmatched:
+            if coid in self._drafted:
+                self.compliant_confirmations += 1
+            else:
+                self._unmatched.append(coid)
+        self._unguarded |= {coid for coid in later._unguarded if coid not in self._drafted}
+        self._drafted |= later._drafted
+
+        # Drawdown pieces: the later curve continues from this slice's net PnL.
+        base = self.net_pnl
+        self.max_drawdown = max(self.max_drawdown, later.max_drawdown, self.peak_pnl - (base + later.trough_pnl))
+        self.peak_pnl = max(self.peak_pnl, base + later.peak_pnl)
+        self.trough_pnl = min(self.trough_pnl, base + later.trough_pnl)
+        self.net_pnl = base + later.net_pnl
+        self.max_drawdown_percent = math.nan
+        return self
+
+    def _merge_classified(self, later: KPIAggregator) -> None:
+        n_a, n_b = self._classified, later._classified
+        if n_b == 0:
+            return
+        if n_a:
+            delta = later.closed_net_pnl / n_b - self.closed_net_pnl / n_a
+            self.pnl_m2 += later.pnl_m2 + delta * delta * n_a * n_b / (n_a + n_b)
+        else:
+            self.pnl_m2 = later.pnl_m2
+        self._classified = n_a + n_b
+        self.closed_net_pnl += later.closed_net_pnl
+        self.wins += later.wins
+        self.losses += later.losses
+        self.win_total += later.win_total
+        self.loss_total += later.loss_total
+
+    def finalize(self) -> KPIAggregator:
+        """Classify first closes nothing earlier can carry costs into; returns self."""
+        for net in self._deferred.values():
+            self._classify(net)
+        self._deferred.clear()
+        self._unmatched.clear()
+        self.partial = False
+        return self
+
+    def snapshot(self) -> KPISnapshot:
+        return KPISnapshot(
+            start_equity=self.start_equity,
+            events=self.events,
+            first_ts=self.first_ts,
+            last_ts=self.last_ts,
+            trades=self.trades,
+            wins=self.wins,
+            losses=self.losses,
+            gross_pnl=self.gross_pnl,
+            closed_net_pnl=self.closed_net_pnl,
+            win_total=self.win_total,
+            loss_total=self.loss_total,
+            gross_turnover=self.gross_turnover,
+            fees=self.fees,
+            slippage=self.slippage,
+            funding=self.funding,
+            peak_pnl=self.peak_pnl,
+            trough_pnl=self.trough_pnl,
+            max_drawdown=self.max_drawdown,
+            max_drawdown_percent=self.max_drawdown_percent,
+            decisions=self.decisions,
+            guard_rejections=self.guard_rejections,
+            confirmations=self.confirmations,
+            compliant_confirmations=self.compliant_confirmations,
+            unguarded_fills=self.unguarded_fills,
+            confirmation_rejections=self.confirmation_rejections,
+            rejection_reasons=dict(self.rejection_reasons),
+            pnl_m2=self.pnl_m2,
+        )
@@ -0,0 +1,130 @@
+"""Low-overhead latency histograms for per-stage timing.
+
+LatencyHistogram uses HDR-style log-linear buckets: values below ``2**(p+1)``
+ns get exact buckets, larger values share ``2**p`` buckets per power of two,
+so every recorded value is kept to within ``2**-p`` relative error
+(p=7: <1%) in a fixed-size array, and recording is a bit_length, a shift and
+a list increment.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+
+_MAX_BITS = 48  # ~78 hours in ns; larger values are clamped into the top bucket
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    count: int
+    min_ns: int
+    max_ns: int
+    mean_ns: float
+    p50_ns: int
+    p99_ns: int
+    p999_ns: int
+
+
+class LatencyHistogram:
+    __slots__ = ("_precision", "_sub", "_counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self._precision = precision_bits
+        self._sub = 1 << precision_bits
+        self._counts = [0] * self._index(1 << _MAX_BITS)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def _index(self, value: int) -> int:
+        sub = self._sub
+        if value < 2 * sub:
+            return value
+        shift = value.bit_length() - self._precision - 1
+        return sub * (shift + 1) + (value >> shift) - sub
+
+    def _lower_bound(self, index: int) -> int:
+        sub = self._sub
+        if index < 2 * sub:
+            return index
+        shift = index // sub - 1
+        return (index % sub + sub) << shift
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < 0:
+            value_ns = 0
+        counts = self._counts
+        index = self._index(value_ns)
+        if index >= len(counts):
+            index = len(counts) - 1
+        counts[index] += 1
+        if not self.count or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def percentile(self, q: float) -> int:
+        """Highest value equivalent to the bucket holding the q-th percentile (0-100)."""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= target:
+                return min(self._lower_bound(index + 1) - 1, self.max_ns)
+        return self.max_ns
+
+    def snapshot(self) -> LatencySnapshot:
+        return LatencySnapshot(
+            count=self.count,
+            min_ns=self.min_ns,
+            max_ns=self.max_ns,
+            mean_ns=self.total_ns / self.count if self.count else 0.0,
+            p50_ns=self.percentile(50),
+            p99_ns=self.percentile(99),
+            p999_ns=self.percentile(99.9),
+        )
+
+    def reset(self) -> None:
+        self._counts[:] = [0] * len(self._counts)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+
+class StageTimers:
+    """One LatencyHistogram per named stage, fed by ``lap``."""
+
+    __slots__ = ("_histograms", "_precision")
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._precision = precision_bits
+
+    def lap(self, stage: str, start_ns: int) -> int:
+        """Record ``now - start_ns`` under ``stage`` and return now (the next start)."""
+        now = time.perf_counter_ns()
+        hist = self._histograms.get(stage)
+        if hist is None:
+            hist = self._histograms[stage] = LatencyHistogram(self._precision)
+        hist.record(now - start_ns)
+        return now
+
+    def histogram(self, stage: str) -> LatencyHistogram | None:
+        return self._histograms.get(stage)
+
+    def snapshot(self) -> dict[str, LatencySnapshot]:
+        return {stage: hist.snapshot() for stage, hist in self._histograms.items()}
+
+    def reset(self) -> None:
+        for hist in self._histograms.values():
+            hist.reset()
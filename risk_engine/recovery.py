@@ -0,0 +1,380 @@
+"""Snapshot + journal-tail restart of live risk state.
+
+RiskState is the account ledger, exposure book and in-flight orders, driven
+only by journal entries (apply()). A Checkpointer keeps it attached to a live
+Journal and periodically writes a compact JSON snapshot next to the journal,
+tagged with the journal position (file name + byte offset) it reflects.
+After a restart restore() loads the newest snapshot and replays only the
+journal tail after that position, so startup cost is bounded by the
+checkpoint interval rather than the day's journal size.
+
+Events applied:
+
+- ``draft_order``: pending draft (awaiting confirmation)
+- ``confirmation``: draft becomes an open order (awaiting fills)
+- ``fill``: fee + slippage booked on the ledger; a fill of a known order
+  opens/extends the position with the order's stop
+- ``trade_closed``: gross PnL minus funding booked; position removed
+- ``risk_control``: kill_switch_on / kill_switch_off / reset_loss_streak
+
+Day rollovers are driven by entry timestamps during replay and by the
+wall clock afterwards. File-based journals only (plain JSONL, JournalWriter,
+SegmentedJournal); file names must sort in write order, which holds for all
+of them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .core import AccountLedger, RiskEngineConfig
+from .execution import DraftOrder, ExposureBook, TradeIntent
+from .journal import Journal, JournalEntry
+from .journal_codec import to_dict
+from .journal_reader import journal_files
+from .journal_segments import read_block, read_footer
+
+SNAPSHOT_PREFIX = "risk-state-"
+SNAPSHOT_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class JournalPosition:
+    file: str  # journal file name without a ".gz" suffix
+    offset: int  # bytes of the (uncompressed) file already applied
+
+
+def _base_name(path: Path) -> str:
+    name = path.name
+    return name[:-3] if name.endswith(".gz") else name
+
+
+def _epoch(timestamp: str) -> float:
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class RiskState:
+    """Ledger + exposure + in-flight orders, rebuilt from journal entries."""
+
+    __slots__ = (
+        "ledger",
+        "exposure",
+        "pending_drafts",
+        "open_orders",
+        "filled",
+        "position",
+        "last_ts",
+        "applied",
+        "_clock",
+        "_replay_now",
+        "_handlers",
+    )
+
+    def __init__(
+        self,
+        config: RiskEngineConfig,
+        start_equity: float,
+        clock: Callable[[], float] = time.time,
+        as_of: str | None = None,
+    ) -> None:
+        self._clock = clock
+        self._replay_now: float | None = _epoch(as_of) if as_of else None
+        self.ledger = AccountLedger(config, start_equity, clock=self._now)
+        self.exposure = ExposureBook(start_equity)
+        self.pending_drafts: dict[str, DraftOrder] = {}
+        self.open_orders: dict[str, DraftOrder] = {}
+        self.filled: dict[str, float] = {}
+        self.position: JournalPosition | None = None
+        self.last_ts = as_of
+        self.applied = 0
+        self._handlers = {
+            "draft_order": self._on_draft,
+            "confirmation": self._on_confirmation,
+            "fill": self._on_fill,
+            "trade_closed": self._on_trade_closed,
+            "risk_control": self._on_risk_control,
+        }
+
+    def _now(self) -> float:
+        return self._replay_now if self._replay_now is not None else self._clock()
+
+    def go_live(self) -> None:
+        """Switch the ledger from entry timestamps to the wall clock."""
+        self._replay_now = None
+        self.ledger.roll_if_due()
+
+    def apply(self, entry: JournalEntry) -> None:
+        self.applied += 1
+        self.last_ts = entry.timestamp
+        handler = self._handlers.get(entry.event_type)
+        if handler is None:
+            return
+        if self._replay_now is not None:
+            self._replay_now = _epoch(entry.timestamp)
+        handler(entry.data)
+
+    def _on_draft(self, data: dict[str, Any]) -> None:
+        coid, intent = data.get("client_order_id"), data.get("intent")
+        if coid is not None and intent:
+            self.pending_drafts[coid] = DraftOrder(TradeIntent(**intent), data["size"], coid)
+
+    def _on_confirmation(self, data: dict[str, Any]) -> None:
+        draft = self.pending_drafts.pop(data.get("client_order_id"), None)
+        if draft is not None:
+            self.open_orders[draft.client_order_id] = draft
+
+    def _on_fill(self, data: dict[str, Any]) -> None:
+        self.ledger.record_fill((data.get("fee") or 0.0) + (data.get("slippage") or 0.0))
+        coid = data.get("client_order_id")
+        order = self.open_orders.get(coid)
+        if order is None:
+            return
+        size = data["size"]
+        intent = order.intent
+        self.exposure.open(intent.symbol, data["price"], intent.stop_price, size, intent.contract_multiplier)
+        filled = self.filled.get(coid, 0.0) + size
+        if filled >= order.size:
+            del self.open_orders[coid]
+            self.filled.pop(coid, None)
+        else:
+            self.filled[coid] = filled
+
+    def _on_trade_closed(self, data: dict[str, Any]) -> None:
+        self.ledger.record_closed_trade(data["pnl"] - (data.get("funding") or 0.0))
+        self.exposure.close(data["symbol"])
+
+    def _on_risk_control(self, data: dict[str, Any]) -> None:
+        action = data.get("action")
+        if action == "kill_switch_on":
+            self.ledger.set_manual_kill_switch(True)
+        elif action == "kill_switch_off":
+            self.ledger.set_manual_kill_switch(False)
+        elif action == "reset_loss_streak":
+            self.ledger.reset_loss_streak()
+
+    def to_dict(self) -> dict[str, Any]:
+        ledger = self.ledger
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "position": None if self.position is None else to_dict(self.position),
+            "last_ts": self.last_ts,
+            "applied": self.applied,
+            "ledger": {
+                "start_of_day_equity": ledger.start_of_day_equity,
+                "realized_pnl_today": ledger.realized_pnl_today,
+                "consecutive_losses": ledger.consecutive_losses,
+                "manual_kill_switch": ledger.manual_kill_switch,
+            },
+            "exposure": {"equity": self.exposure.equity, "positions": self.exposure.positions()},
+            "pending_drafts": [to_dict(d) for d in self.pending_drafts.values()],
+            "open_orders": [to_dict(d) for d in self.open_orders.values()],
+            "filled": self.filled,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+        config: RiskEngineConfig,
+        clock: Callable[[], float] = time.time,
+    ) -> RiskState:
+        if raw.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError("unsupported_snapshot_format")
+        led = raw["ledger"]
+        state = cls(config, led["start_of_day_equity"], clock=clock, as_of=raw["last_ts"])
+        state.ledger = AccountLedger(
+            config,
+            led["start_of_day_equity"],
+            realized_pnl_today=led["realized_pnl_today"],
+            consecutive_losses=led["consecutive_losses"],
+            manual_kill_switch=led["manual_kill_switch"],
+            clock=state._now,
+        )
+        state.exposure = ExposureBook(raw["exposure"]["equity"])
+        for symbol, entry, stop, size, multiplier in raw["exposure"]["positions"]:
+            state.exposure.open(symbol, entry, stop, size, multiplier)
+        for key, target in (("pending_drafts", state.pending_drafts), ("open_orders", state.open_orders)):
+            for d in raw[key]:
+                target[d["client_order_id"]] = DraftOrder(TradeIntent(**d["intent"]), d["size"], d["client_order_id"])
+        state.filled = dict(raw["filled"])
+        state.position = JournalPosition(**raw["position"]) if raw["position"] else None
+        state.applied = raw["applied"]
+        return state
+
+
+def list_snapshots(directory: str | Path) -> list[Path]:
+    """Snapshot files in ``directory``, oldest first."""
+    return sorted(Path(directory).glob(f"{SNAPSHOT_PREFIX}*.json"), key=lambda p: p.name)
+
+
+def save_snapshot(state: RiskState, directory: str | Path, keep: int = 3) -> Path:
+    """Atomically write ``state`` as the newest snapshot, keeping the last ``keep``."""
+    directory = Path(directory)
+    existing = list_snapshots(directory)
+    seq = int(existing[-1].name[len(SNAPSHOT_PREFIX) : -len(".json")]) + 1 if existing else 1
+    path = directory / f"{SNAPSHOT_PREFIX}{seq:08d}.json"
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(state.to_dict(), f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    for old in (existing + [path])[:-keep] if keep > 0 else []:
+        old.unlink()
+    return path
+
+
+def _lines_from(path: Path, offset: int) -> Iterator[bytes]:
+    """Raw lines of a journal file starting at uncompressed byte ``offset``."""
+    if not path.name.endswith(".gz"):
+        with path.open("rb") as f:
+            f.seek(offset)
+            yield from f
+        return
+    try:
+        footer = read_footer(path)
+    except ValueError:  # plain gzip, not a sealed segment
+        with gzip.open(path, "rb") as f:
+            f.seek(offset)
+            yield from f
+        return
+    with path.open("rb") as f:
+        blocks = footer.blocks
+        for i, block in enumerate(blocks):
+            if i + 1 < len(blocks) and blocks[i + 1].raw_offset <= offset:
+                continue
+            data = read_block(f, block)
+            yield from data[max(0, offset - block.raw_offset) :].splitlines(keepends=True)
+
+
+def _iter_from(path: Path, offset: int) -> Iterator[tuple[JournalEntry, int]]:
+    """Entries of ``path`` starting at uncompressed ``offset``, with the offset after each."""
+    for line in _lines_from(path, offset):
+        if not line.endswith(b"\n"):
+            return  # partial last line still being written
+        offset += len(line)
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        yield (
+            JournalEntry(obj["id"], obj["timestamp"], obj["event_type"], obj["data"], obj.get("metadata")),
+            offset,
+        )
+
+
+def replay_tail(state: RiskState, journal_dir: str | Path) -> int:
+    """Apply every journal entry after ``state.position``; returns the number applied."""
+    start = state.position
+    count = 0
+    for path in journal_files(journal_dir):
+        base = _base_name(path)
+        if start is not None and base < start.file:
+            continue
+        offset = start.offset if start is not None and base == start.file else 0
+        state.position = JournalPosition(base, offset)
+        for entry, end in _iter_from(path, offset):
+            state.apply(entry)
+            state.position = JournalPosition(base, end)
+            count += 1
+    return count
+
+
+def restore(
+    journal_dir: str | Path,
+    config: RiskEngineConfig,
+    start_equity: float,
+    snapshot_dir: str | Path | None = None,
+    clock: Callable[[], float] = time.time,
+) -> RiskState:
+    """Latest snapshot (or a fresh state) plus the journal tail after it, ready for live use."""
+    snapshots = list_snapshots(snapshot_dir or journal_dir)
+    if snapshots:
+        raw = json.loads(snapshots[-1].read_text(encoding="utf-8"))
+        state = RiskState.from_dict(raw, config, clock=clock)
+    else:
+        state = RiskState(config, start_equity, clock=clock, as_of="1970-01-01T00:00:00+00:00")
+    replay_tail(state, journal_dir)
+    state.go_live()
+    return state
+
+
+def _end_position(journal_dir: Path) -> JournalPosition | None:
+    files = journal_files(journal_dir)
+    if not files:
+        return None
+    path = files[-1]
+    if not path.name.endswith(".gz"):
+        return JournalPosition(path.name, path.stat().st_size)
+    footer = read_footer(path)
+    if not footer.blocks:
+        return JournalPosition(_base_name(path), 0)
+    last = footer.blocks[-1]
+    with path.open("rb") as f:
+        return JournalPosition(_base_name(path), last.raw_offset + len(read_block(f, last)))
+
+
+class Checkpointer:
+    """Keeps a RiskState in sync with a live Journal and snapshots it periodically.
+
+    A snapshot is due every ``every_entries`` recorded entries or
+    ``every_s`` seconds (checked as entries arrive), whichever comes first.
+    Taking one flushes the journal so the recorded position covers exactly
+    the entries the state has applied.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        state: RiskState,
+        directory: str | Path | None = None,
+        every_entries: int = 1_000,
+        every_s: float = 60.0,
+        keep: int = 3,
+        filename: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.journal = journal
+        self.state = state
+        self.directory = Path(directory) if directory is not None else journal.log_dir
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.every_entries = every_entries
+        self.every_s = every_s
+        self.keep = keep
+        self.filename = filename
+        self._clock = clock
+        self._since = 0
+        self._last = clock()
+        self.snapshots_written = 0
+        journal.subscribe(self._on_entry)
+
+    def detach(self) -> None:
+        self.journal.unsubscribe(self._on_entry)
+
+    def _on_entry(self, entry: JournalEntry) -> None:
+        self.state.apply(entry)
+        self._since += 1
+        if self._since >= self.every_entries or self._clock() - self._last >= self.every_s:
+            self.checkpoint()
+
+    def checkpoint(self) -> Path:
+        if not self.journal.pending_count():  # everything applied is already on disk
+            self.state.position = _end_position(self.journal.log_dir)
+        else:
+            path = self.journal.flush_to_file(self.filename)
+            if path.name.endswith(".jsonl") and path.is_file():
+                self.state.position = JournalPosition(_base_name(path), path.stat().st_size)
+            else:  # flushed into a store (sealed segment, database), not a single file
+                self.state.position = _end_position(self.journal.log_dir)
+        snapshot = save_snapshot(self.state, self.directory, self.keep)
+        self._since = 0
+        self._last = self._clock()
+        self.snapshots_written += 1
+        return snapshot
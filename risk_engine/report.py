@@ -0,0 +1,143 @@
+"""Parallel end-of-day report over journal files.
+
+The journal (files, or byte ranges of large JSONL files, in write order)
+is split into slices that run on a process pool. Each slice yields a
+partial KPIAggregator: counts, rejection-reason histogram, PnL moments and
+drawdown pieces. The partials are merged in journal order into one
+KPISnapshot. Merging is exact, so the report does not depend on
+``workers`` or ``chunk_bytes``.
+
+    python -m risk_engine.report journal_logs --day 2026-03-01 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import reduce
+from pathlib import Path
+
+from .journal import JournalEntry
+from .journal_reader import journal_files, read_journal
+from .kpi import KPIAggregator, KPISnapshot
+
+# (path, start, stop); stop == -1 means "whole file" (used for compressed files).
+ReportTask = tuple[str, int, int]
+
+
+def day_window(day: str) -> tuple[str, str]:
+    """``[since, until)`` ISO timestamps covering one UTC day (``YYYY-MM-DD``)."""
+    start = date.fromisoformat(day)
+    return f"{start.isoformat()}T00:00:00+00:00", f"{(start + timedelta(days=1)).isoformat()}T00:00:00+00:00"
+
+
+def plan_tasks(files: Iterable[Path], chunk_bytes: int = 64 * 1024 * 1024) -> list[ReportTask]:
+    """Split plain JSONL files into line-aligned byte ranges of about ``chunk_bytes``."""
+    tasks: list[ReportTask] = []
+    for path in files:
+        if path.name.endswith(".gz"):
+            tasks.append((str(path), 0, -1))
+            continue
+        size = path.stat().st_size
+        start = 0
+        with path.open("rb") as f:
+            while start < size:
+                stop = start + chunk_bytes
+                if stop < size:
+                    f.seek(stop)
+                    f.readline()  # extend to the end of the line we landed in
+                    stop = f.tell()
+                tasks.append((str(path), start, min(stop, size)))
+                start = stop
+    return tasks
+
+
+def _entries(task: ReportTask, since: str | None, until: str | None) -> Iterable[JournalEntry]:
+    path, start, stop = task
+    if stop < 0:
+        yield from read_journal(path, since=since, until=until)
+        return
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < stop:
+            line = f.readline()
+            if not line.endswith(b"\n"):
+                return  # partial last line still being written
+            pos += len(line)
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            ts = obj["timestamp"]
+            if (since is not None and ts < since) or (until is not None and ts >= until):
+                continue
+            yield JournalEntry(obj["id"], ts, obj["event_type"], obj["data"], obj.get("metadata"))
+
+
+def aggregate_task(task: ReportTask, since: str | None = None, until: str | None = None) -> KPIAggregator:
+    aggregator = KPIAggregator(partial=True)
+    aggregator.consume(_entries(task, since, until))
+    return aggregator
+
+
+def build_report(
+    source: str | Path | Iterable[str | Path],
+    since: str | None = None,
+    until: str | None = None,
+    workers: int | None = None,
+    chunk_bytes: int = 64 * 1024 * 1024,
+) -> KPISnapshot:
+    """KPIs over every journal entry in ``[since, until)``.
+
+    ``workers=1`` runs in-process; ``None`` uses one process per CPU.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    tasks = plan_tasks(journal_files(source), chunk_bytes)
+    if workers == 1 or len(tasks) <= 1:
+        parts = [aggregate_task(task, since, until) for task in tasks]
+    else:
+        n_workers = min(workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            parts = list(pool.map(aggregate_task, tasks, [since] * len(tasks), [until] * len(tasks)))
+    merged = reduce(KPIAggregator.merge, parts, KPIAggregator(partial=True))
+    return merged.finalize().snapshot()
+
+
+def format_report(snapshot: KPISnapshot, title: str = "Daily report") -> str:
+    lines = [f"{title} ({snapshot.first_ts or '-'} .. {snapshot.last_ts or '-'}, {snapshot.events} events)"]
+    for key, value in snapshot.summary().items():
+        lines.append(f"  {key:<22} {value:12.4f}")
+    if snapshot.rejection_reasons:
+        lines.append("  rejections by reason:")
+        for reason, count in sorted(snapshot.rejection_reasons.items(), key=lambda kv: (-kv[1], str(kv[0]))):
+            lines.append(f"    {str(reason):<28} {count:8d}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m risk_engine.report", description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="+", help="journal directory or files")
+    parser.add_argument("--day", help="UTC day YYYY-MM-DD (default: all entries)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument("--chunk-mb", type=float, default=64.0, help="split JSONL files into chunks of this size")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    since, until = day_window(args.day) if args.day else (None, None)
+    source = args.source[0] if len(args.source) == 1 else args.source
+    snapshot = build_report(source, since, until, workers=args.workers, chunk_bytes=int(args.chunk_mb * 1024 * 1024))
+    if args.json:
+        print(json.dumps({**snapshot.summary(), "rejection_reasons": snapshot.rejection_reasons}))
+    else:
+        print(format_report(snapshot, f"Report {args.day}" if args.day else "Report"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Ordered, instrumented pre-trade rules used by PreTradeGuard.
+
+Each rule is a cheap predicate that returns a rejection reason (or None to
+pass). Rules keep call/rejection counters and cumulative nanosecond timings
+so the guard can report where its latency goes and reorder itself so the
+cheapest, most-rejecting checks run first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import RiskEngineConfig
+
+RuleCheck = Callable[["RiskEngineConfig", Any, Any, Any], "str | None"]
+
+_SIDES = frozenset({"long", "short"})
+
+
+@dataclass(frozen=True)
+class RuleStats:
+    name: str
+    calls: int
+    rejections: int
+    total_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejections / self.calls if self.calls else 0.0
+
+
+class GuardRule:
+    """A named check plus its hit counters."""
+
+    __slots__ = ("name", "check", "calls", "rejections", "total_ns")
+
+    def __init__(self, name: str, check: RuleCheck | None) -> None:
+        self.name = name
+        self.check = check
+        self.calls = 0
+        self.rejections = 0
+        self.total_ns = 0
+
+    def stats(self) -> RuleStats:
+        return RuleStats(self.name, self.calls, self.rejections, self.total_ns)
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.rejections = 0
+        self.total_ns = 0
+
+    def cost_per_rejection(self) -> float:
+        """Mean ns spent per rejection produced; lower runs earlier when reordering."""
+        if not self.rejections:
+            return float("inf")
+        return self.total_ns / self.rejections
+
+
+def check_side(config: RiskEngineConfig, state: Any, intent: Any, exposure: Any) -> str | None:
+    if intent.side not in _SIDES:
+        return "invalid_side"
+    return None
+
+
+def check_leverage_positive(config: RiskEngineConfig, state: Any, intent: Any, exposure: Any) -> str | None:
+    if intent.leverage <= 0:
+        return "invalid_leverage"
+    return None
+
+
+def check_leverage_cap(config: RiskEngineConfig, state: Any, intent: Any, exposure: Any) -> str | None:
+    if intent.leverage > config.max_leverage:
+        return "leverage_cap_exceeded"
+    return None
+
+
+def check_duplicate_symbol(config: RiskEngineConfig, state: Any, intent: Any, exposure: Any) -> str | None:
+    if exposure.has_position(intent.symbol):
+        return "duplicate_symbol_position"
+    return None
+
+
+def check_max_open_risk(config: RiskEngineConfig, state: Any, intent: Any, exposure: Any) -> str | None:
+    if exposure.open_risk_percent >= config.max_open_risk_percent:
+        return "max_open_risk_reached"
+    return None
+
+
+def default_rules() -> list[GuardRule]:
+    """The MVP guard checks, in their original short-circuit order."""
+    return [
+        GuardRule("side", check_side),
+        GuardRule("leverage_positive", check_leverage_positive),
+        GuardRule("leverage_cap", check_leverage_cap),
+        GuardRule("duplicate_symbol", check_duplicate_symbol),
+        GuardRule("max_open_risk", check_max_open_risk),
+    ]
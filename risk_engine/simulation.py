@@ -0,0 +1,185 @@
+"""Monte Carlo risk-of-ruin simulation for a RiskEngineConfig.
+
+Trade outcomes are drawn from an empirical distribution of R multiples
+(PnL divided by the risk budget of the trade, so a full stop-out is -1.0).
+Every path applies the same rules RiskEngine enforces live:
+
+- size so that a stop-out loses ``start_of_day_equity * risk_percent``
+- no new trades for the rest of the UTC day once the daily loss cap is hit
+- kill switch once ``max_consecutive_losses`` losses in a row are booked;
+  the streak only resets on a win, so a tripped switch halts the path
+
+Paths are vectorized with NumPy and split into fixed-size chunks that run on
+a process pool. Chunking does not depend on the worker count, so a given
+seed gives the same report whatever ``workers`` is.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from .core import RiskEngineConfig, _require_numpy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(frozen=True)
+class RuinReport:
+    """Per-path results; one element per simulated path."""
+
+    max_drawdown: np.ndarray  # fraction of running peak equity
+    final_equity: np.ndarray
+    ruined: np.ndarray
+    kill_switch_trade: np.ndarray  # trade opportunity index that tripped the switch, -1 if never
+    trades_taken: np.ndarray
+    trades_per_day: int
+
+    @property
+    def n_paths(self) -> int:
+        return int(self.final_equity.shape[0])
+
+    @property
+    def risk_of_ruin(self) -> float:
+        return float(self.ruined.mean())
+
+    @property
+    def kill_switch_rate(self) -> float:
+        return float((self.kill_switch_trade >= 0).mean())
+
+    def drawdown_percentiles(self, q: Any = (50, 90, 95, 99)) -> np.ndarray:
+        return np.percentile(self.max_drawdown, q)
+
+    def days_to_kill_switch(self) -> np.ndarray:
+        """Trading day (1-based) on which the kill switch tripped, for paths where it did."""
+        hit = self.kill_switch_trade[self.kill_switch_trade >= 0]
+        return hit // self.trades_per_day + 1
+
+    def summary(self) -> dict[str, float]:
+        days = self.days_to_kill_switch()
+        p50, p95, p99 = self.drawdown_percentiles((50, 95, 99)).tolist()
+        return {
+            "paths": float(self.n_paths),
+            "risk_of_ruin": self.risk_of_ruin,
+            "kill_switch_rate": self.kill_switch_rate,
+            "median_days_to_kill_switch": float(np.median(days)) if days.size else float("nan"),
+            "max_drawdown_p50": p50,
+            "max_drawdown_p95": p95,
+            "max_drawdown_p99": p99,
+            "median_final_equity": float(np.median(self.final_equity)),
+        }
+
+
+def _simulate_chunk(
+    config: RiskEngineConfig,
+    outcomes_r: np.ndarray,
+    n_paths: int,
+    n_days: int,
+    trades_per_day: int,
+    start_equity: float,
+    ruin_equity: float,
+    seed: Any,
+) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    equity = np.full(n_paths, float(start_equity))
+    peak = equity.copy()
+    max_dd = np.zeros(n_paths)
+    streak = np.zeros(n_paths, dtype=np.int64)
+    kill_trade = np.full(n_paths, -1, dtype=np.int64)
+    trades_taken = np.zeros(n_paths, dtype=np.int64)
+    killed = np.zeros(n_paths, dtype=bool)
+    ruined = np.zeros(n_paths, dtype=bool)
+    stopped = np.zeros(n_paths, dtype=bool)  # killed | ruined, kept in sync
+
+    # A switch that is already active (e.g. max_consecutive_losses == 0) blocks every trade.
+    if config.max_consecutive_losses <= 0:
+        killed[:] = True
+        stopped[:] = True
+        kill_trade[:] = 0
+
+    step = 0
+    for _ in range(n_days):
+        sod_equity = equity.copy()
+        max_daily_loss = sod_equity * config.daily_loss_cap_percent
+        risk_budget = sod_equity * config.risk_percent
+        realized = np.zeros(n_paths)
+
+        for _ in range(trades_per_day):
+            capped = np.abs(np.minimum(0.0, realized)) >= max_daily_loss
+            active = ~(stopped | capped) & (risk_budget > 0)
+            r = rng.choice(outcomes_r, size=n_paths)
+            pnl = np.where(active, r * risk_budget, 0.0)
+
+            equity += pnl
+            realized += pnl
+            trades_taken += active
+            streak = np.where(active & (pnl < 0), streak + 1, np.where(active & (pnl > 0), 0, streak))
+
+            newly_killed = active & (streak >= config.max_consecutive_losses)
+            kill_trade[newly_killed] = step
+            killed |= newly_killed
+
+            np.maximum(peak, equity, out=peak)
+            np.maximum(max_dd, (peak - equity) / peak, out=max_dd)
+            ruined |= equity <= ruin_equity
+            stopped = killed | ruined
+            step += 1
+
+    return max_dd, equity, ruined, kill_trade, trades_taken
+
+
+def simulate_risk_of_ruin(
+    config: RiskEngineConfig,
+    outcomes_r: Any,
+    n_paths: int = 10_000,
+    n_days: int = 30,
+    trades_per_day: int = 5,
+    start_equity: float = 10_000.0,
+    ruin_drawdown: float = 0.5,
+    seed: int | None = None,
+    workers: int | None = 1,
+    chunk_size: int = 2_048,
+) -> RuinReport:
+    """Simulate ``n_paths`` equity paths of ``n_days * trades_per_day`` trade opportunities.
+
+    ``outcomes_r`` is the empirical sample of trade results in R multiples.
+    A path is ruined once equity falls to ``start_equity * (1 - ruin_drawdown)``.
+    ``workers=1`` runs in-process; ``None`` uses one process per CPU.
+    """
+
+    _require_numpy()
+    outcomes = np.asarray(outcomes_r, dtype=np.float64).ravel()
+    if outcomes.size == 0:
+        raise ValueError("outcomes_r must not be empty")
+    if n_paths <= 0 or chunk_size <= 0:
+        raise ValueError("n_paths and chunk_size must be positive")
+
+    ruin_equity = start_equity * (1.0 - ruin_drawdown)
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [
+        (config, outcomes, size, n_days, trades_per_day, start_equity, ruin_equity, s)
+        for size, s in zip(sizes, seeds)
+    ]
+
+    if workers == 1 or len(jobs) == 1:
+        parts = [_simulate_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, *zip(*jobs)))
+
+    max_dd, equity, ruined, kill_trade, taken = (np.concatenate(cols) for cols in zip(*parts))
+    return RuinReport(
+        max_drawdown=max_dd,
+        final_equity=equity,
+        ruined=ruined,
+        kill_switch_trade=kill_trade,
+        trades_taken=taken,
+        trades_per_day=trades_per_day,
+    )
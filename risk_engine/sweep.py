@@ -0,0 +1,245 @@
+"""Parallel parameter sweep of RiskEngineConfig over historical trades.
+
+Each grid point replays the same trade list through a fresh PreTradeGuard,
+AccountLedger and ExposureBook: positions open at ``open_ts`` with the size
+the guard suggests, close at ``close_ts`` at ``exit_price``, and realized
+PnL feeds the ledger so the daily cap and kill switch act as they would live.
+
+The trade table is packed once into a float64 block in shared memory;
+worker processes attach to it by name instead of receiving a pickled copy
+per task, so large grids only ship the (small) configs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from multiprocessing import shared_memory
+from typing import Any
+
+from .core import AccountLedger, RiskEngine, RiskEngineConfig, _require_numpy
+from .execution import ExposureBook, PreTradeGuard, TradeIntent
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(frozen=True)
+class HistoricalTrade:
+    open_ts: float  # epoch seconds
+    close_ts: float
+    symbol: str
+    side: str  # long | short
+    entry_price: float
+    stop_price: float
+    exit_price: float
+    leverage: float = 1.0
+    contract_multiplier: float = 1.0
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    config: RiskEngineConfig
+    trades_taken: int
+    net_pnl: float
+    net_expectancy: float
+    max_drawdown: float
+    rejections: dict[str, int]
+
+    @property
+    def rejection_count(self) -> int:
+        return sum(self.rejections.values())
+
+
+# Column layout of the packed trade table.
+_OPEN, _CLOSE, _SYMBOL, _SIDE, _ENTRY, _STOP, _EXIT, _LEVERAGE, _MULTIPLIER = range(9)
+_N_COLUMNS = 9
+_SIDES = ("long", "short")
+
+
+def config_grid(base: RiskEngineConfig, **axes: Any) -> list[RiskEngineConfig]:
+    """Cartesian product of ``axes`` (field name -> values) applied to ``base``."""
+    names = {f.name for f in fields(RiskEngineConfig)}
+    unknown = set(axes) - names
+    if unknown:
+        raise ValueError(f"Unknown RiskEngineConfig fields: {sorted(unknown)}")
+    keys = list(axes)
+    return [replace(base, **dict(zip(keys, values))) for values in itertools.product(*axes.values())]
+
+
+def _pack(trades: list[HistoricalTrade]) -> tuple[np.ndarray, list[str]]:
+    symbols = sorted({t.symbol for t in trades})
+    index = {s: i for i, s in enumerate(symbols)}
+    table = np.empty((len(trades), _N_COLUMNS), dtype=np.float64)
+    for row, t in zip(table, sorted(trades, key=lambda t: t.open_ts)):
+        # Unknown sides are kept as -1 so the guard still rejects them as invalid_side.
+        side = _SIDES.index(t.side) if t.side in _SIDES else -1
+        row[:] = (
+            t.open_ts,
+            t.close_ts,
+            index[t.symbol],
+            side,
+            t.entry_price,
+            t.stop_price,
+            t.exit_price,
+            t.leverage,
+            t.contract_multiplier,
+        )
+    return table, symbols
+
+
+class _ReplayClock:
+    __slots__ = ("now",)
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def replay(
+    config: RiskEngineConfig,
+    table: np.ndarray,
+    symbols: list[str],
+    start_equity: float,
+) -> SweepResult:
+    """Replay a packed trade table under one config."""
+    clock = _ReplayClock(float(table[0, _OPEN]) if len(table) else 0.0)
+    ledger = AccountLedger(config, start_of_day_equity=start_equity, clock=clock)
+    book = ExposureBook(equity=start_equity)
+    guard = PreTradeGuard(RiskEngine(config), instrumented=False)
+
+    rejections: Counter[str] = Counter()
+    pending: list[tuple[float, int, str, float]] = []  # (close_ts, row, symbol, pnl)
+    equity = peak = start_equity
+    max_dd = 0.0
+    taken = 0
+
+    def settle(until: float) -> None:
+        nonlocal equity, peak, max_dd
+        while pending and pending[0][0] <= until:
+            close_ts, _, symbol, pnl = heapq.heappop(pending)
+            clock.now = max(clock.now, close_ts)
+            book.close(symbol)
+            ledger.record_closed_trade(pnl)
+            equity += pnl
+            book.equity = equity
+            if equity > peak:
+                peak = equity
+            elif peak > 0:
+                max_dd = max(max_dd, (peak - equity) / peak)
+
+    for row_index, row in enumerate(table.tolist()):
+        settle(row[_OPEN])
+        clock.now = max(clock.now, row[_OPEN])
+        side_code = int(row[_SIDE])
+        intent = TradeIntent(
+            symbol=symbols[int(row[_SYMBOL])],
+            side=_SIDES[side_code] if side_code >= 0 else "unknown",
+            entry_price=row[_ENTRY],
+            stop_price=row[_STOP],
+            leverage=row[_LEVERAGE],
+            contract_multiplier=row[_MULTIPLIER],
+        )
+        decision = guard.evaluate(ledger, intent, book)
+        if not decision.allowed:
+            rejections[decision.reason] += 1
+            continue
+
+        taken += 1
+        size = decision.suggested_size
+        direction = 1.0 if intent.side == "long" else -1.0
+        pnl = (row[_EXIT] - row[_ENTRY]) * direction * size * row[_MULTIPLIER]
+        book.open(intent.symbol, intent.entry_price, intent.stop_price, size, row[_MULTIPLIER])
+        heapq.heappush(pending, (row[_CLOSE], row_index, intent.symbol, pnl))
+
+    settle(float("inf"))
+    net = equity - start_equity
+    return SweepResult(
+        config=config,
+        trades_taken=taken,
+        net_pnl=net,
+        net_expectancy=net / taken if taken else 0.0,
+        max_drawdown=max_dd,
+        rejections=dict(rejections),
+    )
+
+
+# Per-worker view of the shared trade table, set by _attach.
+_worker_table: Any = None
+_worker_symbols: list[str] = []
+_worker_shm: Any = None
+
+
+def _attach(shm_name: str, shape: tuple[int, int], symbols: list[str]) -> None:
+    global _worker_table, _worker_symbols, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_table = np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf)
+    _worker_symbols = symbols
+
+
+def _replay_in_worker(config: RiskEngineConfig, start_equity: float) -> SweepResult:
+    return replay(config, _worker_table, _worker_symbols, start_equity)
+
+
+def run_sweep(
+    trades: list[HistoricalTrade],
+    configs: list[RiskEngineConfig],
+    start_equity: float = 10_000.0,
+    workers: int | None = None,
+    rank_by: str = "net_expectancy",
+) -> list[SweepResult]:
+    """Replay ``trades`` under every config and return results ranked best first.
+
+    ``rank_by`` is a SweepResult attribute; ``max_drawdown`` and
+    ``rejection_count`` rank ascending, everything else descending.
+    """
+
+    _require_numpy()
+    table, symbols = _pack(trades)
+
+    if workers == 1 or len(configs) <= 1:
+        results = [replay(cfg, table, symbols, start_equity) for cfg in configs]
+    else:
+        n_workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(configs) // (n_workers * 4))
+        shm = shared_memory.SharedMemory(create=True, size=max(table.nbytes, 1))
+        try:
+            shared = np.ndarray(table.shape, dtype=np.float64, buffer=shm.buf)
+            shared[:] = table
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_attach,
+                initargs=(shm.name, table.shape, symbols),
+            ) as pool:
+                results = list(
+                    pool.map(_replay_in_worker, configs, itertools.repeat(start_equity), chunksize=chunksize)
+                )
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+    ascending = rank_by in {"max_drawdown", "rejection_count"}
+    return sorted(results, key=lambda r: getattr(r, rank_by), reverse=not ascending)
+
+
+def format_table(results: list[SweepResult]) -> str:
+    """Plain-text ranking table, one line per config."""
+    header = "rank risk%  open%  lev  cap%  maxL  trades  expectancy    net_pnl  max_dd  rejected"
+    lines = [header]
+    for rank, r in enumerate(results, 1):
+        c = r.config
+        lines.append(
+            f"{rank:>4} {c.risk_percent * 100:5.2f} {c.max_open_risk_percent * 100:6.2f} {c.max_leverage:4.1f} "
+            f"{c.daily_loss_cap_percent * 100:5.2f} {c.max_consecutive_losses:5d} {r.trades_taken:7d} "
+            f"{r.net_expectancy:11.4f} {r.net_pnl:10.2f} {r.max_drawdown:7.4f} {r.rejection_count:9d}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,83 @@
+import json
+import tempfile
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+
+from benchmarks.__main__ import main
+from benchmarks.cases import all_cases
+from benchmarks.harness import BenchResult, compare, load_baseline, run_all, save
+
+
+def _result(name: str, ns: float) -> BenchResult:
+    return BenchResult(name=name, ops=1, rounds=1, ns_per_op=ns, min_ns_per_op=ns, stdev_ns_per_op=0.0)
+
+
+def test_suite_covers_hot_paths_and_runs_offline():
+    with ExitStack() as resources:
+        results = run_all(all_cases(resources, scale=0.001), rounds=1)
+    names = {r.name for r in results}
+
+    assert {
+        "guard.evaluate.allowed",
+        "wrapper.draft_order",
+        "wrapper.confirm_order",
+        "journal.record_decision",
+        "journal.flush_to_file",
+        "bybit._sign",
+        "bybit._headers",
+        "bybit.get_positions",
+        "bybit.get_order",
+        "ws._handle_message",
+    } <= names
+    assert all(r.ns_per_op > 0 for r in results)
+
+
+def test_compare_flags_only_regressions_beyond_threshold(tmp_path):
+    path = save([_result("a", 100.0), _result("b", 100.0)], tmp_path / "base.json")
+    baseline = load_baseline(path)
+
+    current = [_result("a", 120.0), _result("b", 130.0), _result("new", 1.0)]
+    regressions = compare(current, baseline, threshold=0.25)
+
+    assert [r.name for r in regressions] == ["b"]
+    assert regressions[0].ratio == 1.3
+    assert compare(current, baseline, threshold=0.25, overrides={"b": 0.5}) == []
+
+
+def test_cli_fails_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["-o", str(tmp_path / "out.json"), "-b", str(baseline), "-k", "bybit._sign", "-r", "1", "--scale", "0.01"]
+
+    assert main(args + ["--save-baseline"]) == 0
+    data = json.loads(baseline.read_text())
+    data["results"]["bybit._sign"]["ns_per_op"] = 0.001
+    baseline.write_text(json.dumps(data))
+
+    assert main(args) == 1
+
+
+def test_cli_fails_without_baseline_and_honours_thresholds_file(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["-o", str(tmp_path / "out.json"), "-b", str(baseline), "-k", "bybit._sign", "-r", "1", "--scale", "0.01"]
+    assert main(args) == 2
+
+    main(args + ["--save-baseline"])
+    data = json.loads(baseline.read_text())
+    data["results"]["bybit._sign"]["ns_per_op"] /= 10
+    baseline.write_text(json.dumps(data))
+    thresholds = tmp_path / "thresholds.json"
+    thresholds.write_text(json.dumps({"bybit._sign": 1_000.0}))
+    assert main(args + ["--thresholds", str(thresholds)]) == 0
+
+
+def test_cases_release_temp_dirs_and_writer_threads():
+    def leftovers():
+        return set(Path(tempfile.gettempdir()).glob("bangify-bench-*"))
+
+    dirs, threads = leftovers(), threading.active_count()
+    with ExitStack() as resources:
+        all_cases(resources, scale=0.001)
+        assert leftovers() > dirs
+    assert leftovers() == dirs
+    assert threading.active_count() == threads
@@ -1,7 +1,10 @@
+import time
+
 import pytest
+import requests
 
-from exchange.base import Balance, OrderSide, OrderType, Position, Ticker
-from exchange.bybit import BybitAdapter
+from exchange.base import Balance, ExchangeAdapter, OrderAmend, OrderRequest, OrderSide, OrderType, Position, Ticker
+from exchange.bybit import BybitAdapter, history_windows
 
 
 @pytest.fixture()
@@ -115,3 +118,254 @@ def test_get_ticker_live():
     ticker = adapter.get_ticker("BTCUSDT")
     assert ticker.symbol == "BTCUSDT"
     assert ticker.last > 0
+
+
+class _PathSession:
+    """requests.Session stand-in answering by endpoint path and recording calls."""
+
+    def __init__(self, results):
+        self.results = results
+        self.paths = []
+
+    def _answer(self, url, **kwargs):
+        path = url.split(".com", 1)[1]
+        self.paths.append(path)
+        return _JSONResponse({"retCode": 0, "retMsg": "OK", "result": self.results.get(path, {})})
+
+    get = post = _answer
+
+
+class _JSONResponse:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+ORDER_RESULTS = {
+    "/v5/order/create": {"orderId": "o-1"},
+    "/v5/order/realtime": {
+        "list": [{"orderId": "o-1", "symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "price": "50000",
+                  "qty": "0.01", "cumExecQty": "0.01", "orderStatus": "Filled", "createdTime": "1"}]
+    },
+    "/v5/position/list": {
+        "list": [{"symbol": "ETHUSDT", "side": "Buy", "size": "1", "avgPrice": "3000", "unrealisedPnl": "0",
+                  "leverage": "5"}]
+    },
+}
+
+
+def test_place_order_skips_unchanged_leverage(adapter: BybitAdapter):
+    adapter.session = _PathSession(ORDER_RESULTS)
+    adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=50000, leverage=3)
+    adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=50000, leverage=3)
+    assert adapter.session.paths.count("/v5/position/set-leverage") == 1
+
+    adapter.get_positions()  # leverage reported by positions seeds the cache too
+    adapter.place_order("ETHUSDT", OrderSide.BUY, OrderType.MARKET, 1, leverage=5)
+    assert adapter.session.paths.count("/v5/position/set-leverage") == 1
+
+    adapter.invalidate_leverage("BTCUSDT")
+    adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=50000, leverage=3)
+    assert adapter.session.paths.count("/v5/position/set-leverage") == 2
+
+
+def test_place_order_without_confirm_is_one_round_trip(adapter: BybitAdapter):
+    adapter.session = _PathSession(ORDER_RESULTS)
+    order = adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=50000, confirm=False)
+    assert adapter.session.paths == ["/v5/order/create"]
+    assert (order.order_id, order.side, order.order_type, order.price, order.qty) == ("o-1", "Buy", "Limit", 50000.0, 0.01)
+    assert order.status == "New" and order.filled_qty == 0.0
+
+    confirmed = adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=50000)
+    assert confirmed.status == "Filled"
+    assert adapter.session.paths[1:] == ["/v5/order/create", "/v5/order/realtime"]
+
+
+class _BatchSession:
+    """Answers batch endpoints per item; items with qty "0" are rejected."""
+
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, json=None, **kwargs):
+        self.requests.append((url.split(".com", 1)[1], json))
+        rows, infos = [], []
+        for i, item in enumerate(json["request"]):
+            bad = item.get("qty") == "0"
+            rows.append({"symbol": item["symbol"], "orderId": "" if bad else item.get("orderId", f"id-{i}"),
+                         "orderLinkId": item.get("orderLinkId", "")})
+            infos.append({"code": 10001, "msg": "Qty invalid"} if bad else {"code": 0, "msg": "OK"})
+        return _JSONResponse({"retCode": 0, "retMsg": "OK", "result": {"list": rows}, "retExtInfo": {"list": infos}})
+
+
+def test_place_orders_chunks_and_reports_per_order(adapter: BybitAdapter):
+    adapter.session = _BatchSession()
+    orders = [
+        OrderRequest("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0 if i == 23 else 0.01, price=50000,
+                     client_order_id=f"c-{i}")
+        for i in range(45)
+    ]
+    results = adapter.place_orders(orders)
+    sent = adapter.session.requests
+    assert [path for path, _ in sent] == ["/v5/order/create-batch"] * 3
+    assert [len(body["request"]) for _, body in sent] == [20, 20, 5]
+    assert sent[0][1]["category"] == "linear" and "category" not in sent[0][1]["request"][0]
+    assert len(results) == 45 and [r.client_order_id for r in results] == [f"c-{i}" for i in range(45)]
+    assert [i for i, r in enumerate(results) if not r.ok] == [23]
+    assert results[23].error == "10001: Qty invalid" and results[23].order_id is None
+
+
+def test_cancel_and_amend_orders_use_batch_endpoints(adapter: BybitAdapter):
+    adapter.session = _BatchSession()
+    cancelled = adapter.cancel_orders([("BTCUSDT", "a"), ("ETHUSDT", "b")])
+    amended = adapter.amend_orders([OrderAmend("BTCUSDT", "a", price=51000), OrderAmend("BTCUSDT", "b", qty=0)])
+    assert [r.order_id for r in cancelled] == ["a", "b"] and all(r.ok for r in cancelled)
+    assert [r.ok for r in amended] == [True, False]
+    assert adapter.session.requests[1] == (
+        "/v5/order/amend-batch",
+        {"category": "linear", "request": [{"symbol": "BTCUSDT", "orderId": "a", "price": "51000"},
+                                           {"symbol": "BTCUSDT", "orderId": "b", "qty": "0"}]},
+    )
+
+
+def test_base_batch_falls_back_to_single_orders():
+    class OneByOne(ExchangeAdapter):
+        def cancel_order(self, symbol, order_id):
+            if order_id == "gone":
+                raise RuntimeError("order not exists")
+            return True
+
+        def place_order(self, symbol, side, order_type, qty, *args, **kwargs):
+            return type("O", (), {"order_id": f"{symbol}-1"})()
+
+    adapter = OneByOne()
+    results = adapter.cancel_orders([("BTCUSDT", "x"), ("BTCUSDT", "gone")])
+    assert [r.ok for r in results] == [True, False] and results[1].error == "order not exists"
+    placed = adapter.place_orders([OrderRequest("ETHUSDT", OrderSide.SELL, OrderType.MARKET, 1.0, client_order_id="c-1")])
+    assert placed[0].ok and placed[0].order_id == "ETHUSDT-1"
+    assert placed[0].client_order_id is None  # never sent, so never reported
+
+
+ACCOUNT_RESULTS = {
+    **ORDER_RESULTS,
+    "/v5/account/wallet-balance": {
+        "list": [{"coin": [{"coin": "USDT", "walletBalance": "1000", "availableToWithdraw": "900"}]}]
+    },
+}
+
+
+def test_account_snapshot_is_cached_per_part(adapter: BybitAdapter):
+    adapter.session = _PathSession(ACCOUNT_RESULTS)
+    assert adapter.get_balance("USDT").available_balance == 900.0
+    assert adapter.session.paths == ["/v5/account/wallet-balance"]
+
+    info = adapter.get_account_info()
+    assert info.total_equity == 1000.0 and adapter.get_equity() == 1000.0
+    assert list(adapter.get_exposure()) == ["ETHUSDT"]
+    assert adapter.get_positions("ETHUSDT")[0].leverage == 5.0  # served from the all-positions snapshot
+    assert adapter.session.paths == ["/v5/account/wallet-balance", "/v5/position/list"]
+
+    adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.MARKET, 0.01, confirm=False)
+    adapter.get_account_info()
+    assert adapter.session.paths[-2:] == ["/v5/account/wallet-balance", "/v5/position/list"]
+
+
+def test_get_tickers_is_one_request_and_feeds_get_ticker(adapter: BybitAdapter):
+    listing = [
+        {"symbol": f"C{i}USDT", "bid1Price": str(i), "ask1Price": str(i + 1), "lastPrice": str(i), "time": "1"}
+        for i in range(200)
+    ]
+    adapter.session = _PathSession({"/v5/market/tickers": {"list": listing}})
+    every = adapter.get_tickers()
+    assert len(every) == 200 and every["C7USDT"].ask == 8.0
+    subset = adapter.get_tickers(["C1USDT", "C199USDT", "NOPEUSDT"])
+    assert list(subset) == ["C1USDT", "C199USDT"]
+    assert adapter.get_ticker("C42USDT").last == 42.0
+    assert adapter.session.paths == ["/v5/market/tickers"]
+
+    adapter.cache.invalidate("tickers")
+    adapter.get_tickers(["C1USDT"])
+    assert adapter.session.paths == ["/v5/market/tickers"] * 2
+
+
+class _PagedSession:
+    """Serves ``total`` rows per endpoint in pages of ``limit``, cursor = next row index."""
+
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):
+        path = url.split(".com", 1)[1]
+        self.calls.append((path, dict(params)))
+        start = int(params.get("cursor") or 0)
+        stop = min(self.total, start + int(params["limit"]))
+        rows = [self._row(path, i) for i in range(start, stop)]
+        cursor = str(stop) if stop < self.total else ""
+        return _JSONResponse({"retCode": 0, "result": {"list": rows, "nextPageCursor": cursor}})
+
+    @staticmethod
+    def _row(path, i):
+        if path == "/v5/position/list":
+            return {"symbol": f"C{i}USDT", "side": "Buy", "size": "1", "avgPrice": "1", "unrealisedPnl": "0",
+                    "leverage": "2"}
+        return {"execId": f"e{i}", "orderId": f"o{i}", "symbol": "BTCUSDT", "side": "Sell", "execPrice": "100",
+                "execQty": "0.1", "execFee": "0.01", "isMaker": True, "execTime": str(i)}
+
+
+def test_get_positions_follows_cursor(adapter: BybitAdapter):
+    adapter.session = _PagedSession(450)
+    positions = adapter.get_positions()
+    assert len(positions) == 450 and positions[-1].symbol == "C449USDT"
+    assert [c[1].get("cursor") for c in adapter.session.calls] == [None, "200", "400"]
+
+
+def test_iter_executions_prefetches_next_page(adapter: BybitAdapter):
+    adapter.session = _PagedSession(250)
+    executions = adapter.iter_executions(start_time=1_000, end_time=2_000)
+    first = next(executions)
+    assert first.exec_id == "e0" and first.fee == 0.01 and first.is_maker
+    deadline = time.monotonic() + 2
+    while len(adapter.session.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(adapter.session.calls) == 2  # page 2 requested while page 1 is consumed
+    rest = list(executions)
+    assert len(rest) == 249 and len(adapter.session.calls) == 3
+    assert adapter.session.calls[0] == (
+        "/v5/execution/list",
+        {"category": "linear", "limit": 100, "startTime": 1_000, "endTime": 2_000},
+    )
+
+
+def test_history_windows_split_long_ranges_newest_first():
+    day = 24 * 3_600 * 1_000
+    windows = history_windows(0, 20 * day - 1)
+    assert windows == [(13 * day, 20 * day - 1), (6 * day, 13 * day - 1), (0, 6 * day - 1)]
+    assert history_windows(None, None) == [(None, None)]
+
+
+def test_place_orders_reports_chunks_around_a_transport_failure(adapter: BybitAdapter):
+    session = _BatchSession()
+    answer = session.post
+
+    def post(url, json=None, **kwargs):
+        if len(session.requests) == 1:  # second chunk times out
+            session.requests.append((url, json))
+            raise requests.Timeout("read timed out")
+        return answer(url, json=json, **kwargs)
+
+    session.post = post
+    adapter.session = session
+    orders = [OrderRequest("BTCUSDT", OrderSide.BUY, OrderType.MARKET, 0.01) for _ in range(45)]
+    results = adapter.place_orders(orders)
+    assert len(session.requests) == 3 and len(results) == 45
+    assert all(r.ok for r in results[:20]) and all(r.ok for r in results[40:])
+    assert not any(r.ok for r in results[20:40]) and "read timed out" in results[25].error
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from exchange.base import OrderRequest, OrderSide, OrderType  # noqa: E402
+from exchange.bybit import BybitAdapter  # noqa: E402
+from exchange.bybit_async import AsyncBybitAdapter  # noqa: E402
+
+DELAY = 0.3
+
+RESPONSES = {
+    "/v5/account/wallet-balance": {
+        "list": [{"coin": [{"coin": "USDT", "walletBalance": "1000.5", "availableToWithdraw": "800"}]}]
+    },
+    "/v5/position/list": {
+        "list": [
+            {"symbol": "BTCUSDT", "side": "Buy", "size": "0.01", "avgPrice": "67000", "unrealisedPnl": "-2.5",
+             "leverage": "3"}
+        ]
+    },
+    "/v5/market/tickers": {
+        "list": [{"symbol": "BTCUSDT", "bid1Price": "66999.5", "ask1Price": "67000", "lastPrice": "67000",
+                  "time": "1760000000000"}]
+    },
+    "/v5/position/set-leverage": {"retMsg": "OK"},
+    "/v5/order/create": {"orderId": "abc123"},
+    "/v5/order/cancel": {"retMsg": "OK"},
+    "/v5/order/realtime": {
+        "list": [{"orderId": "abc123", "symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "price": "67000",
+                  "qty": "0.01", "cumExecQty": "0", "orderStatus": "New", "createdTime": "1760000000000"}]
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _answer(self, params):
+        path = urlparse(self.path).path
+        self.server.calls.append((self.command, path, params, dict(self.headers)))
+        if path in ("/v5/account/wallet-balance", "/v5/position/list"):
+            time.sleep(DELAY)
+        if path == "/v5/error":
+            body = {"retCode": 10001, "retMsg": "params error", "result": {}}
+        elif path == "/v5/order/history":
+            start = int(params.get("cursor") or 0)
+            stop = min(120, start + int(params["limit"]))
+            rows = [{**RESPONSES["/v5/order/realtime"]["list"][0], "orderId": f"h{i}"} for i in range(start, stop)]
+            body = {"retCode": 0, "result": {"list": rows, "nextPageCursor": str(stop) if stop < 120 else ""}}
+        else:
+            body = {"retCode": 0, "retMsg": "OK", "result": RESPONSES.get(path, {})}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._answer(dict(parse_qsl(urlparse(self.path).query)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._answer(json.loads(self.rfile.read(length) or b"{}"))
+
+
+@pytest.fixture()
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.calls = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _adapter(server):
+    return AsyncBybitAdapter("key", "secret", base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+
+def test_account_info_fetches_wallet_and_positions_concurrently(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            start = time.perf_counter()
+            info = await adapter.get_account_info()
+            return info, time.perf_counter() - start
+
+    info, elapsed = asyncio.run(run())
+    assert info.total_equity == 1000.5 and info.total_available_balance == 800.0
+    assert info.positions[0].symbol == "BTCUSDT" and info.positions[0].leverage == 3.0
+    assert elapsed < 2 * DELAY  # sequential would take at least 2 * DELAY
+
+
+def test_requests_are_signed_like_sync_adapter(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            await adapter.get_ticker("BTCUSDT")
+            await adapter.cancel_order("BTCUSDT", "abc123")
+
+    asyncio.run(run())
+    sync = BybitAdapter("key", "secret")
+    for method, _, params, headers in server.calls:
+        assert headers["X-BAPI-API-KEY"] == "key"
+        assert headers["X-BAPI-SIGN"] == sync._sign(params, int(headers["X-BAPI-TIMESTAMP"]))
+    assert [c[:3] for c in server.calls] == [
+        ("GET", "/v5/market/tickers", {"category": "linear", "symbol": "BTCUSDT"}),
+        ("POST", "/v5/order/cancel", {"category": "linear", "symbol": "BTCUSDT", "orderId": "abc123"}),
+    ]
+
+
+def test_place_order_and_parsing(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            order = await adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.LIMIT, 0.01, price=67000, leverage=3)
+            tickers = await asyncio.gather(*(adapter.get_ticker("BTCUSDT") for _ in range(5)))
+            balance = await adapter.get_balance("USDT")
+            return order, tickers, balance
+
+    order, tickers, balance = asyncio.run(run())
+    assert order.order_id == "abc123" and order.price == 67000.0 and order.status == "New"
+    assert all(t.bid == 66999.5 for t in tickers)
+    assert balance.available_balance == 800.0
+    paths = [c[1] for c in server.calls[:3]]
+    assert paths == ["/v5/position/set-leverage", "/v5/order/create", "/v5/order/realtime"]
+    assert server.calls[1][2]["price"] == "67000"
+
+
+def test_api_error_raises(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            await adapter._request("GET", "/v5/error", {"category": "linear"})
+
+    with pytest.raises(RuntimeError, match="Bybit API error"):
+        asyncio.run(run())
+
+
+def test_batch_orders_send_chunks_concurrently(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            orders = [OrderRequest("BTCUSDT", OrderSide.BUY, OrderType.MARKET, 0.01) for _ in range(25)]
+            return await adapter.place_orders(orders)
+
+    results = asyncio.run(run())
+    assert len(results) == 25 and all(r.ok for r in results)
+    sizes = sorted(len(c[2]["request"]) for c in server.calls if c[1] == "/v5/order/create-batch")
+    assert sizes == [5, 20]
+
+
+def test_get_tickers_filters_one_category_request(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            return await adapter.get_tickers(["BTCUSDT", "ETHUSDT"])
+
+    tickers = asyncio.run(run())
+    assert list(tickers) == ["BTCUSDT"] and tickers["BTCUSDT"].ask == 67000.0
+    assert server.calls[0][2] == {"category": "linear"}
+
+
+def test_iter_order_history_follows_cursor(server):
+    async def run():
+        async with _adapter(server) as adapter:
+            return [o.order_id async for o in adapter.iter_order_history(symbol="BTCUSDT")]
+
+    ids = asyncio.run(run())
+    assert ids == [f"h{i}" for i in range(120)]
+    assert [c[2].get("cursor") for c in server.calls] == [None, "50", "100"]
@@ -0,0 +1,48 @@
+from exchange.cache import SnapshotCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parts_expire_on_their_own_ttl():
+    clock = _Clock()
+    cache = SnapshotCache(wallet_ttl=5.0, positions_ttl=1.0, tickers_ttl=0.5, clock=clock)
+    loads = []
+
+    def loader(value):
+        def load():
+            loads.append(value)
+            return value
+
+        return load
+
+    assert cache.get("wallet", "UNIFIED", loader("w1")) == "w1"
+    assert cache.get("positions", None, loader("p1")) == "p1"
+    clock.now = 2.0
+    assert cache.get("wallet", "UNIFIED", loader("w2")) == "w1"
+    assert cache.get("positions", None, loader("p2")) == "p2"
+    assert loads == ["w1", "p1", "p2"]
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_invalidate_drops_entries_and_discards_in_flight_loads():
+    cache = SnapshotCache(clock=_Clock())
+    cache.put("tickers", "BTCUSDT", 1)
+    cache.put("tickers", "ETHUSDT", 2)
+    cache.invalidate("tickers", "BTCUSDT")
+    assert cache.peek("tickers", "BTCUSDT") is None and cache.peek("tickers", "ETHUSDT") == 2
+
+    def stale_load():
+        cache.invalidate("positions")  # our own order lands while the request is in flight
+        return ["stale"]
+
+    assert cache.get("positions", None, stale_load) == ["stale"]
+    assert cache.peek("positions", None) is None
+
+    cache.invalidate()
+    assert cache.peek("tickers", "ETHUSDT") is None
@@ -1,5 +1,8 @@
+import tempfile
+
 from risk_engine.core import AccountState, RiskEngine, RiskEngineConfig
-from risk_engine.execution import ExecutionWrapper, ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.execution import ExecutionWrapper, ExposureBook, ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.journal import Journal
 
 
 def _engine() -> RiskEngine:
@@ -61,3 +64,42 @@ def test_confirm_order_success() -> None:
     confirmed = wrapper.confirm_order(draft, " confirm ")
     assert confirmed.draft.client_order_id.startswith("draft-")
     assert confirmed.confirmation.value == "CONFIRM"
+
+
+def test_draft_order_accepts_exposure_book() -> None:
+    wrapper = ExecutionWrapper(PreTradeGuard(_engine()))
+    book = ExposureBook(equity=1000)
+    book.open("BTCUSDT", entry_price=100.0, stop_price=99.0, size=1.0)
+
+    decision, draft = wrapper.draft_order(_state(), _intent(), book)
+    assert decision.reason == "duplicate_symbol_position"
+    assert draft is None
+
+    decision, draft = wrapper.draft_order(_state(), _intent(symbol="ETHUSDT"), book)
+    assert decision.allowed is True
+    assert draft is not None
+
+
+def test_stage_timing_collects_histograms_when_enabled() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        wrapper = ExecutionWrapper(PreTradeGuard(_engine()), journal=Journal(log_dir=td), timing=True)
+        for _ in range(10):
+            _, draft = wrapper.draft_order(_state(), _intent(), ExposureState())
+            wrapper.confirm_order(draft, "CONFIRM")
+
+        snap = wrapper.latency_snapshot()
+        assert snap["guard"].count == 10
+        assert snap["id"].count == 10
+        assert snap["confirm"].count == 10
+        assert snap["journal"].count == 30  # decision + draft + confirmation
+        assert snap["guard"].p99_ns >= snap["guard"].p50_ns
+
+        wrapper.reset_latency()
+        assert wrapper.latency_snapshot()["guard"].count == 0
+
+
+def test_stage_timing_disabled_by_default() -> None:
+    wrapper = ExecutionWrapper(PreTradeGuard(_engine()))
+    wrapper.draft_order(_state(), _intent(), ExposureState())
+    assert wrapper.timers is None
+    assert wrapper.latency_snapshot() == {}
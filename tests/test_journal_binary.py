@@ -0,0 +1,126 @@
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from risk_engine.execution import (  # noqa: E402
+    DraftOrder,
+    ExecutionDecision,
+    ExposureState,
+    TradeIntent,
+)
+from risk_engine.journal import Journal, JournalEntry  # noqa: E402
+from risk_engine.journal_binary import (  # noqa: E402
+    BinaryEventLog,
+    BinaryJournal,
+    binary_to_jsonl,
+    entry_args,
+    iter_events,
+    jsonl_to_binary,
+    read_events,
+)
+
+INTENT = TradeIntent("BTCUSDT", "long", 65000.5, 64000.0, 2.0)
+
+
+def _record(journal):
+    journal.record_decision(ExecutionDecision(True, "ok", 0.0123), INTENT, ExposureState(0.001, True))
+    journal.record_decision(ExecutionDecision(False, "max_open_risk_exceeded"), INTENT, ExposureState())
+    journal.record_decision(ExecutionDecision(False, "kill_switch_active"))
+    journal.record_draft(DraftOrder(INTENT, 0.0123, "draft-0123456789ab"), ExecutionDecision(True, "ok", 0.0123))
+    journal.record_draft(
+        DraftOrder(TradeIntent("ETHUSDT", "short", 3000.0, 3100.0, 1.0, 0.1), 2.5, "draft-ba9876543210"),
+        ExecutionDecision(True, "ok", 2.5),
+    )
+
+
+def test_read_events_zero_copy_columns():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = BinaryJournal(log_dir=tmp)
+        _record(journal)
+        journal.close()
+
+        ev = read_events(journal.events.path)
+        assert len(ev) == 5
+        assert not ev.records.flags.owndata  # view over the mapped file
+        assert ev["event"].tolist() == [0, 0, 0, 1, 1]
+        assert ev["allowed"].tolist() == [1, 0, 0, -1, -1]
+        assert ev.reasons[ev["reason"][1]] == "max_open_risk_exceeded"
+        btc = ev["symbol"] == ev.symbol_code("BTCUSDT")
+        assert btc.tolist() == [True, True, False, True, False]
+        assert np.isnan(ev["entry_price"][2])
+        assert ev["size"][4] == 2.5
+        assert (np.diff(ev["ts_ns"]) >= 0).all()
+        assert [e.data.get("client_order_id") for e in ev.entries()][3:] == ["draft-0123456789ab", "draft-ba9876543210"]
+        assert (journal.events.path.stat().st_size - 16) == 5 * 104
+
+
+def test_binary_journal_notifies_listeners_with_equivalent_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        seen = []
+        journal = BinaryJournal(log_dir=tmp)
+        journal.subscribe(seen.append)
+        _record(journal)
+        journal.record_rejection("draft_required")
+        journal.close()
+
+        decoded = list(iter_events(journal.events.path))
+        assert [e for e in seen if e.event_type != "rejection"] == decoded
+
+
+def test_jsonl_round_trip_is_byte_identical():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        _record(journal)
+        journal.record_rejection("draft_required")
+        source = journal.flush_to_file("day.jsonl")
+
+        assert jsonl_to_binary(source, Path(tmp) / "day.bin") == (5, 0)
+        assert binary_to_jsonl(Path(tmp) / "day.bin", Path(tmp) / "back.jsonl") == 5
+        original = [line for line in source.read_text().splitlines() if '"rejection"' not in line]
+        assert (Path(tmp) / "back.jsonl").read_text().splitlines() == original
+
+
+def test_unrepresentable_entries_are_skipped():
+    base = {"allowed": True, "reason": "ok", "suggested_size": 1.0, "intent": None, "exposure": None}
+    ok = JournalEntry("ab" * 16, "2026-03-01T10:00:00.123456+00:00", "decision", base)
+    assert entry_args(ok) is not None
+    assert entry_args(JournalEntry("not-hex", ok.timestamp, "decision", base)) is None
+    assert entry_args(JournalEntry(ok.id, "2026-03-01T10:00:00+02:00", "decision", base)) is None
+    assert entry_args(JournalEntry(ok.id, ok.timestamp, "decision", {**base, "suggested_size": 1})) is None
+    assert entry_args(JournalEntry(ok.id, ok.timestamp, "decision", {**base, "extra": 1})) is None
+    assert entry_args(JournalEntry(ok.id, ok.timestamp, "decision", base, {"m": 1})) is None
+    assert entry_args(JournalEntry(ok.id, ok.timestamp, "rejection", base)) is None
+
+
+def test_reopen_appends_and_drops_torn_record():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.bin"
+        log = BinaryEventLog(path)
+        log.append_decision(ExecutionDecision(True, "ok", 1.0), INTENT)
+        log.close()
+        with path.open("ab") as f:
+            f.write(b"\x01" * 40)  # half-written record
+
+        log = BinaryEventLog(path)
+        assert log.count == 1
+        log.append_decision(ExecutionDecision(False, "new_reason"), INTENT)
+        log.close()
+
+        entries = list(iter_events(path))
+        assert [e.data["reason"] for e in entries] == ["ok", "new_reason"]
+        assert json.loads((Path(tmp) / "events.bin.dict.json").read_text())["reasons"] == ["ok", "new_reason"]
+
+
+def test_binary_journal_returns_entries_like_journal():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = BinaryJournal(log_dir=tmp)
+        entry = journal.record_decision(ExecutionDecision(True, "ok", 0.0123), INTENT, ExposureState(0.001, True))
+        draft = journal.record_draft(DraftOrder(INTENT, 0.0123, "draft-0123456789ab"), ExecutionDecision(True, "ok", 0.0123))
+        journal.close()
+
+        assert isinstance(entry, JournalEntry) and entry.data["allowed"] is True
+        assert list(iter_events(journal.events.path)) == [entry, draft]
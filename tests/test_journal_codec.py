@@ -0,0 +1,96 @@
+import json
+import tempfile
+from collections import namedtuple
+from dataclasses import asdict, dataclass
+
+import pytest
+
+from risk_engine.execution import (
+    ConfirmationToken,
+    ConfirmedOrder,
+    DraftOrder,
+    ExecutionDecision,
+    ExposureState,
+    TradeIntent,
+)
+from risk_engine.journal import Journal, JournalEntry, encode_entry
+from risk_engine.journal_codec import to_dict
+
+Pair = namedtuple("Pair", "a b")
+
+
+@dataclass(frozen=True)
+class _Tagged(JournalEntry):
+    tag: str = "x"
+
+
+def _objects():
+    intent = TradeIntent("BTCUSDT", "long", 65000.1, 64000.0, 5.0)
+    draft = DraftOrder(intent, 0.123456789, "coid-1")
+    return [
+        intent,
+        ExposureState(1.25, True),
+        ExecutionDecision(False, "daily_loss_cap", 0.0),
+        draft,
+        ConfirmedOrder(draft, ConfirmationToken("tok")),
+    ]
+
+
+@pytest.mark.parametrize("obj", _objects(), ids=lambda o: type(o).__name__)
+def test_to_dict_matches_asdict(obj):
+    assert to_dict(obj) == asdict(obj)
+    assert json.dumps(to_dict(obj)) == json.dumps(asdict(obj))
+
+
+def test_to_dict_copies_containers_like_asdict():
+    @dataclass
+    class Holder:
+        items: list
+        pair: Pair
+        nested: dict
+
+    holder = Holder([_objects()[0]], Pair(1, [2]), {"k": [1, 2]})
+    result = to_dict(holder)
+    assert result == asdict(holder)
+    assert result["items"][0] == asdict(_objects()[0])
+    assert isinstance(result["pair"], Pair)
+    assert result["nested"]["k"] is not holder.nested["k"]
+
+
+def test_to_dict_rejects_non_dataclass():
+    with pytest.raises(TypeError):
+        to_dict({"symbol": "BTCUSDT"})
+    with pytest.raises(TypeError):
+        to_dict(TradeIntent)
+
+
+def test_encode_entry_is_byte_identical():
+    entries = [
+        JournalEntry("a", "2024-01-01T00:00:00+00:00", "custom", {"k": 1}),
+        JournalEntry("b", "t", "custom", {"nan": float("nan"), "inf": float("-inf"), "f": 0.1 + 0.2}, {"m": None}),
+        JournalEntry("c", "t", "custom", {"text": "café ☃ \"q\"\n", 1: (1, 2), "none": None}),
+        JournalEntry("d", "t", "custom", {"intent": _objects()[0], "orders": [_objects()[3]]}),
+        JournalEntry("e", "t", "custom", {}, {}),
+        _Tagged("f", "t", "custom", {"k": True}, None, "y"),
+    ]
+    for entry in entries:
+        assert encode_entry(entry) == json.dumps(asdict(entry))
+
+
+def test_encode_entry_rejects_unserializable_data():
+    with pytest.raises(TypeError):
+        encode_entry(JournalEntry("a", "t", "custom", {"obj": object()}))
+
+
+def test_journal_file_matches_asdict_encoding():
+    intent, exposure, decision, draft, confirmed = _objects()
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        journal.record_decision(decision, intent, exposure)
+        journal.record_decision(decision)
+        journal.record_draft(draft, decision)
+        journal.record_confirmation(confirmed)
+        journal.record_rejection("stale_quote", {"draft_id": "coid-1"})
+        expected = [json.dumps(asdict(e)) for e in journal._buffer]
+        path = journal.flush_to_file("codec.jsonl")
+        assert path.read_text(encoding="utf-8").splitlines() == expected
@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from risk_engine.journal import JournalEntry, encode_entry
+from risk_engine.journal_reader import INDEX_SUFFIX, LineIndex, read_journal
+from risk_engine.journal_segments import SegmentStore
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _ts(i: int) -> str:
+    return (T0 + timedelta(seconds=i)).isoformat()
+
+
+def _entries(n: int, start: int = 0) -> list[JournalEntry]:
+    out = []
+    for i in range(start, start + n):
+        if i % 3 == 0:
+            data = {"allowed": False, "reason": "max_open_risk_reached", "intent": {"symbol": "ETHUSDT"}}
+            out.append(JournalEntry(f"id{i}", _ts(i), "decision", data))
+        elif i % 3 == 1:
+            data = {"client_order_id": f"draft-{i}", "size": 1.0, "intent": {"symbol": "BTCUSDT"}}
+            out.append(JournalEntry(f"id{i}", _ts(i), "draft_order", data))
+        else:
+            data = {"reason": "confirmation_required", "details": {"draft_id": f"draft-{i - 1}"}}
+            out.append(JournalEntry(f"id{i}", _ts(i), "rejection", data))
+    return out
+
+
+def _write(path, entries) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for e in entries:
+            f.write(encode_entry(e) + "\n")
+
+
+def test_filters_by_event_type_symbol_and_client_order_id(tmp_path):
+    _write(tmp_path / "journal_20260301_000000.jsonl", _entries(30))
+
+    decisions = list(read_journal(tmp_path, event_type="decision"))
+    assert [e.id for e in decisions] == [f"id{i}" for i in range(0, 30, 3)]
+    assert decisions[0] == _entries(1)[0]
+
+    btc = list(read_journal(tmp_path, symbol="BTCUSDT"))
+    assert {e.event_type for e in btc} == {"draft_order"}
+
+    lifecycle = list(read_journal(tmp_path, client_order_id="draft-4"))
+    assert [e.event_type for e in lifecycle] == ["draft_order", "rejection"]
+
+
+def test_time_range_uses_line_index_and_matches_full_scan(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    _write(path, _entries(5_000))
+
+    since, until = _ts(1_234), _ts(3_210)
+    indexed = [e.id for e in read_journal(path, since=since, until=until, stride=64)]
+    scanned = [e.id for e in read_journal(path, since=since, until=until, use_index=False)]
+
+    assert indexed == scanned == [f"id{i}" for i in range(1_234, 3_210)]
+    index = LineIndex.load(path.with_name(path.name + INDEX_SUFFIX))
+    assert index.lines == 5_000
+    assert len(index.offsets) == 79
+
+
+def test_index_extends_when_file_grows(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    _write(path, _entries(100))
+    assert len(list(read_journal(path, since=_ts(50), stride=16))) == 50
+
+    _write(path, _entries(100, start=100))
+    assert len(list(read_journal(path, since=_ts(150), stride=16))) == 50
+    assert LineIndex.load(path.with_name(path.name + INDEX_SUFFIX)).lines == 200
+
+
+def test_reads_sealed_segments_and_skips_by_footer(tmp_path):
+    store = SegmentStore(tmp_path, block_lines=50)
+    store.append_lines([encode_entry(e) for e in _entries(300)])
+    store.roll()
+    store.append_lines([encode_entry(e) for e in _entries(10, start=300)])  # active raw segment
+
+    got = [e.id for e in read_journal(tmp_path, since=_ts(120), until=_ts(130))]
+    assert got == [f"id{i}" for i in range(120, 130)]
+
+    tail = [e.id for e in read_journal(tmp_path, since=_ts(305))]
+    assert tail == [f"id{i}" for i in range(305, 310)]
+    assert list(read_journal(tmp_path, event_type="confirmation")) == []
+    store.close()
+
+
+def test_ignores_partial_trailing_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    _write(path, _entries(3))
+    with open(path, "a") as f:
+        f.write(json.dumps({"id": "partial"})[:10])
+
+    assert [e.id for e in read_journal(path, since=_ts(0))] == ["id0", "id1", "id2"]
@@ -0,0 +1,107 @@
+import gzip
+import json
+
+from risk_engine.journal_segments import (
+    SegmentedJournal,
+    SegmentStore,
+    iter_sealed_lines,
+    list_segments,
+    read_footer,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rolls_by_size_and_seals_with_footer(tmp_path):
+    journal = SegmentedJournal(str(tmp_path), batch_size=10, max_segment_bytes=4_000, block_lines=7)
+    for i in range(100):
+        journal.record("decision" if i % 4 else "rejection", {"i": i})
+    journal.close()
+
+    segments = list_segments(tmp_path)
+    assert len(segments) > 1
+    assert all(p.name.endswith(".jsonl.gz") for p in segments)
+
+    seen = []
+    counts = {}
+    for path in segments:
+        footer = read_footer(path)
+        assert footer.count == sum(b.count for b in footer.blocks)
+        assert footer.first_ts <= footer.last_ts
+        for k, v in footer.event_counts.items():
+            counts[k] = counts.get(k, 0) + v
+        # still a valid (multi-member) gzip file for standard tools
+        with gzip.open(path, "rb") as f:
+            data = f.read(footer.blocks[-1].raw_offset + 1)
+        assert data.startswith(b"{")
+        seen += [json.loads(line)["data"]["i"] for line in iter_sealed_lines(path)]
+
+    assert seen == list(range(100))
+    assert counts == {"decision": 75, "rejection": 25}
+
+
+def test_rolls_by_age(tmp_path):
+    clock = _Clock()
+    store = SegmentStore(tmp_path, max_segment_age_s=60, clock=clock)
+    store.append_lines(['{"timestamp": "a", "event_type": "x"}'])
+    clock.now += 61
+    store.append_lines(['{"timestamp": "b", "event_type": "x"}'])
+
+    names = [p.name for p in list_segments(tmp_path)]
+    assert names == ["segment-000001.jsonl.gz", "segment-000002.jsonl"]
+    store.close()
+
+
+def test_time_window_skips_blocks_and_segments(tmp_path):
+    store = SegmentStore(tmp_path, block_lines=10)
+    store.append_lines([json.dumps({"timestamp": f"2026-01-01T00:00:{i:02d}", "event_type": "e", "i": i}) for i in range(50)])
+    (path,) = [store.roll()]
+
+    footer = read_footer(path)
+    assert len(footer.blocks) == 5
+    assert not footer.overlaps(since="2026-01-02")
+    window = [json.loads(l)["i"] for l in iter_sealed_lines(path, since="2026-01-01T00:00:25", until="2026-01-01T00:00:31")]
+    # whole overlapping blocks are returned; callers filter exact bounds
+    assert window == list(range(20, 40))
+
+
+def test_retention_bounds_sealed_segments(tmp_path):
+    store = SegmentStore(tmp_path, retention_segments=2)
+    for i in range(5):
+        store.append_lines([json.dumps({"timestamp": str(i), "event_type": "e"})])
+        store.roll()
+
+    assert [p.name for p in list_segments(tmp_path)] == ["segment-000004.jsonl.gz", "segment-000005.jsonl.gz"]
+
+
+def test_unsealed_segment_from_crash_is_sealed_on_startup(tmp_path):
+    (tmp_path / "segment-000003.jsonl").write_text('{"timestamp": "t", "event_type": "e"}\n')
+
+    store = SegmentStore(tmp_path)
+    assert [p.name for p in list_segments(tmp_path)] == ["segment-000003.jsonl.gz"]
+    store.append_lines(['{"timestamp": "u", "event_type": "e"}'])
+    assert store.active_path.name == "segment-000004.jsonl"
+    store.close()
+
+
+def test_reopen_after_crash_drops_torn_last_line(tmp_path):
+    good = [json.dumps({"id": str(i), "timestamp": f"t{i}", "event_type": "decision", "data": {}}) for i in range(3)]
+    raw = tmp_path / "segment-000001.jsonl"
+    raw.write_bytes(("\n".join(good) + '\n{"timestamp": "u", "ev').encode())
+    torn_with_newline = tmp_path / "segment-000002.jsonl"
+    torn_with_newline.write_bytes((good[0] + '\n{"timestamp": "u", "ev\n').encode())
+
+    store = SegmentStore(tmp_path)
+    store.append_lines([good[1]])
+    store.close()
+
+    segments = list_segments(tmp_path)
+    assert [p.name for p in segments] == ["segment-000001.jsonl.gz", "segment-000002.jsonl.gz", "segment-000003.jsonl.gz"]
+    assert [read_footer(p).count for p in segments] == [3, 1, 1]
+    assert b"".join(iter_sealed_lines(segments[0])) == ("\n".join(good) + "\n").encode()
@@ -0,0 +1,72 @@
+import json
+
+from risk_engine.core import AccountState, RiskEngine, RiskEngineConfig
+from risk_engine.execution import ExecutionWrapper, ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.journal import Journal
+from risk_engine.journal_sqlite import SQLiteJournal
+
+
+def _wrapper(journal) -> ExecutionWrapper:
+    cfg = RiskEngineConfig(risk_percent=0.0025, daily_loss_cap_percent=0.01, max_leverage=3.0)
+    return ExecutionWrapper(PreTradeGuard(RiskEngine(cfg)), journal=journal)
+
+
+def _intent(**kw) -> TradeIntent:
+    base = dict(symbol="BTCUSDT", side="long", entry_price=100.0, stop_price=99.0, leverage=2.0)
+    base.update(kw)
+    return TradeIntent(**base)
+
+
+def test_batches_inserts_and_uses_wal(tmp_path):
+    journal = SQLiteJournal(str(tmp_path / "j.db"), batch_size=10)
+    for i in range(25):
+        journal.record("custom_event", {"i": i})
+
+    assert journal.pending_count() == 5  # two batches of 10 committed
+    assert journal._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert journal.count() == 25
+    assert [e.data["i"] for e in journal.query(event_type="custom_event")] == list(range(25))
+    journal.close()
+
+
+def test_rejections_today_and_draft_lifecycle(tmp_path):
+    journal = SQLiteJournal(str(tmp_path / "j.db"))
+    wrapper = _wrapper(journal)
+    state = AccountState(start_of_day_equity=1000, realized_pnl_today=0)
+
+    wrapper.draft_order(state, _intent(leverage=10.0), ExposureState())
+    _, draft = wrapper.draft_order(state, _intent(), ExposureState())
+    try:
+        wrapper.confirm_order(draft, "nope")
+    except ValueError:
+        pass
+    wrapper.confirm_order(draft, "CONFIRM")
+
+    rejections = journal.rejections()
+    assert [(e.event_type, e.data["reason"]) for e in rejections] == [
+        ("decision", "leverage_cap_exceeded"),
+        ("rejection", "confirmation_required"),
+    ]
+
+    lifecycle = journal.lifecycle(draft.client_order_id)
+    assert [e.event_type for e in lifecycle] == ["draft_order", "rejection", "confirmation"]
+
+    plan = journal._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM journal WHERE client_order_id = ?", ("x",)
+    ).fetchall()
+    assert "ix_journal_client_order_id" in str(plan)
+    journal.close()
+
+
+def test_round_trips_entries_like_jsonl(tmp_path):
+    sqlite_journal = SQLiteJournal(str(tmp_path / "j.db"))
+    entry = sqlite_journal.record("custom_event", {"foo": [1, 2]}, metadata={"source": "test"})
+
+    (stored,) = sqlite_journal.query()
+    assert stored == entry
+
+    jsonl = Journal(log_dir=str(tmp_path))
+    jsonl._buffer.append(entry)
+    line = jsonl.flush_to_file("x.jsonl").read_text().strip()
+    assert json.loads(line)["data"] == stored.data
+    sqlite_journal.close()
@@ -0,0 +1,157 @@
+import json
+import threading
+import time
+
+import pytest
+
+from risk_engine.journal import Journal
+from risk_engine.journal_writer import JournalWriter
+
+
+def _lines(path):
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_record_enqueues_and_writer_commits_in_order(tmp_path):
+    writer = JournalWriter(tmp_path / "live.jsonl", max_batch=16)
+    journal = Journal(log_dir=str(tmp_path), writer=writer)
+
+    for i in range(100):
+        journal.record("custom_event", {"i": i})
+    path = journal.flush_to_file()
+
+    assert path == tmp_path / "live.jsonl"
+    assert journal.pending_count() == 0
+    assert [e["data"]["i"] for e in _lines(path)] == list(range(100))
+    assert journal._buffer == []
+    journal.close()
+
+
+def test_output_matches_flush_to_file(tmp_path):
+    buffered = Journal(log_dir=str(tmp_path / "a"))
+    entry = buffered.record("decision", {"allowed": True, "reason": "ok"}, metadata={"m": 1})
+    buffered_path = buffered.flush_to_file("out.jsonl")
+
+    writer = JournalWriter(tmp_path / "b" / "out.jsonl")
+    writer.submit(entry)
+    writer.close()
+
+    assert (tmp_path / "b" / "out.jsonl").read_text() == buffered_path.read_text()
+
+
+def test_fsync_every_n_entries(tmp_path):
+    writer = JournalWriter(tmp_path / "j.jsonl", fsync_every_n=10)
+    journal = Journal(log_dir=str(tmp_path), writer=writer)
+    for i in range(25):
+        journal.record("e", {"i": i})
+        if i % 5 == 4:
+            writer.flush()
+    journal.close()
+
+    assert writer.fsyncs == 3  # after 10, after 20, and the final close
+    assert len(_lines(tmp_path / "j.jsonl")) == 25
+
+
+def test_never_fsync_policy(tmp_path):
+    writer = JournalWriter(tmp_path / "j.jsonl")
+    writer.submit(Journal(log_dir=str(tmp_path)).record("e", {}))
+    writer.close()
+    assert writer.fsyncs == 0
+
+
+def test_backpressure_raises_when_queue_stays_full(tmp_path):
+    journal = Journal(log_dir=str(tmp_path))
+    writer = JournalWriter(tmp_path / "j.jsonl", queue_size=1, put_timeout=0.05)
+    gate = threading.Event()
+    original = writer._file.write
+
+    def slow_write(data):
+        gate.wait()
+        return original(data)
+
+    writer._file.write = slow_write
+    entry = journal.record("e", {})
+    writer.submit(entry)  # picked up by the (blocked) writer thread
+    with pytest.raises(RuntimeError, match="journal_queue_full"):
+        for _ in range(5):
+            writer.submit(entry)
+
+    gate.set()
+    writer.close()
+    assert len(_lines(tmp_path / "j.jsonl")) >= 2
+
+
+def test_record_copies_caller_dicts_before_enqueueing(tmp_path):
+    writer = JournalWriter(tmp_path / "j.jsonl")
+    journal = Journal(log_dir=str(tmp_path), writer=writer)
+    data, metadata = {"status": "draft"}, {"m": 1}
+    entry = journal.record("e", data, metadata)
+    data["status"] = "mutated after record"
+    metadata["m"] = 2
+    assert entry.data == {"status": "draft"} and entry.metadata == {"m": 1}
+    journal.close()
+    assert _lines(tmp_path / "j.jsonl")[0]["data"] == {"status": "draft"}
+
+
+def test_submit_racing_close_never_loses_accepted_entries(tmp_path):
+    writer = JournalWriter(tmp_path / "j.jsonl")
+    entry = Journal(log_dir=str(tmp_path)).record("e", {})
+    in_put, close_started = threading.Event(), threading.Event()
+    put = writer._queue.put
+
+    def slow_put(item, *args, **kwargs):
+        if item is entry:  # producer already passed the closed check
+            in_put.set()
+            close_started.wait(1)
+        return put(item, *args, **kwargs)
+
+    writer._queue.put = slow_put
+    producer = threading.Thread(target=writer.submit, args=(entry,))
+    producer.start()
+    in_put.wait(1)
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+    time.sleep(0.05)  # let close() run as far as it can
+    close_started.set()
+    producer.join(5)
+    closer.join(5)
+
+    flushed = threading.Thread(target=writer.flush, daemon=True)
+    flushed.start()
+    flushed.join(5)
+    assert not flushed.is_alive()  # no unfinished task stuck behind _STOP
+    assert len(_lines(tmp_path / "j.jsonl")) == 1
+
+
+def test_writer_failure_unblocks_producers_and_flush(tmp_path):
+    journal = Journal(log_dir=str(tmp_path))
+    writer = JournalWriter(tmp_path / "j.jsonl", queue_size=1)
+    gate = threading.Event()
+
+    def failing_write(data):
+        gate.wait()
+        raise OSError("disk full")
+
+    writer._file.write = failing_write
+    entry = journal.record("e", {})
+    writer.submit(entry)  # taken by the writer thread, which blocks in write()
+    writer.submit(entry)  # fills the queue
+    errors = []
+
+    def producer():
+        try:
+            writer.submit(entry)  # blocks on the full queue
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    blocked = threading.Thread(target=producer)
+    blocked.start()
+    gate.set()
+    blocked.join(5)
+    assert not blocked.is_alive()
+    with pytest.raises(RuntimeError, match="journal_writer_failed"):
+        writer.flush()
+    with pytest.raises(RuntimeError, match="journal_writer_failed"):
+        writer.close()
+    assert errors == ["journal_writer_failed"]
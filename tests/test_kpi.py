@@ -0,0 +1,87 @@
+import math
+import tempfile
+
+import pytest
+
+from risk_engine import KPIAggregator, RiskEngine, RiskEngineConfig
+from risk_engine.core import AccountState
+from risk_engine.execution import ExecutionWrapper, ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.journal import Journal
+
+
+def _session(journal):
+    wrapper = ExecutionWrapper(PreTradeGuard(RiskEngine(RiskEngineConfig(risk_percent=0.0025, daily_loss_cap_percent=0.01))), journal=journal)
+    state = AccountState(start_of_day_equity=1_000.0, realized_pnl_today=0.0)
+    intent = TradeIntent("BTCUSDT", "long", 100.0, 99.0, 2.0)
+
+    _, draft = wrapper.draft_order(state, intent, ExposureState())
+    wrapper.confirm_order(draft, "CONFIRM")
+    journal.record_fill(draft.client_order_id, "BTCUSDT", "long", 100.0, draft.size, fee=1.0, slippage=0.5)
+    journal.record_closed_trade("BTCUSDT", pnl=10.0, funding=0.5)  # net 8
+
+    _, draft = wrapper.draft_order(state, intent, ExposureState())
+    wrapper.confirm_order(draft, "CONFIRM")
+    journal.record_fill(draft.client_order_id, "BTCUSDT", "long", 100.0, draft.size, fee=1.0)
+    journal.record_closed_trade("BTCUSDT", pnl=-5.0)  # net -6
+
+    wrapper.draft_order(AccountState(1_000.0, 0.0, manual_kill_switch=True), intent, ExposureState())
+    journal.record_fill(None, "ETHUSDT", "short", 10.0, 1.0, fee=0.25)  # manual order
+    journal.record_closed_trade("ETHUSDT", pnl=-2.0)  # net -2.25
+    with pytest.raises(ValueError):
+        wrapper.confirm_order(None, "CONFIRM")
+
+
+def test_live_kpis():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        kpi = KPIAggregator(start_equity=1_000.0)
+        kpi.attach(journal)
+        _session(journal)
+        snap = kpi.snapshot()
+
+    assert snap.trades == 3 and snap.wins == 1 and snap.losses == 2
+    assert snap.closed_net_pnl == pytest.approx(8.0 - 6.0 - 2.25)
+    assert snap.net_pnl == pytest.approx(snap.closed_net_pnl)
+    assert snap.expectancy == pytest.approx(-0.25 / 3)
+    assert snap.win_rate == pytest.approx(1 / 3)
+    assert snap.avg_win == pytest.approx(8.0)
+    assert snap.avg_loss == pytest.approx(4.125)
+    assert snap.win_loss_ratio == pytest.approx(8.0 / 4.125)
+    assert snap.costs == pytest.approx(3.25)
+    assert snap.cost_ratio == pytest.approx(3.25 / 17.0)
+    # Curve: -1.5, +8, -1, -6 -> peak 8, trough at -0.25.
+    assert snap.peak_pnl == pytest.approx(8.0)
+    assert snap.max_drawdown == pytest.approx(8.25)
+    assert snap.max_drawdown_percent == pytest.approx(8.25 / 1_008.0)
+    assert snap.decisions == 3 and snap.guard_rejections == 1
+    assert snap.confirmations == 2 and snap.compliant_confirmations == 2
+    assert snap.unguarded_fills == 1
+    assert snap.compliance_rate == pytest.approx(2 / 3)
+    assert snap.confirmation_rejections == 1
+    assert set(snap.summary()) >= {"expectancy", "max_drawdown", "win_rate", "cost_ratio", "compliance_rate"}
+
+
+def test_rebuild_matches_live():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        live = KPIAggregator(start_equity=1_000.0)
+        live.attach(journal)
+        _session(journal)
+        journal.flush_to_file("day.jsonl")
+        rebuilt = KPIAggregator.from_journal(tmp, start_equity=1_000.0)
+
+    assert rebuilt.snapshot() == live.snapshot()
+
+
+def test_detach_and_empty_ratios():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        kpi = KPIAggregator()
+        kpi.attach(journal)
+        kpi.detach(journal)
+        journal.record_closed_trade("BTCUSDT", pnl=1.0)
+
+    snap = kpi.snapshot()
+    assert snap.events == 0
+    assert math.isnan(snap.win_rate) and math.isnan(snap.expectancy) and math.isnan(snap.compliance_rate)
+    assert math.isnan(snap.max_drawdown_percent)
@@ -0,0 +1,43 @@
+import pytest
+
+from risk_engine.latency import LatencyHistogram, StageTimers
+
+
+def test_histogram_percentiles_within_precision():
+    hist = LatencyHistogram(precision_bits=7)
+    for v in range(1, 100_001):
+        hist.record(v * 10)
+
+    snap = hist.snapshot()
+    assert snap.count == 100_000
+    assert snap.min_ns == 10
+    assert snap.max_ns == 1_000_000
+    assert snap.p50_ns == pytest.approx(500_000, rel=0.01)
+    assert snap.p99_ns == pytest.approx(990_000, rel=0.01)
+    assert snap.p999_ns == pytest.approx(999_000, rel=0.01)
+    assert snap.mean_ns == pytest.approx(500_005)
+
+
+def test_histogram_exact_for_small_values_and_reset():
+    hist = LatencyHistogram()
+    for v in (3, 3, 3, 200):
+        hist.record(v)
+    assert hist.percentile(50) == 3
+    assert hist.percentile(100) == 200
+
+    hist.reset()
+    assert hist.snapshot().count == 0
+    assert hist.percentile(99) == 0
+
+
+def test_stage_timers_lap_and_snapshot():
+    timers = StageTimers()
+    t = timers.lap("a", 0)
+    timers.lap("b", t)
+
+    snap = timers.snapshot()
+    assert set(snap) == {"a", "b"}
+    assert snap["b"].count == 1
+
+    timers.reset()
+    assert timers.snapshot()["a"].count == 0
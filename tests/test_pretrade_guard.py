@@ -1,5 +1,6 @@
-from risk_engine.core import AccountState, RiskEngine, RiskEngineConfig
-from risk_engine.execution import ExposureState, PreTradeGuard, TradeIntent
+from risk_engine.core import AccountLedger, AccountState, RiskEngine, RiskEngineConfig
+from risk_engine.execution import ExposureBook, ExposureState, GuardDecisionCache, PreTradeGuard, TradeIntent
+from risk_engine.rules import GuardRule
 
 
 def _engine() -> RiskEngine:
@@ -50,3 +51,135 @@ def test_allows_valid_trade() -> None:
     assert dec.allowed is True
     assert dec.reason == "ok"
     assert dec.suggested_size > 0
+
+
+def test_reads_account_ledger_directly() -> None:
+    engine = _engine()
+    ledger = AccountLedger(engine.config, start_of_day_equity=1000)
+    guard = PreTradeGuard(engine)
+
+    assert guard.evaluate(ledger, _intent(), ExposureState()).allowed is True
+
+    ledger.record_closed_trade(-10)
+    dec = guard.evaluate(ledger, _intent(), ExposureState())
+    assert dec.allowed is False
+    assert dec.reason == "daily_loss_cap_reached"
+
+
+def test_exposure_book_blocks_duplicate_symbol() -> None:
+    guard = PreTradeGuard(_engine())
+    book = ExposureBook(equity=1000)
+    book.open("ETHUSDT", entry_price=2000.0, stop_price=1999.0, size=0.5)
+
+    assert guard.evaluate(_state(), _intent(), book).allowed is True
+
+    book.open("BTCUSDT", entry_price=100.0, stop_price=99.5, size=1.0)
+    dec = guard.evaluate(_state(), _intent(), book)
+    assert dec.reason == "duplicate_symbol_position"
+
+
+def test_exposure_book_tracks_open_risk_through_partial_fills_and_closes() -> None:
+    guard = PreTradeGuard(_engine())
+    book = ExposureBook(equity=1000)
+
+    book.open("ETHUSDT", entry_price=2000.0, stop_price=1998.0, size=1.0)
+    book.open("ETHUSDT", entry_price=2002.0, stop_price=1998.0, size=1.0)
+    assert book.open_risk == 6.0
+    assert book.open_risk_percent == 0.006
+    assert guard.evaluate(_state(), _intent(), book).allowed is True
+
+    book.open("SOLUSDT", entry_price=100.0, stop_price=99.0, size=2.0)
+    dec = guard.evaluate(_state(), _intent(), book)
+    assert dec.reason == "max_open_risk_reached"
+
+    book.reduce("ETHUSDT", 1.5)
+    assert book.position_risk("ETHUSDT") == 1.5
+    assert guard.evaluate(_state(), _intent(), book).allowed is True
+
+    book.reduce("ETHUSDT", 0.5)
+    book.close("SOLUSDT")
+    assert len(book) == 0
+    assert book.open_risk == 0.0
+
+
+def test_rule_pipeline_keeps_counters_and_timings() -> None:
+    guard = PreTradeGuard(_engine())
+    guard.evaluate(_state(), _intent(side="up"), ExposureState())
+    guard.evaluate(_state(), _intent(leverage=5.0), ExposureState())
+    guard.evaluate(_state(), _intent(), ExposureState())
+
+    stats = {s.name: s for s in guard.rule_stats()}
+    assert stats["side"].calls == 3
+    assert stats["side"].rejections == 1
+    assert stats["leverage_cap"].calls == 2
+    assert stats["leverage_cap"].rejections == 1
+    assert stats["max_open_risk"].calls == 1
+    assert stats["risk_engine"].calls == 1
+    assert stats["risk_engine"].rejections == 0
+    assert all(s.total_ns >= 0 for s in stats.values())
+
+    guard.reset_rule_stats()
+    assert all(s.calls == 0 for s in guard.rule_stats())
+
+
+def test_reorder_rules_puts_most_rejecting_rules_first() -> None:
+    guard = PreTradeGuard(_engine())
+    for _ in range(5):
+        guard.evaluate(_state(), _intent(), ExposureState(has_open_position_same_symbol=True))
+
+    order = guard.reorder_rules()
+    assert order[0] == "duplicate_symbol"
+    assert order[1:] == ["side", "leverage_positive", "leverage_cap", "max_open_risk"]
+
+    dec = guard.evaluate(_state(), _intent(side="up"), ExposureState(has_open_position_same_symbol=True))
+    assert dec.reason == "duplicate_symbol_position"
+
+
+def test_custom_rule_can_be_plugged_in() -> None:
+    def block_doge(config, state, intent, exposure):
+        return "symbol_blocked" if intent.symbol.startswith("DOGE") else None
+
+    guard = PreTradeGuard(_engine(), instrumented=False)
+    guard.add_rule(GuardRule("blocklist", block_doge), before="duplicate_symbol")
+
+    assert guard.evaluate(_state(), _intent(symbol="DOGEUSDT"), ExposureState()).reason == "symbol_blocked"
+    assert guard.evaluate(_state(), _intent(), ExposureState()).allowed is True
+    assert guard.remove_rule("blocklist").calls == 0
+
+
+def test_decision_cache_serves_repeats_and_invalidates_on_state_change() -> None:
+    engine = _engine()
+    ledger = AccountLedger(engine.config, start_of_day_equity=1000)
+    book = ExposureBook(equity=1000)
+    cache = GuardDecisionCache(PreTradeGuard(engine), maxsize=8)
+
+    first = cache.evaluate(ledger, _intent(), book)
+    assert first.allowed is True
+    assert cache.evaluate(ledger, _intent(), book) is first
+    assert cache.evaluate(ledger, _intent(), book) is first
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    ledger.record_closed_trade(-10)
+    dec = cache.evaluate(ledger, _intent(), book)
+    assert dec.reason == "daily_loss_cap_reached"
+
+    ledger.rollover(start_of_day_equity=1000)
+    book.open("BTCUSDT", entry_price=100.0, stop_price=99.0, size=1.0)
+    assert cache.evaluate(ledger, _intent(), book).reason == "duplicate_symbol_position"
+
+    book.close("BTCUSDT")
+    ledger.set_manual_kill_switch(True)
+    assert cache.evaluate(ledger, _intent(), book).reason == "kill_switch_active"
+
+
+def test_decision_cache_is_bounded_and_tracks_rule_changes() -> None:
+    guard = PreTradeGuard(_engine())
+    cache = GuardDecisionCache(guard, maxsize=2)
+
+    for price in (100.0, 101.0, 102.0):
+        cache.evaluate(_state(), _intent(entry_price=price, stop_price=price - 1), ExposureState())
+    assert len(cache) == 2
+
+    assert cache.evaluate(_state(), _intent(), ExposureState()).allowed is True
+    guard.add_rule(GuardRule("halt", lambda config, state, intent, exposure: "halted"))
+    assert cache.evaluate(_state(), _intent(), ExposureState()).reason == "halted"
@@ -0,0 +1,181 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from exchange.base import OrderSide, OrderType
+from exchange.bybit import BybitAdapter, bybit_scheduler, endpoint_group, limit_status
+from exchange.ratelimit import BACKGROUND, URGENT, RequestScheduler, RetryableError, TokenBucket
+
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=2.0, now=0.0)
+    assert bucket.take(0.0) == 0.0
+    assert bucket.take(0.0) == 0.0
+    assert bucket.take(0.0) == pytest.approx(0.5)
+    assert bucket.take(0.5) == 0.0
+
+
+def test_token_bucket_follows_exchange_status():
+    bucket = TokenBucket(rate=10.0, now=0.0)
+    bucket.observe(limit=5, remaining=1, reset_in=None, now=0.0)
+    assert bucket.capacity == 5.0 and bucket.tokens == 1.0
+    bucket.observe(limit=5, remaining=0, reset_in=0.8, now=0.0)
+    assert bucket.take(0.1) == pytest.approx(0.7)
+
+
+def test_retries_throttled_calls_with_jittered_backoff():
+    delays = []
+    scheduler = RequestScheduler(default_limit=1000.0, sleep=delays.append, rng=lambda: 0.5)
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RetryableError("too many visits", safe=True)
+        return "ok", (100, 99, None)
+
+    assert scheduler.run("/v5/order/create", send, idempotent=False) == "ok"
+    assert delays == [0.05, 0.1]
+    assert scheduler.retries == 2 and scheduler.throttled == 2
+
+
+def test_unsafe_failures_not_retried_for_non_idempotent_requests():
+    scheduler = RequestScheduler(default_limit=1000.0, sleep=lambda s: None, retry_on=(requests.Timeout,))
+    calls = []
+
+    def send():
+        calls.append(1)
+        raise requests.Timeout()
+
+    with pytest.raises(requests.Timeout):
+        scheduler.run("/v5/order/create", send, idempotent=False)
+    assert len(calls) == 1
+    with pytest.raises(requests.Timeout):
+        scheduler.run("/v5/market/tickers", send)
+    assert len(calls) == 1 + 4
+
+
+def test_urgent_waiters_overtake_queued_background_calls():
+    scheduler = RequestScheduler(limits={"g": 20.0})
+    scheduler.bucket("g").tokens = 0.0
+    order = []
+
+    def worker(name, priority, delay):
+        time.sleep(delay)
+        scheduler.acquire("g", priority)
+        order.append(name)
+
+    threads = [threading.Thread(target=worker, args=(f"bg{i}", BACKGROUND, 0.0)) for i in range(3)]
+    threads.append(threading.Thread(target=worker, args=("order", URGENT, 0.01)))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert order[0] == "order"
+    assert sorted(order[1:]) == ["bg0", "bg1", "bg2"]
+
+
+class _Response:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        return self.responses.pop(0)
+
+    post = get
+
+
+def test_bybit_adapter_retries_rate_limited_response():
+    reset_ms = str(int(time.time() * 1000))
+    headers = {"X-Bapi-Limit": "50", "X-Bapi-Limit-Status": "0", "X-Bapi-Limit-Reset-Timestamp": reset_ms}
+    ticker = {"symbol": "BTCUSDT", "bid1Price": "1", "ask1Price": "2", "lastPrice": "1.5", "time": "0"}
+    adapter = BybitAdapter("key", "secret", scheduler=bybit_scheduler(sleep=lambda s: None))
+    adapter.session = _Session(
+        [
+            _Response({"retCode": 10006, "retMsg": "Too many visits!"}, headers=headers),
+            _Response({}, status_code=502),
+            _Response({"retCode": 0, "result": {"list": [ticker]}}, headers={**headers, "X-Bapi-Limit-Status": "49"}),
+        ]
+    )
+    assert adapter.get_ticker("BTCUSDT").last == 1.5
+    assert len(adapter.session.calls) == 3
+    assert adapter.scheduler.bucket("market").capacity == 50.0
+
+
+def test_bybit_adapter_surfaces_non_retryable_errors():
+    adapter = BybitAdapter("key", "secret")
+    adapter.session = _Session([_Response({"retCode": 10001, "retMsg": "params error"})])
+    with pytest.raises(RuntimeError, match="Bybit API error"):
+        adapter.cancel_order("BTCUSDT", "x")
+    assert len(adapter.session.calls) == 1
+
+
+def test_bybit_limit_headers_and_groups():
+    assert limit_status({}) is None
+    assert limit_status({"X-Bapi-Limit": "10", "X-Bapi-Limit-Status": "3", "X-Bapi-Limit-Reset-Timestamp": "1500"}) == (
+        10.0,
+        3.0,
+        1.5,
+    )
+    assert endpoint_group("/v5/order/create") == "order"
+    assert endpoint_group("/v5/market/tickers") == "market"
+
+
+def test_default_adapter_puts_orders_ahead_of_queued_queries():
+    class _Recorder:
+        def __init__(self):
+            self.paths = []
+
+        def get(self, url, **kwargs):
+            path = url.split(".com", 1)[1]
+            self.paths.append(path)
+            result = {"list": [ticker]} if path == "/v5/market/tickers" else {"orderId": "o-1"}
+            return _Response({"retCode": 0, "result": result})
+
+        post = get
+
+    ticker = {"symbol": "BTCUSDT", "bid1Price": "1", "ask1Price": "2", "lastPrice": "1.5", "time": "0"}
+    adapter = BybitAdapter("key", "secret", confirm_orders=False)
+    adapter.session = _Recorder()
+    adapter.scheduler.bucket("ip").tokens = 0.0  # IP budget exhausted by earlier traffic
+
+    def query(i):
+        adapter.cache.invalidate("tickers")
+        adapter.get_positions() if i % 2 else adapter.get_ticker("BTCUSDT")
+
+    def order():
+        time.sleep(0.005)
+        adapter.place_order("BTCUSDT", OrderSide.BUY, OrderType.MARKET, 0.01)
+
+    threads = [threading.Thread(target=query, args=(i,)) for i in range(4)] + [threading.Thread(target=order)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert len(adapter.session.paths) == 5
+    assert adapter.session.paths[0] == "/v5/order/create"
+
+
+def test_shared_reserve_is_kept_for_urgent_calls():
+    bucket = TokenBucket(rate=10.0, now=0.0)
+    bucket.tokens = 2.5
+    assert bucket.take(0.0, reserve=2.0) > 0  # a query may not dip into the reserve
+    assert bucket.take(0.0) == 0.0  # an order may
@@ -0,0 +1,131 @@
+import json
+import tempfile
+from pathlib import Path
+
+from risk_engine import RiskEngine, RiskEngineConfig
+from risk_engine.execution import ExecutionWrapper, PreTradeGuard, TradeIntent
+from risk_engine.journal import Journal, JournalEntry, encode_entry
+from risk_engine.journal_segments import SegmentedJournal
+from risk_engine.recovery import (
+    Checkpointer,
+    JournalPosition,
+    RiskState,
+    list_snapshots,
+    replay_tail,
+    restore,
+)
+
+CONFIG = RiskEngineConfig(risk_percent=0.0025, daily_loss_cap_percent=0.01)
+
+
+def _trade(journal, state, wrapper, symbol, pnl, fee=0.1):
+    intent = TradeIntent(symbol, "long", 100.0, 99.0, 2.0)
+    _, draft = wrapper.draft_order(state.ledger, intent, state.exposure)
+    wrapper.confirm_order(draft, "CONFIRM")
+    journal.record_fill(draft.client_order_id, symbol, "long", 100.0, draft.size, fee=fee)
+    if pnl is not None:
+        journal.record_closed_trade(symbol, pnl)
+    return draft
+
+
+def _run_day(journal, state):
+    wrapper = ExecutionWrapper(PreTradeGuard(RiskEngine(CONFIG)), journal=journal)
+    _trade(journal, state, wrapper, "BTCUSDT", -1.0)
+    _trade(journal, state, wrapper, "ETHUSDT", -1.0)
+    _trade(journal, state, wrapper, "SOLUSDT", None)  # still open
+    journal.record_risk_control("kill_switch_on")
+    journal.record_risk_control("kill_switch_off")
+    _, pending = wrapper.draft_order(state.ledger, TradeIntent("XRPUSDT", "short", 1.0, 1.1, 1.0), state.exposure)
+    return pending
+
+
+def _same(a, b):
+    assert a.ledger.snapshot() == b.ledger.snapshot()
+    assert sorted(a.exposure.positions()) == sorted(b.exposure.positions())
+    assert a.exposure.open_risk == b.exposure.open_risk
+    assert a.pending_drafts == b.pending_drafts
+    assert a.open_orders == b.open_orders
+
+
+def test_restore_from_snapshot_and_tail():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        live = RiskState(CONFIG, 1_000.0)
+        checkpointer = Checkpointer(journal, live, every_entries=4, filename="day.jsonl")
+        pending = _run_day(journal, live)
+        journal.flush_to_file("day.jsonl")
+
+        assert checkpointer.snapshots_written >= 4
+        assert len(list_snapshots(tmp)) == 3  # keep=3
+        assert live.ledger.realized_pnl_today < -2.0
+        assert live.ledger.consecutive_losses == 2
+        assert "SOLUSDT" in live.exposure and len(live.exposure) == 1
+        assert list(live.pending_drafts) == [pending.client_order_id]
+
+        restored = restore(tmp, CONFIG, start_equity=1_000.0)
+        _same(restored, live)
+        # Only entries after the last snapshot were replayed.
+        last = json.loads(list_snapshots(tmp)[-1].read_text())
+        assert restored.applied - last["applied"] < 4
+        assert restored.position == JournalPosition("day.jsonl", (Path(tmp) / "day.jsonl").stat().st_size)
+
+
+def test_checkpoint_with_nothing_pending_ignores_cwd(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    journal = Journal(log_dir=str(log_dir))
+    live = RiskState(CONFIG, 1_000.0)
+    checkpointer = Checkpointer(journal, live, every_entries=10_000, filename="day.jsonl")
+    _run_day(journal, live)
+    journal.flush_to_file("day.jsonl")
+    # A same-named file in the working directory must not be mistaken for the journal.
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "day.jsonl").write_text("x" * 7)
+
+    checkpointer.checkpoint()
+
+    assert live.position == JournalPosition("day.jsonl", (log_dir / "day.jsonl").stat().st_size)
+
+
+def test_restore_without_snapshot_replays_everything():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(log_dir=tmp)
+        live = RiskState(CONFIG, 1_000.0)
+        journal.subscribe(live.apply)
+        _run_day(journal, live)
+        journal.flush_to_file("day.jsonl")
+
+        restored = restore(tmp, CONFIG, start_equity=1_000.0)
+        _same(restored, live)
+        assert restored.applied == live.applied
+
+
+def test_restore_segmented_journal():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = SegmentedJournal(log_dir=tmp, batch_size=4, max_segment_bytes=2_000, block_lines=3)
+        live = RiskState(CONFIG, 1_000.0)
+        Checkpointer(journal, live, every_entries=5)
+        _run_day(journal, live)
+        journal.close()
+        assert any(p.name.endswith(".gz") for p in Path(tmp).iterdir())
+
+        _same(restore(tmp, CONFIG, start_equity=1_000.0), live)
+
+
+def test_replay_rolls_day_on_entry_timestamps():
+    def entry(ts, event_type, data):
+        return JournalEntry("x", ts, event_type, data)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = [
+            entry("2026-03-01T10:00:00+00:00", "trade_closed", {"symbol": "BTCUSDT", "pnl": -5.0}),
+            entry("2026-03-02T10:00:00+00:00", "trade_closed", {"symbol": "BTCUSDT", "pnl": -2.0}),
+        ]
+        path = Path(tmp) / "journal.jsonl"
+        path.write_text("".join(encode_entry(e) + "\n" for e in lines) + '{"partial', encoding="utf-8")
+
+        state = RiskState(CONFIG, 1_000.0, as_of="2026-03-01T00:00:00+00:00")
+        assert replay_tail(state, tmp) == 2
+        assert state.ledger.start_of_day_equity == 995.0
+        assert state.ledger.realized_pnl_today == -2.0
+        assert state.ledger.consecutive_losses == 2
+        assert state.position == JournalPosition("journal.jsonl", path.stat().st_size - len('{"partial'))
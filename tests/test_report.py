@@ -0,0 +1,109 @@
+import math
+import random
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from risk_engine.journal import JournalEntry, encode_entry
+from risk_engine.kpi import KPIAggregator
+from risk_engine.report import build_report, day_window, main, plan_tasks
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+
+def _journal(directory: Path, n_trades: int = 120, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    entries = []
+    t = 0
+
+    def add(event_type, data):
+        nonlocal t
+        t += 1
+        day = 1 + t // 400
+        ts = f"2026-03-{day:02d}T{(t // 60) % 24:02d}:{t % 60:02d}:00+00:00"
+        entries.append(JournalEntry(f"id{t}", ts, event_type, data))
+
+    for i in range(n_trades):
+        symbol = rng.choice(SYMBOLS)
+        coid = f"o{i}"
+        allowed = rng.random() > 0.2
+        add("decision", {"allowed": allowed, "reason": "ok" if allowed else rng.choice(["max_leverage", "kill"])})
+        if not allowed:
+            continue
+        if rng.random() > 0.1:
+            add("draft_order", {"client_order_id": coid, "size": 1.0})
+        add("confirmation", {"client_order_id": coid})
+        for _ in range(rng.randint(1, 3)):
+            add("fill", {"client_order_id": coid, "symbol": symbol, "fee": 0.1, "slippage": rng.random() * 0.05})
+        if rng.random() > 0.3:
+            add("trade_closed", {"symbol": symbol, "pnl": rng.uniform(-3, 3), "funding": 0.01})
+        if rng.random() < 0.05:
+            add("rejection", {"reason": "confirmation_required", "details": {}})
+
+    half = len(entries) // 2
+    (directory / "journal_a.jsonl").write_text("".join(encode_entry(e) + "\n" for e in entries[:half]))
+    (directory / "journal_b.jsonl").write_text("".join(encode_entry(e) + "\n" for e in entries[half:]))
+
+
+def _assert_same(report, expected):
+    got, want = asdict(report), asdict(expected)
+    for key in want:
+        if key == "max_drawdown_percent":
+            continue
+        if isinstance(want[key], float):
+            assert got[key] == pytest.approx(want[key], abs=1e-9), key
+        else:
+            assert got[key] == want[key], key
+    assert report.pnl_std == pytest.approx(expected.pnl_std)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1 << 30, 4_096, 700])
+def test_report_matches_sequential_rebuild(chunk_bytes):
+    with tempfile.TemporaryDirectory() as tmp:
+        _journal(Path(tmp))
+        expected = KPIAggregator.from_journal(tmp).snapshot()
+        report = build_report(tmp, workers=1, chunk_bytes=chunk_bytes)
+    assert expected.trades > 50 and expected.unguarded_fills > 0
+    _assert_same(report, expected)
+    assert math.isnan(report.max_drawdown_percent)
+
+
+def test_report_in_process_pool():
+    with tempfile.TemporaryDirectory() as tmp:
+        _journal(Path(tmp))
+        expected = build_report(tmp, workers=1, chunk_bytes=2_000)
+        report = build_report(tmp, workers=2, chunk_bytes=2_000)
+    _assert_same(report, expected)
+
+
+def test_report_day_window():
+    since, until = day_window("2026-03-01")
+    assert (since, until) == ("2026-03-01T00:00:00+00:00", "2026-03-02T00:00:00+00:00")
+    with tempfile.TemporaryDirectory() as tmp:
+        _journal(Path(tmp))
+        expected = KPIAggregator.from_journal(tmp, since=since, until=until).snapshot()
+        report = build_report(tmp, since, until, workers=1, chunk_bytes=1_500)
+    assert report.last_ts < until
+    _assert_same(report, expected)
+
+
+def test_plan_tasks_are_line_aligned():
+    with tempfile.TemporaryDirectory() as tmp:
+        _journal(Path(tmp))
+        files = sorted(Path(tmp).iterdir())
+        tasks = plan_tasks(files, 1_000)
+        for path, start, stop in tasks:
+            data = Path(path).read_bytes()
+            assert start == 0 or data[start - 1 : start] == b"\n"
+            assert data[stop - 1 : stop] == b"\n"
+        assert sum(stop - start for _, start, stop in tasks) == sum(p.stat().st_size for p in files)
+
+
+def test_report_cli(capsys):
+    with tempfile.TemporaryDirectory() as tmp:
+        _journal(Path(tmp))
+        assert main([tmp, "--day", "2026-03-01", "-w", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "Report 2026-03-01" in out and "compliance_rate" in out and "max_leverage" in out
@@ -1,8 +1,12 @@
+import pytest
+
 from risk_engine import (
+    AccountLedger,
     AccountState,
     RiskEngine,
     RiskEngineConfig,
     calculate_position_size,
+    calculate_position_sizes,
 )
 
 
@@ -68,3 +72,122 @@ def test_manual_kill_switch_blocks_new_trade():
 
     assert not decision.allowed
     assert decision.reason == "kill_switch_active"
+
+
+def test_batch_position_sizes_match_scalar():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(7)
+    entries = rng.uniform(1, 50_000, 5_000).round(rng.integers(0, 6))
+    stops = entries * rng.uniform(0.9, 1.1, 5_000)
+    stops[:50] = entries[:50]  # zero stop distance
+    multipliers = rng.choice([1.0, 0.001, 0.0, -1.0, 10.0], 5_000)
+
+    sizes = calculate_position_sizes(10_000, 0.0025, entries, stops, multipliers)
+
+    expected = [
+        calculate_position_size(10_000, 0.0025, e, s, m)
+        for e, s, m in zip(entries.tolist(), stops.tolist(), multipliers.tolist())
+    ]
+    assert sizes.tolist() == expected
+
+
+def test_batch_position_sizes_rounding_ties_match_scalar():
+    np = pytest.importorskip("numpy")
+    # budget / distance lands on ...5 at the 9th decimal
+    entries = np.array([100.0, 100.0, 100.0])
+    stops = np.array([99.0, 68.0, 92.0])
+    balances = [0.0000000025, 1.0000000045, 3.0000000125]
+    for balance in balances:
+        sizes = calculate_position_sizes(balance, 1.0, entries, stops)
+        expected = [calculate_position_size(balance, 1.0, e, s) for e, s in zip(entries, stops)]
+        assert sizes.tolist() == expected
+
+
+def test_batch_position_sizes_zero_when_budget_not_positive():
+    pytest.importorskip("numpy")
+    sizes = calculate_position_sizes(0, 0.01, [100, 101], [95, 90])
+    assert sizes.tolist() == [0.0, 0.0]
+
+
+def test_evaluate_trades_matches_evaluate_trade():
+    pytest.importorskip("numpy")
+    engine = RiskEngine(RiskEngineConfig(risk_percent=0.01, daily_loss_cap_percent=0.03))
+    entries = [100.0, 100.0, 50.0]
+    stops = [95.0, 100.0, 49.5]
+    states = [
+        AccountState(start_of_day_equity=10_000, realized_pnl_today=0),
+        AccountState(start_of_day_equity=10_000, realized_pnl_today=-350),
+        AccountState(start_of_day_equity=10_000, realized_pnl_today=0, consecutive_losses=3),
+    ]
+
+    for state in states:
+        batch = engine.evaluate_trades(state, entries, stops)
+        scalar = [engine.evaluate_trade(state, e, s) for e, s in zip(entries, stops)]
+        assert len(batch) == 3
+        assert [batch.decision(i) for i in range(3)] == scalar
+        assert batch.reasons() == [d.reason for d in scalar]
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ledger_tracks_daily_loss_cap_incrementally():
+    cfg = RiskEngineConfig(risk_percent=0.01, daily_loss_cap_percent=0.03)
+    engine = RiskEngine(cfg)
+    ledger = AccountLedger(cfg, start_of_day_equity=10_000, clock=_Clock(1_700_000_000))
+
+    ledger.record_closed_trade(-200)
+    ledger.record_fill(fee=50)
+    assert ledger.realized_pnl_today == -250
+    assert ledger.daily_loss_headroom == 50
+    assert engine.evaluate_trade(ledger, entry_price=100, stop_price=95).allowed
+
+    ledger.record_closed_trade(100)
+    ledger.record_closed_trade(-200)
+    decision = engine.evaluate_trade(ledger, entry_price=100, stop_price=95)
+    assert not decision.allowed
+    assert decision.reason == "daily_loss_cap_reached"
+    assert decision == engine.evaluate_trade(ledger.snapshot(), entry_price=100, stop_price=95)
+
+
+def test_ledger_kill_switch_from_loss_streak_and_manual_toggle():
+    cfg = RiskEngineConfig(risk_percent=0.01, daily_loss_cap_percent=0.5, max_consecutive_losses=2)
+    engine = RiskEngine(cfg)
+    ledger = AccountLedger(cfg, start_of_day_equity=10_000, clock=_Clock(1_700_000_000))
+
+    ledger.record_closed_trade(-10)
+    ledger.record_closed_trade(5)
+    ledger.record_closed_trade(-10)
+    assert ledger.consecutive_losses == 1
+    assert not ledger.kill_switch
+
+    ledger.record_closed_trade(-10)
+    assert engine.evaluate_trade(ledger, 100, 95).reason == "kill_switch_active"
+
+    ledger.reset_loss_streak()
+    ledger.set_manual_kill_switch(True)
+    assert engine.evaluate_trade(ledger, 100, 95).reason == "kill_switch_active"
+    ledger.set_manual_kill_switch(False)
+    assert engine.evaluate_trade(ledger, 100, 95).allowed
+
+
+def test_ledger_rolls_over_at_utc_midnight():
+    cfg = RiskEngineConfig(risk_percent=0.01, daily_loss_cap_percent=0.03)
+    engine = RiskEngine(cfg)
+    clock = _Clock(86_400 * 19_000 + 86_000)  # 23:53 UTC
+    ledger = AccountLedger(cfg, start_of_day_equity=10_000, clock=clock)
+
+    ledger.record_closed_trade(-400)
+    assert engine.evaluate_trade(ledger, 100, 95).reason == "daily_loss_cap_reached"
+
+    clock.now += 600  # 00:03 UTC next day
+    decision = engine.evaluate_trade(ledger, 100, 95)
+    assert decision.allowed
+    assert ledger.start_of_day_equity == 9_600
+    assert ledger.realized_pnl_today == 0
+    assert ledger.max_daily_loss == pytest.approx(288)
@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from risk_engine.core import AccountLedger, RiskEngine, RiskEngineConfig
+from risk_engine.simulation import simulate_risk_of_ruin
+
+
+def _config() -> RiskEngineConfig:
+    return RiskEngineConfig(
+        risk_percent=0.01,
+        daily_loss_cap_percent=0.03,
+        max_consecutive_losses=5,
+    )
+
+
+def test_all_losses_hit_daily_cap_then_kill_switch():
+    report = simulate_risk_of_ruin(
+        _config(),
+        outcomes_r=[-1.0],
+        n_paths=4,
+        n_days=5,
+        trades_per_day=5,
+        start_equity=10_000,
+        seed=1,
+    )
+
+    # day 1: three 100 losses trip the daily cap; day 2: two 97 losses trip the kill switch
+    assert report.final_equity.tolist() == [9_506.0] * 4
+    assert report.trades_taken.tolist() == [5] * 4
+    assert report.kill_switch_trade.tolist() == [6] * 4
+    assert report.days_to_kill_switch().tolist() == [2] * 4
+    assert report.kill_switch_rate == 1.0
+    assert report.risk_of_ruin == 0.0
+
+
+def test_matches_scalar_replay_through_risk_engine():
+    cfg = _config()
+    outcomes = [-1.0, -1.0, -0.5, 1.5, 2.0, 3.0]
+    n_paths, n_days, per_day = 64, 10, 4
+
+    report = simulate_risk_of_ruin(
+        cfg, outcomes, n_paths=n_paths, n_days=n_days, trades_per_day=per_day, seed=42, ruin_drawdown=1.0
+    )
+
+    rng = np.random.default_rng(np.random.SeedSequence(42).spawn(1)[0])
+    draws = [rng.choice(np.asarray(outcomes), size=n_paths) for _ in range(n_days * per_day)]
+    engine = RiskEngine(cfg)
+    for path in range(n_paths):
+        ledger = AccountLedger(cfg, start_of_day_equity=10_000, clock=lambda: 0.0)
+        equity = 10_000.0
+        for day in range(n_days):
+            ledger.rollover(start_of_day_equity=equity)
+            for k in range(per_day):
+                decision = engine.evaluate_trade(ledger, entry_price=100.0, stop_price=99.0)
+                if decision.allowed:
+                    pnl = draws[day * per_day + k][path] * decision.position_size
+                    equity += pnl
+                    ledger.record_closed_trade(pnl)
+        assert report.final_equity[path] == pytest.approx(equity)
+
+
+def test_chunking_is_independent_of_worker_count():
+    kw = dict(outcomes_r=[-1.0, 0.8, 2.5], n_paths=300, n_days=5, trades_per_day=3, seed=9, chunk_size=64)
+    single = simulate_risk_of_ruin(_config(), workers=1, **kw)
+    pooled = simulate_risk_of_ruin(_config(), workers=2, **kw)
+
+    assert single.final_equity.tolist() == pooled.final_equity.tolist()
+    assert single.summary() == pooled.summary()
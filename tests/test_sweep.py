@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from risk_engine.core import RiskEngineConfig
+from risk_engine.sweep import HistoricalTrade, config_grid, format_table, run_sweep
+
+DAY = 86_400.0
+T0 = DAY * 20_000
+
+
+def _base() -> RiskEngineConfig:
+    return RiskEngineConfig(
+        risk_percent=0.01,
+        daily_loss_cap_percent=0.03,
+        max_consecutive_losses=3,
+        max_open_risk_percent=0.05,
+        max_leverage=3.0,
+    )
+
+
+def _trades() -> list[HistoricalTrade]:
+    return [
+        # wins 2R on BTC
+        HistoricalTrade(T0 + 60, T0 + 600, "BTCUSDT", "long", 100.0, 99.0, 102.0, leverage=2.0),
+        # overlaps the BTC trade -> duplicate symbol
+        HistoricalTrade(T0 + 120, T0 + 300, "BTCUSDT", "short", 100.0, 101.0, 99.0, leverage=2.0),
+        # loses 1R on ETH, leverage 5 only passes when the cap allows it
+        HistoricalTrade(T0 + 900, T0 + 1200, "ETHUSDT", "short", 50.0, 51.0, 51.0, leverage=5.0),
+        # next day, wins 1R
+        HistoricalTrade(T0 + DAY + 60, T0 + DAY + 600, "SOLUSDT", "long", 20.0, 19.0, 21.0, leverage=1.0),
+    ]
+
+
+def test_replay_counts_pnl_and_rejections():
+    (result,) = run_sweep(_trades(), [_base()], start_equity=10_000, workers=1)
+
+    assert result.trades_taken == 2
+    assert result.rejections == {"duplicate_symbol_position": 1, "leverage_cap_exceeded": 1}
+    # +2R on day one (R=100), +1R on day two (R=102)
+    assert result.net_pnl == pytest.approx(302.0)
+    assert result.net_expectancy == pytest.approx(151.0)
+    assert result.max_drawdown == 0.0
+
+
+def test_sweep_ranks_configs_and_matches_in_process_results():
+    configs = config_grid(_base(), max_leverage=[3.0, 5.0], risk_percent=[0.005, 0.01])
+    assert len(configs) == 4
+
+    pooled = run_sweep(_trades(), configs, workers=2)
+    serial = run_sweep(_trades(), configs, workers=1)
+
+    assert pooled == serial
+    assert pooled[0].config.risk_percent == 0.01
+    assert pooled[0].config.max_leverage == 3.0
+    assert [r.net_expectancy for r in pooled] == sorted((r.net_expectancy for r in pooled), reverse=True)
+    assert len(format_table(pooled).splitlines()) == 5
+
+
+def test_config_grid_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        config_grid(_base(), risk=[0.01])